@@ -4,6 +4,7 @@ import warnings
 from .async_webcrawler import AsyncWebCrawler, CacheMode
 # MODIFIED: Add SeedingConfig and VirtualScrollConfig here
 from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, MatchMode
+from .async_crawler_strategy import AsyncHybridCrawlerStrategy
 
 from .content_scraping_strategy import (
     ContentScrapingStrategy,
@@ -47,6 +48,8 @@ from .link_preview import LinkPreview
 from .async_dispatcher import (
     MemoryAdaptiveDispatcher,
     SemaphoreDispatcher,
+    MultiProcessDispatcher,
+    RedisQueueDispatcher,
     RateLimiter,
     BaseDispatcher,
 )
@@ -153,6 +156,7 @@ __all__ = [
     "BrowserConfig",
     "CrawlerRunConfig",
     "HTTPCrawlerConfig",
+    "AsyncHybridCrawlerStrategy",
     "ExtractionStrategy",
     "LLMExtractionStrategy",
     "CosineStrategy",
@@ -173,6 +177,8 @@ __all__ = [
     "BaseDispatcher",
     "MemoryAdaptiveDispatcher",
     "SemaphoreDispatcher",
+    "MultiProcessDispatcher",
+    "RedisQueueDispatcher",
     "RateLimiter",
     "CrawlerMonitor",
     "LinkPreview",
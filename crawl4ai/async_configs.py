@@ -29,7 +29,7 @@ from .proxy_strategy import ProxyRotationStrategy
 
 from typing import Union, List, Callable
 import inspect
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from enum import Enum
 
 # Type alias for URL matching
@@ -413,6 +413,22 @@ class BrowserConfig:
                            Default: [].
         enable_stealth (bool): If True, applies playwright-stealth to bypass basic bot detection.
                               Cannot be used with use_undetected browser mode. Default: False.
+        page_pool_size (int): Number of idle pages kept per browser context and reused by later crawls with the
+                              same config (reset to about:blank between uses). 0 disables pooling. Default: 0.
+        page_pool_max_uses (int): Number of crawls a pooled page serves before it is closed. Default: 50.
+        max_contexts (int): Maximum number of per-config browser contexts kept open. When exceeded, the least
+                            recently used context with no live pages is closed. 0 means unbounded. Default: 32.
+        block_resources (list): Names of request blocking profiles applied to every context: "images", "fonts",
+                                "media", "stylesheets", "documents", "trackers", "third_party_scripts".
+                                text_mode on its own blocks only the file extensions of images, fonts,
+                                media and documents, as it always has. Default: [].
+        blocked_domains (list): Extra domains (subdomains included) whose requests are aborted. Default: [].
+        recycle_after_pages (int): Restart the browser after this many pages. 0 disables. Default: 0.
+        recycle_after_seconds (float): Restart the browser once it is this old. 0 disables. Default: 0.
+        recycle_memory_threshold_mb (float): Restart the browser when the RSS of the processes it runs in
+                                             exceeds this many MB. 0 disables. Default: 0.
+                                             Recycling waits for in-flight pages, is skipped while sessions
+                                             are open and does not apply to managed/CDP browsers.
     """
 
     def __init__(
@@ -454,6 +470,14 @@ class BrowserConfig:
         debugging_port: int = 9222,
         host: str = "localhost",
         enable_stealth: bool = False,
+        page_pool_size: int = 0,
+        page_pool_max_uses: int = 50,
+        max_contexts: int = 32,
+        block_resources: List[str] = None,
+        blocked_domains: List[str] = None,
+        recycle_after_pages: int = 0,
+        recycle_after_seconds: float = 0,
+        recycle_memory_threshold_mb: float = 0,
     ):
         
         self.browser_type = browser_type
@@ -509,6 +533,14 @@ class BrowserConfig:
         self.debugging_port = debugging_port
         self.host = host
         self.enable_stealth = enable_stealth
+        self.page_pool_size = page_pool_size
+        self.page_pool_max_uses = page_pool_max_uses
+        self.max_contexts = max_contexts
+        self.block_resources = block_resources if block_resources is not None else []
+        self.blocked_domains = blocked_domains if blocked_domains is not None else []
+        self.recycle_after_pages = recycle_after_pages
+        self.recycle_after_seconds = recycle_after_seconds
+        self.recycle_memory_threshold_mb = recycle_memory_threshold_mb
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -584,6 +616,14 @@ class BrowserConfig:
             debugging_port=kwargs.get("debugging_port", 9222),
             host=kwargs.get("host", "localhost"),
             enable_stealth=kwargs.get("enable_stealth", False),
+            page_pool_size=kwargs.get("page_pool_size", 0),
+            page_pool_max_uses=kwargs.get("page_pool_max_uses", 50),
+            max_contexts=kwargs.get("max_contexts", 32),
+            block_resources=kwargs.get("block_resources", []),
+            blocked_domains=kwargs.get("blocked_domains", []),
+            recycle_after_pages=kwargs.get("recycle_after_pages", 0),
+            recycle_after_seconds=kwargs.get("recycle_after_seconds", 0),
+            recycle_memory_threshold_mb=kwargs.get("recycle_memory_threshold_mb", 0),
         )
 
     def to_dict(self):
@@ -619,6 +659,14 @@ class BrowserConfig:
             "debugging_port": self.debugging_port,
             "host": self.host,
             "enable_stealth": self.enable_stealth,
+            "page_pool_size": self.page_pool_size,
+            "page_pool_max_uses": self.page_pool_max_uses,
+            "max_contexts": self.max_contexts,
+            "block_resources": self.block_resources,
+            "blocked_domains": self.blocked_domains,
+            "recycle_after_pages": self.recycle_after_pages,
+            "recycle_after_seconds": self.recycle_after_seconds,
+            "recycle_memory_threshold_mb": self.recycle_memory_threshold_mb,
         }
 
                 
@@ -878,6 +926,15 @@ class HTTPCrawlerConfig:
     json: Optional[Dict[str, Any]] = None
     follow_redirects: bool = True
     verify_ssl: bool = True
+    max_body_size: Optional[int] = 20 * 1024 * 1024
+    charset_detector: str = "chardet"
+    max_retries: int = 2
+    retry_backoff: float = 0.5
+    retry_backoff_max: float = 30.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    retry_non_idempotent: bool = False
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_cooldown: float = 30.0
 
     def __init__(
         self,
@@ -887,13 +944,49 @@ class HTTPCrawlerConfig:
         json: Optional[Dict[str, Any]] = None,
         follow_redirects: bool = True,
         verify_ssl: bool = True,
+        max_body_size: Optional[int] = 20 * 1024 * 1024,
+        charset_detector: str = "chardet",
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        retry_backoff_max: float = 30.0,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        retry_non_idempotent: bool = False,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_cooldown: float = 30.0,
     ):
+        """
+        Args:
+            max_body_size: Responses larger than this many bytes are rejected while
+                streaming. None disables the limit.
+            charset_detector: Detector used when neither the Content-Type header nor a
+                <meta charset> names the encoding: "chardet" or "charset_normalizer"
+                (falls back to chardet when not installed). Only a bounded prefix
+                of the body is inspected.
+            max_retries: Extra attempts after a timeout, connection error or one of
+                retry_statuses. Waits grow from retry_backoff, doubling with jitter,
+                up to retry_backoff_max; a Retry-After header on 429/503 is used as-is.
+            retry_non_idempotent: Also retry POST/PATCH after timeouts and 5xx. Without
+                it they are only retried when nothing was sent or the server answered
+                429/503.
+            circuit_breaker_threshold: Consecutive failures (timeouts, connection errors,
+                5xx) after which requests to the host fail fast with CircuitOpenError
+                for circuit_breaker_cooldown seconds. 0 disables the breaker.
+        """
         self.method = method
         self.headers = headers
         self.data = data
         self.json = json
         self.follow_redirects = follow_redirects
         self.verify_ssl = verify_ssl
+        self.max_body_size = max_body_size
+        self.charset_detector = charset_detector
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_cooldown = circuit_breaker_cooldown
 
     @staticmethod
     def from_kwargs(kwargs: dict) -> "HTTPCrawlerConfig":
@@ -904,6 +997,15 @@ class HTTPCrawlerConfig:
             json=kwargs.get("json"),
             follow_redirects=kwargs.get("follow_redirects", True),
             verify_ssl=kwargs.get("verify_ssl", True),
+            max_body_size=kwargs.get("max_body_size", 20 * 1024 * 1024),
+            charset_detector=kwargs.get("charset_detector", "chardet"),
+            max_retries=kwargs.get("max_retries", 2),
+            retry_backoff=kwargs.get("retry_backoff", 0.5),
+            retry_backoff_max=kwargs.get("retry_backoff_max", 30.0),
+            retry_statuses=kwargs.get("retry_statuses", (429, 500, 502, 503, 504)),
+            retry_non_idempotent=kwargs.get("retry_non_idempotent", False),
+            circuit_breaker_threshold=kwargs.get("circuit_breaker_threshold", 5),
+            circuit_breaker_cooldown=kwargs.get("circuit_breaker_cooldown", 30.0),
         )
 
     def to_dict(self):
@@ -914,6 +1016,15 @@ class HTTPCrawlerConfig:
             "json": self.json,
             "follow_redirects": self.follow_redirects,
             "verify_ssl": self.verify_ssl,
+            "max_body_size": self.max_body_size,
+            "charset_detector": self.charset_detector,
+            "max_retries": self.max_retries,
+            "retry_backoff": self.retry_backoff,
+            "retry_backoff_max": self.retry_backoff_max,
+            "retry_statuses": self.retry_statuses,
+            "retry_non_idempotent": self.retry_non_idempotent,
+            "circuit_breaker_threshold": self.circuit_breaker_threshold,
+            "circuit_breaker_cooldown": self.circuit_breaker_cooldown,
         }
 
     def clone(self, **kwargs):
@@ -975,6 +1086,16 @@ class CrawlerRunConfig():
                                                 the initial raw HTML to the selected element, while this will only affect 
                                                 the extraction and Markdown generation.
                                     Default: None
+        crop_to_target (bool): If True and `target_elements` or `css_selector` is set, the scraper crops the
+                               page to the matched elements before any cleanup, so removals, empty-element
+                               and attribute stripping only run over the crop. Head metadata is read
+                               before cropping. `css_selector` is only used here when the fetched HTML was
+                               not already reduced to it (the browser strategy does that itself, dropping
+                               the <head>).
+                               Default: False.
+        scope_links_to_target (bool): With `crop_to_target`, also collect links, media and tables only from
+                                      the crop, skipping all work on the rest of the page.
+                                      Default: False.
         excluded_tags (list of str or None): List of HTML tags to exclude from processing.
                                              Default: None.
         excluded_selector (str or None): CSS selector to exclude from processing.
@@ -1027,7 +1148,9 @@ class CrawlerRunConfig():
                           Default: "domcontentloaded".
         page_timeout (int): Timeout in ms for page operations like navigation.
                             Default: 60000 (60 seconds).
-        wait_for (str or None): A CSS selector or JS condition to wait for before extracting content.
+        wait_for (str or None): A CSS selector or JS condition to wait for before extracting content, or
+                                "quiescent" / "quiescent:<ms>" to continue as soon as the DOM and network have
+                                been idle for that long (wait_for_timeout is then a hard cap, not an error).
                                 Default: None.
         wait_for_timeout (int or None): Specific timeout in ms for the wait_for condition.
                                        If None, uses page_timeout instead.
@@ -1076,6 +1199,21 @@ class CrawlerRunConfig():
                                              Default: None.
         screenshot_height_threshold (int): Threshold for page height to decide screenshot strategy.
                                            Default: SCREENSHOT_HEIGHT_TRESHOLD (from config, e.g. 20000).
+        screenshot_format (str): Image format of the screenshot: "png", "jpeg" or "webp".
+                                 Default: "png".
+        screenshot_quality (int): Quality (1-100) for "jpeg" and "webp" screenshots.
+                                  Default: 85.
+        screenshot_max_height (int or None): Capture at most this many CSS pixels of page height.
+                                             Default: None (whole page).
+        screenshot_max_width (int or None): Downscale the screenshot (keeping aspect ratio) to at most this
+                                            width, e.g. for thumbnails. Default: None (full resolution).
+        screenshot_full_page (bool): If False, capture only the current viewport instead of the whole page.
+                                     Default: True.
+        screenshot_output (str): How result.screenshot is returned: "base64" (str), "bytes" (raw image
+                                 bytes) or "file" (path of the image written under screenshot_path).
+                                 Default: "base64".
+        screenshot_path (str or None): Directory for screenshot_output="file".
+                                       Default: None (~/.crawl4ai/screenshots).
         pdf (bool): Whether to generate a PDF of the page.
                     Default: False.
         image_description_min_word_threshold (int): Minimum words for image description extraction.
@@ -1118,6 +1256,29 @@ class CrawlerRunConfig():
         log_console (bool): If True, log console messages from the page.
                             Default: False.
 
+        # Network and Console Capturing Parameters
+        capture_network_requests (bool): If True, record network requests, responses and failures in
+                                         result.network_requests.
+                                         Default: False.
+        capture_console_messages (bool): If True, record browser console messages in result.console_messages.
+                                         Default: False.
+        network_capture_mode (str): "full" records individual events; "summary" records only per-domain
+                                    counts, bytes, status codes and timings.
+                                    Default: "full".
+        network_capture_resource_types (list of str or None): Only capture these resource types
+                                                             (e.g. ["document", "xhr", "fetch"]).
+                                                             Default: None (all).
+        network_capture_url_patterns (list of str or None): Only capture URLs matching one of these globs.
+                                                           Default: None (all).
+        network_capture_status_ranges (list of (int, int) or None): Only keep responses whose status falls in
+                                                                   one of these inclusive ranges, e.g. [(400, 599)].
+                                                                   Default: None (all).
+        network_capture_max_entries (int or None): Keep only the newest N events. None keeps everything.
+                                                   Default: None.
+        network_capture_body_max_bytes (int or None): Cut captured response and post bodies to this size.
+                                                      0 skips bodies, None keeps them whole.
+                                                      Default: None.
+
         # HTTP Crwler Strategy Parameters
         method (str): HTTP method to use for the request, when using AsyncHTTPCrwalerStrategy.
                         Default: "GET".
@@ -1153,6 +1314,21 @@ class CrawlerRunConfig():
         'no_cache_write' : 'Instead, use cache_mode=CacheMode.READ_ONLY',
     }
 
+    # Fields that change how a browser context is created (context options, init scripts,
+    # the user agent the context launches with). Everything else is per-page or post-processing.
+    _BROWSER_SIGNATURE_FIELDS = (
+        "proxy_config",
+        "locale",
+        "timezone_id",
+        "geolocation",
+        "user_agent",
+        "user_agent_mode",
+        "user_agent_generator_config",
+        "override_navigator",
+        "simulate_user",
+        "magic",
+    )
+
     def __init__(
         self,
         # Content Processing Parameters
@@ -1163,6 +1339,8 @@ class CrawlerRunConfig():
         only_text: bool = False,
         css_selector: str = None,
         target_elements: List[str] = None,
+        crop_to_target: bool = False,
+        scope_links_to_target: bool = False,
         excluded_tags: list = None,
         excluded_selector: str = None,
         keep_data_attributes: bool = False,
@@ -1215,6 +1393,13 @@ class CrawlerRunConfig():
         screenshot: bool = False,
         screenshot_wait_for: float = None,
         screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
+        screenshot_format: str = "png",
+        screenshot_quality: int = 85,
+        screenshot_max_height: int = None,
+        screenshot_max_width: int = None,
+        screenshot_full_page: bool = True,
+        screenshot_output: str = "base64",
+        screenshot_path: str = None,
         pdf: bool = False,
         capture_mhtml: bool = False,
         image_description_min_word_threshold: int = IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
@@ -1237,6 +1422,12 @@ class CrawlerRunConfig():
         # Network and Console Capturing Parameters
         capture_network_requests: bool = False,
         capture_console_messages: bool = False,
+        network_capture_mode: str = "full",
+        network_capture_resource_types: Optional[List[str]] = None,
+        network_capture_url_patterns: Optional[List[str]] = None,
+        network_capture_status_ranges: Optional[List[Tuple[int, int]]] = None,
+        network_capture_max_entries: Optional[int] = None,
+        network_capture_body_max_bytes: Optional[int] = None,
         # Connection Parameters
         method: str = "GET",
         stream: bool = False,
@@ -1268,6 +1459,8 @@ class CrawlerRunConfig():
         self.only_text = only_text
         self.css_selector = css_selector
         self.target_elements = target_elements or []
+        self.crop_to_target = crop_to_target
+        self.scope_links_to_target = scope_links_to_target
         self.excluded_tags = excluded_tags or []
         self.excluded_selector = excluded_selector or ""
         self.keep_data_attributes = keep_data_attributes
@@ -1331,6 +1524,13 @@ class CrawlerRunConfig():
         self.screenshot = screenshot
         self.screenshot_wait_for = screenshot_wait_for
         self.screenshot_height_threshold = screenshot_height_threshold
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_max_height = screenshot_max_height
+        self.screenshot_max_width = screenshot_max_width
+        self.screenshot_full_page = screenshot_full_page
+        self.screenshot_output = screenshot_output
+        self.screenshot_path = screenshot_path
         self.pdf = pdf
         self.capture_mhtml = capture_mhtml
         self.image_description_min_word_threshold = image_description_min_word_threshold
@@ -1363,6 +1563,12 @@ class CrawlerRunConfig():
         # Network and Console Capturing Parameters
         self.capture_network_requests = capture_network_requests
         self.capture_console_messages = capture_console_messages
+        self.network_capture_mode = network_capture_mode
+        self.network_capture_resource_types = network_capture_resource_types
+        self.network_capture_url_patterns = network_capture_url_patterns
+        self.network_capture_status_ranges = network_capture_status_ranges
+        self.network_capture_max_entries = network_capture_max_entries
+        self.network_capture_body_max_bytes = network_capture_body_max_bytes
 
         # Connection Parameters
         self.stream = stream
@@ -1542,6 +1748,40 @@ class CrawlerRunConfig():
         
         super().__setattr__(name, value)
 
+    def browser_signature(self) -> str:
+        """
+        Stable fingerprint of the browser-context settings of this config.
+
+        Two configs with the same signature can share a browser context. Only the
+        fields in _BROWSER_SIGNATURE_FIELDS take part, serialized by value, so the
+        result is the same across config instances and processes. The hash is
+        memoized together with the values it was computed from, and recomputed
+        when any of them changed, including in place (e.g. geolocation.latitude).
+        """
+        import copy
+
+        def _value(value):
+            if hasattr(value, "to_dict"):
+                return value.to_dict()
+            if isinstance(value, Enum):
+                return value.value
+            if isinstance(value, (dict, list)):
+                return copy.deepcopy(value)
+            return value
+
+        payload = {name: _value(getattr(self, name, None)) for name in self._BROWSER_SIGNATURE_FIELDS}
+        memo = self.__dict__.get("_browser_signature")
+        if memo is not None and memo[0] == payload:
+            return memo[1]
+
+        import hashlib
+        import json
+
+        signature_json = json.dumps(payload, sort_keys=True, default=repr)
+        signature = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
+        self.__dict__["_browser_signature"] = (payload, signature)
+        return signature
+
     @staticmethod
     def from_kwargs(kwargs: dict) -> "CrawlerRunConfig":
         return CrawlerRunConfig(
@@ -1553,6 +1793,8 @@ class CrawlerRunConfig():
             only_text=kwargs.get("only_text", False),
             css_selector=kwargs.get("css_selector"),
             target_elements=kwargs.get("target_elements", []),
+            crop_to_target=kwargs.get("crop_to_target", False),
+            scope_links_to_target=kwargs.get("scope_links_to_target", False),
             excluded_tags=kwargs.get("excluded_tags", []),
             excluded_selector=kwargs.get("excluded_selector", ""),
             keep_data_attributes=kwargs.get("keep_data_attributes", False),
@@ -1606,6 +1848,13 @@ class CrawlerRunConfig():
             screenshot_height_threshold=kwargs.get(
                 "screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD
             ),
+            screenshot_format=kwargs.get("screenshot_format", "png"),
+            screenshot_quality=kwargs.get("screenshot_quality", 85),
+            screenshot_max_height=kwargs.get("screenshot_max_height"),
+            screenshot_max_width=kwargs.get("screenshot_max_width"),
+            screenshot_full_page=kwargs.get("screenshot_full_page", True),
+            screenshot_output=kwargs.get("screenshot_output", "base64"),
+            screenshot_path=kwargs.get("screenshot_path"),
             pdf=kwargs.get("pdf", False),
             capture_mhtml=kwargs.get("capture_mhtml", False),
             image_description_min_word_threshold=kwargs.get(
@@ -1635,6 +1884,12 @@ class CrawlerRunConfig():
             # Network and Console Capturing Parameters
             capture_network_requests=kwargs.get("capture_network_requests", False),
             capture_console_messages=kwargs.get("capture_console_messages", False),
+            network_capture_mode=kwargs.get("network_capture_mode", "full"),
+            network_capture_resource_types=kwargs.get("network_capture_resource_types"),
+            network_capture_url_patterns=kwargs.get("network_capture_url_patterns"),
+            network_capture_status_ranges=kwargs.get("network_capture_status_ranges"),
+            network_capture_max_entries=kwargs.get("network_capture_max_entries"),
+            network_capture_body_max_bytes=kwargs.get("network_capture_body_max_bytes"),
             # Connection Parameters
             method=kwargs.get("method", "GET"),
             stream=kwargs.get("stream", False),
@@ -1676,6 +1931,8 @@ class CrawlerRunConfig():
             "only_text": self.only_text,
             "css_selector": self.css_selector,
             "target_elements": self.target_elements,
+            "crop_to_target": self.crop_to_target,
+            "scope_links_to_target": self.scope_links_to_target,
             "excluded_tags": self.excluded_tags,
             "excluded_selector": self.excluded_selector,
             "keep_data_attributes": self.keep_data_attributes,
@@ -1721,6 +1978,13 @@ class CrawlerRunConfig():
             "screenshot": self.screenshot,
             "screenshot_wait_for": self.screenshot_wait_for,
             "screenshot_height_threshold": self.screenshot_height_threshold,
+            "screenshot_format": self.screenshot_format,
+            "screenshot_quality": self.screenshot_quality,
+            "screenshot_max_height": self.screenshot_max_height,
+            "screenshot_max_width": self.screenshot_max_width,
+            "screenshot_full_page": self.screenshot_full_page,
+            "screenshot_output": self.screenshot_output,
+            "screenshot_path": self.screenshot_path,
             "pdf": self.pdf,
             "capture_mhtml": self.capture_mhtml,
             "image_description_min_word_threshold": self.image_description_min_word_threshold,
@@ -1740,6 +2004,12 @@ class CrawlerRunConfig():
             "log_console": self.log_console,
             "capture_network_requests": self.capture_network_requests,
             "capture_console_messages": self.capture_console_messages,
+            "network_capture_mode": self.network_capture_mode,
+            "network_capture_resource_types": self.network_capture_resource_types,
+            "network_capture_url_patterns": self.network_capture_url_patterns,
+            "network_capture_status_ranges": self.network_capture_status_ranges,
+            "network_capture_max_entries": self.network_capture_max_entries,
+            "network_capture_body_max_bytes": self.network_capture_body_max_bytes,
             "method": self.method,
             "stream": self.stream,
             "check_robots_txt": self.check_robots_txt,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import base64
 import time
 from abc import ABC, abstractmethod
 from typing import Callable, Dict, Any, List, Union
-from typing import Optional, AsyncGenerator, Final
+from typing import Optional, AsyncGenerator, AsyncIterator, Final
 import os
 from playwright.async_api import Page, Error
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
@@ -15,17 +16,27 @@ import hashlib
 import uuid
 from .js_snippet import load_js_script
 from .models import AsyncCrawlResponse
-from .config import SCREENSHOT_HEIGHT_TRESHOLD
+from .config import SCREENSHOT_HEIGHT_TRESHOLD, QUIESCENT_IDLE_MS, QUIESCENT_STALE_REQUEST_MS, SELECTED_HTML_CLASS
 from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig
 from .async_logger import AsyncLogger
 from .ssl_certificate import SSLCertificate
+from .network_capture import NetworkCapture
 from .user_agent_generator import ValidUAGenerator
 from .browser_manager import BrowserManager
 from .browser_adapter import BrowserAdapter, PlaywrightAdapter, UndetectedAdapter
 
 import aiofiles
 import aiohttp
+import httpx
 import chardet
+import codecs
+import email.utils
+import random
+try:
+    import charset_normalizer
+    HAS_CHARSET_NORMALIZER = True
+except ImportError:
+    HAS_CHARSET_NORMALIZER = False
 from aiohttp.client import ClientTimeout
 from urllib.parse import urlparse
 from types import MappingProxyType
@@ -42,6 +53,40 @@ class AsyncCrawlerStrategy(ABC):
     async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
         pass  # 4 + 3
 
+class NetworkActivity:
+    """
+    Tracks a page's in-flight requests for quiescence waits.
+
+    Attach it before navigating: requests already running when it is attached
+    are never seen, so their completion could not be waited for.
+    """
+
+    IGNORED_TYPES: Final = frozenset({"websocket", "eventsource"})
+
+    def __init__(self):
+        self.in_flight: Dict[Any, float] = {}
+        self.last_activity = time.monotonic()
+
+    def on_request(self, request):
+        self.last_activity = time.monotonic()
+        if request.resource_type not in self.IGNORED_TYPES:
+            self.in_flight[request] = self.last_activity
+
+    def on_request_done(self, request):
+        self.last_activity = time.monotonic()
+        self.in_flight.pop(request, None)
+
+    def attach(self, page: Page):
+        page.on("request", self.on_request)
+        page.on("requestfinished", self.on_request_done)
+        page.on("requestfailed", self.on_request_done)
+
+    def detach(self, page: Page):
+        page.remove_listener("request", self.on_request)
+        page.remove_listener("requestfinished", self.on_request_done)
+        page.remove_listener("requestfailed", self.on_request_done)
+
+
 class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Crawler strategy using Playwright.
@@ -228,27 +273,46 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         """
         self.headers = headers
 
-    async def smart_wait(self, page: Page, wait_for: str, timeout: float = 30000):
+    async def smart_wait(
+        self, page: Page, wait_for: str, timeout: float = 30000, network: Optional[NetworkActivity] = None
+    ):
         """
         Wait for a condition in a smart way. This functions works as below:
 
         1. If wait_for starts with 'js:', it assumes it's a JavaScript function and waits for it to return true.
         2. If wait_for starts with 'css:', it assumes it's a CSS selector and waits for it to be present.
-        3. Otherwise, it tries to evaluate wait_for as a JavaScript function and waits for it to return true.
-        4. If it's not a JavaScript function, it assumes it's a CSS selector and waits for it to be present.
+        3. If wait_for is 'quiescent' or 'quiescent:<ms>', it waits until the DOM and network have been idle
+           for that many ms (default QUIESCENT_IDLE_MS). The timeout is a hard cap, not an error.
+        4. Otherwise, it tries to evaluate wait_for as a JavaScript function and waits for it to return true.
+        5. If it's not a JavaScript function, it assumes it's a CSS selector and waits for it to be present.
 
         This is a more advanced version of the wait_for parameter in CrawlerStrategy.crawl().
         Args:
             page: Playwright page object
             wait_for (str): The condition to wait for. Can be a CSS selector, a JavaScript function, or explicitly prefixed with 'js:' or 'css:'.
             timeout (float): Maximum time to wait in milliseconds
+            network (NetworkActivity): Tracker attached before navigation, used by 'quiescent'
 
         Returns:
             None
         """
         wait_for = wait_for.strip()
 
-        if wait_for.startswith("js:"):
+        if wait_for == "quiescent" or wait_for.startswith("quiescent:"):
+            _, _, idle_ms = wait_for.partition(":")
+            try:
+                idle_ms = int(idle_ms) if idle_ms.strip() else QUIESCENT_IDLE_MS
+            except ValueError:
+                raise ValueError(f"Invalid quiescence idle time in wait_for: '{wait_for}'")
+            quiet = await self.wait_for_quiescence(page, idle_ms=idle_ms, timeout=timeout, network=network)
+            if not quiet and self.logger:
+                self.logger.warning(
+                    message="Page not quiescent after {timeout}ms, continuing",
+                    tag="WAIT",
+                    params={"timeout": timeout},
+                )
+            return quiet
+        elif wait_for.startswith("js:"):
             # Explicitly specified JavaScript
             js_code = wait_for[3:].strip()
             return await self.csp_compliant_wait(page, js_code, timeout)
@@ -292,6 +356,57 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                                 "or explicitly prefixed with 'js:' or 'css:'."
                             )
 
+    async def wait_for_quiescence(
+        self,
+        page: Page,
+        idle_ms: int = QUIESCENT_IDLE_MS,
+        timeout: float = 30000,
+        network: Optional[NetworkActivity] = None,
+    ) -> bool:
+        """
+        Wait until neither the DOM nor the network has changed for `idle_ms`.
+
+        A MutationObserver in the page tracks the last structural/text change and
+        request events track in-flight requests; requests pending longer than
+        QUIESCENT_STALE_REQUEST_MS (beacons, long-polls) stop counting.
+
+        Args:
+            page (Page): The Playwright page object
+            idle_ms (int): Required quiet period in milliseconds
+            timeout (float): Hard cap in milliseconds
+            network (NetworkActivity): Tracker attached before navigation. Without one,
+                only requests started from now on are seen.
+
+        Returns:
+            bool: True if the page went quiet, False if the cap was hit first
+        """
+        owns_network = network is None
+        if owns_network:
+            network = NetworkActivity()
+            network.attach(page)
+        observer_js = load_js_script("quiescence_observer")
+        idle = idle_ms / 1000
+        stale = QUIESCENT_STALE_REQUEST_MS / 1000
+        poll = min(0.1, idle / 4)
+        deadline = time.monotonic() + timeout / 1000
+        try:
+            while True:
+                now = time.monotonic()
+                try:
+                    dom_quiet = await self.adapter.evaluate(page, observer_js) / 1000
+                except Error:
+                    # Navigating mid-wait; the observer is reinstalled on the next poll
+                    dom_quiet = 0
+                network_busy = any(now - started < stale for started in network.in_flight.values())
+                if not network_busy and dom_quiet >= idle and now - network.last_activity >= idle:
+                    return True
+                if now >= deadline:
+                    return False
+                await asyncio.sleep(min(poll, max(deadline - now, 0)))
+        finally:
+            if owns_network:
+                network.detach(page)
+
     async def csp_compliant_wait(
         self, page: Page, user_wait_function: str, timeout: float = 30000
     ):
@@ -467,6 +582,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             if config.capture_console_messages:
                 page, context = await self.browser_manager.get_page(crawlerRunConfig=config)
                 captured_console = await self._capture_console_messages(page, url)
+                if not config.session_id:
+                    await self.browser_manager.release_page(page)
 
             return AsyncCrawlResponse(
                 html=html,
@@ -525,7 +642,6 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         self._downloaded_files = []
         
         # Initialize capture lists
-        captured_requests = []
         captured_console = []
 
         # Handle user agent with magic mode
@@ -537,117 +653,55 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 **(config.user_agent_generator_config or {})
             )
 
-        # Get page for session
-        page, context = await self.browser_manager.get_page(crawlerRunConfig=config)
+        page = None
+        network_capture = None
+        network_activity = None
+        handle_console = None
+        handle_error = None
+        download_listener = False
 
-        # await page.goto(URL)
+        def handle_download(download):
+            asyncio.create_task(self._handle_download(download))
 
-        # Add default cookie
-        # await context.add_cookies(
-        #     [{"name": "cookiesEnabled", "value": "true", "url": url}]
-        # )
+        try:
+            # Get page for session
+            page, context = await self.browser_manager.get_page(crawlerRunConfig=config)
 
-        # Handle navigator overrides
-        if config.override_navigator or config.simulate_user or config.magic:
-            await context.add_init_script(load_js_script("navigator_overrider"))
+            # await page.goto(URL)
 
-        # Call hook after page creation
-        await self.execute_hook("on_page_context_created", page, context=context, config=config)
+            # Add default cookie
+            # await context.add_cookies(
+            #     [{"name": "cookiesEnabled", "value": "true", "url": url}]
+            # )
 
-        # Network Request Capturing
-        if config.capture_network_requests:
-            async def handle_request_capture(request):
-                try:
-                    post_data_str = None
-                    try:
-                        # Be cautious with large post data
-                        post_data = request.post_data_buffer
-                        if post_data:
-                             # Attempt to decode, fallback to base64 or size indication
-                             try:
-                                 post_data_str = post_data.decode('utf-8', errors='replace')
-                             except UnicodeDecodeError:
-                                 post_data_str = f"[Binary data: {len(post_data)} bytes]"
-                    except Exception:
-                        post_data_str = "[Error retrieving post data]"
-
-                    captured_requests.append({
-                        "event_type": "request",
-                        "url": request.url,
-                        "method": request.method,
-                        "headers": dict(request.headers), # Convert Header dict
-                        "post_data": post_data_str,
-                        "resource_type": request.resource_type,
-                        "is_navigation_request": request.is_navigation_request(),
-                        "timestamp": time.time()
-                    })
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Error capturing request details for {request.url}: {e}", tag="CAPTURE")
-                    captured_requests.append({"event_type": "request_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
+            # Handle navigator overrides
+            if config.override_navigator or config.simulate_user or config.magic:
+                await context.add_init_script(load_js_script("navigator_overrider"))
 
-            async def handle_response_capture(response):
-                try:
-                    try:
-                        # body = await response.body()
-                        # json_body = await response.json()
-                        text_body = await response.text()
-                    except Exception as e:
-                        body = None
-                        # json_body = None
-                        # text_body = None
-                    captured_requests.append({
-                        "event_type": "response",
-                        "url": response.url,
-                        "status": response.status,
-                        "status_text": response.status_text,
-                        "headers": dict(response.headers), # Convert Header dict
-                        "from_service_worker": response.from_service_worker,
-                        "request_timing": response.request.timing, # Detailed timing info
-                        "timestamp": time.time(),
-                        "body" : {
-                            # "raw": body,
-                            # "json": json_body,
-                            "text": text_body
-                        }
-                    })
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Error capturing response details for {response.url}: {e}", tag="CAPTURE")
-                    captured_requests.append({"event_type": "response_capture_error", "url": response.url, "error": str(e), "timestamp": time.time()})
-
-            async def handle_request_failed_capture(request):
-                 try:
-                    captured_requests.append({
-                        "event_type": "request_failed",
-                        "url": request.url,
-                        "method": request.method,
-                        "resource_type": request.resource_type,
-                        "failure_text": str(request.failure) if request.failure else "Unknown failure",
-                        "timestamp": time.time()
-                    })
-                 except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Error capturing request failed details for {request.url}: {e}", tag="CAPTURE")
-                    captured_requests.append({"event_type": "request_failed_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
+            # Call hook after page creation
+            await self.execute_hook("on_page_context_created", page, context=context, config=config)
 
-            page.on("request", handle_request_capture)
-            page.on("response", handle_response_capture)
-            page.on("requestfailed", handle_request_failed_capture)
+            # Network Request Capturing
+            if config.capture_network_requests:
+                network_capture = NetworkCapture.from_config(config, logger=self.logger)
+                network_capture.attach(page)
 
-        # Console Message Capturing
-        handle_console = None
-        handle_error = None
-        if config.capture_console_messages:
-            # Set up console capture using adapter
-            handle_console = await self.adapter.setup_console_capture(page, captured_console)
-            handle_error = await self.adapter.setup_error_capture(page, captured_console)
+            # Quiescence waits must see requests the navigation itself starts
+            wait_for = (config.wait_for or "").strip()
+            if wait_for == "quiescent" or wait_for.startswith("quiescent:"):
+                network_activity = NetworkActivity()
+                network_activity.attach(page)
 
-        # Set up console logging if requested
-        # Note: For undetected browsers, console logging won't work directly
-        # but captured messages can still be logged after retrieval
+            # Console Message Capturing
+            if config.capture_console_messages:
+                # Set up console capture using adapter
+                handle_console = await self.adapter.setup_console_capture(page, captured_console)
+                handle_error = await self.adapter.setup_error_capture(page, captured_console)
+
+            # Set up console logging if requested
+            # Note: For undetected browsers, console logging won't work directly
+            # but captured messages can still be logged after retrieval
 
-        try:
             # Get SSL certificate information if requested and URL is HTTPS
             ssl_cert = None
             if config.fetch_ssl_certificate:
@@ -655,12 +709,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Set up download handling
             if self.browser_config.accept_downloads:
-                page.on(
-                    "download",
-                    lambda download: asyncio.create_task(
-                        self._handle_download(download)
-                    ),
-                )
+                page.on("download", handle_download)
+                download_listener = True
 
             # Handle page navigation and content loading
             if not config.js_only:
@@ -918,7 +968,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     # Use wait_for_timeout if specified, otherwise fall back to page_timeout
                     timeout = config.wait_for_timeout if config.wait_for_timeout is not None else config.page_timeout
                     await self.smart_wait(
-                        page, config.wait_for, timeout=timeout
+                        page, config.wait_for, timeout=timeout, network=network_activity
                     )
                 except Exception as e:
                     raise RuntimeError(f"Wait condition failed: {str(e)}")
@@ -970,7 +1020,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                             print(f"Warning: Could not get content for selector '{selector}': {str(e)}")
                     
                     # Wrap in a div to create a valid HTML structure
-                    html = f"<div class='crawl4ai-result'>\n" + "\n".join(html_parts) + "\n</div>"                    
+                    html = f"<div class='{SELECTED_HTML_CLASS}'>\n" + "\n".join(html_parts) + "\n</div>"                    
                 except Error as e:
                     raise RuntimeError(f"Failed to extract HTML content: {str(e)}")
             else:
@@ -984,22 +1034,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Handle PDF, MHTML and screenshot generation
             start_export_time = time.perf_counter()
-            pdf_data = None
-            screenshot_data = None
-            mhtml_data = None
-
-            if config.pdf:
-                pdf_data = await self.export_pdf(page)
-
-            if config.capture_mhtml:
-                mhtml_data = await self.capture_mhtml(page)
-
-            if config.screenshot:
-                if config.screenshot_wait_for:
-                    await asyncio.sleep(config.screenshot_wait_for)
-                screenshot_data = await self.take_screenshot(
-                    page, screenshot_height_threshold=config.screenshot_height_threshold
-                )
+            pdf_data, mhtml_data, screenshot_data = await self._capture_artifacts(page, config)
 
             if screenshot_data or pdf_data or mhtml_data:
                 self.logger.info(
@@ -1039,7 +1074,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 ),
                 redirected_url=redirected_url,
                 # Include captured data if enabled
-                network_requests=captured_requests if config.capture_network_requests else None,
+                network_requests=network_capture.results() if network_capture else None,
                 console_messages=captured_console if config.capture_console_messages else None,
             )
 
@@ -1047,30 +1082,39 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             raise e
 
         finally:
-            # If no session_id is given we should close the page
-            all_contexts = page.context.browser.contexts
-            total_pages = sum(len(context.pages) for context in all_contexts)                
-            if config.session_id:
-                pass
-            elif total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless):
-                pass
-            else:
-                # Detach listeners before closing to prevent potential errors during close
-                if config.capture_network_requests:
-                    page.remove_listener("request", handle_request_capture)
-                    page.remove_listener("response", handle_response_capture)
-                    page.remove_listener("requestfailed", handle_request_failed_capture)
-                if config.capture_console_messages:
-                    # Retrieve any final console messages for undetected browsers
-                    if hasattr(self.adapter, 'retrieve_console_messages'):
-                        final_messages = await self.adapter.retrieve_console_messages(page)
-                        captured_console.extend(final_messages)
+            # page is None only if get_page itself failed, in which case no lease was taken
+            if page is not None:
+                if network_activity:
+                    network_activity.detach(page)
+                # If no session_id is given we should close the page
+                all_contexts = page.context.browser.contexts
+                total_pages = sum(len(context.pages) for context in all_contexts)                
+                if config.session_id:
+                    pass
+                elif (
+                    total_pages <= 1
+                    and (self.browser_config.use_managed_browser or self.browser_config.headless)
+                    and not self.browser_manager.is_pooled_page(page)
+                ):
+                    # Keep the last page open, but stop counting it as in-flight
+                    await self.browser_manager.release_page(page, keep_open=True)
+                else:
+                    # Detach listeners before closing to prevent potential errors during close
+                    if network_capture:
+                        network_capture.detach(page)
+                    if config.capture_console_messages:
+                        # Retrieve any final console messages for undetected browsers
+                        if hasattr(self.adapter, 'retrieve_console_messages'):
+                            final_messages = await self.adapter.retrieve_console_messages(page)
+                            captured_console.extend(final_messages)
                     
-                    # Clean up console capture
-                    await self.adapter.cleanup_console_capture(page, handle_console, handle_error)
+                        # Clean up console capture
+                        await self.adapter.cleanup_console_capture(page, handle_console, handle_error)
+                    if download_listener:
+                        page.remove_listener("download", handle_download)
                 
-                # Close the page
-                await page.close()
+                    # Return the page to the pool, or close it
+                    await self.browser_manager.release_page(page)
 
     # async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
     async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1, max_scroll_steps: Optional[int] = None):
@@ -1078,16 +1122,18 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         Helper method to handle full page scanning.
 
         How it works:
-        1. Get the viewport height.
-        2. Scroll to the bottom of the page.
-        3. Get the total height of the page.
-        4. Scroll back to the top of the page.
-        5. Scroll to the bottom of the page again.
-        6. Continue scrolling until the bottom of the page is reached.
+        1. Scroll down one step at a time. Each step is a single evaluate that scrolls,
+           waits until the DOM has been quiet for a moment (at most scroll_delay) and
+           reports the new page height.
+        2. Every step is one viewport, so lazy content anywhere on the page comes into
+           view. While nothing changes the quiet wait halves (down to one frame) and it
+           resets as soon as new content shows up.
+        3. At the bottom, wait once more for late content; stop if the page did not grow.
+        4. Scroll back to the top, then to the bottom.
 
         Args:
             page (Page): The Playwright page object
-            scroll_delay (float): The delay between page scrolls
+            scroll_delay (float): Maximum wait after each scroll step
             max_scroll_steps (Optional[int]): Maximum number of scroll steps to perform. If None, scrolls until end.
 
         """
@@ -1102,19 +1148,23 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             viewport_height = viewport_size.get(
                 "height", self.browser_config.viewport_height
             )
-            current_position = viewport_height
-
-            # await page.evaluate(f"window.scrollTo(0, {current_position})")
-            await self.safe_scroll(page, 0, current_position, delay=scroll_delay)
-            # await self.csp_scroll_to(page, 0, current_position)
-            # await asyncio.sleep(scroll_delay)
+            scroll_step_js = load_js_script("scroll_step")
+            max_wait_ms = scroll_delay * 1000
+            quiet_ms = min(100, max_wait_ms / 2)
+            min_quiet_ms = min(16, quiet_ms)
+
+            async def scroll_step(y, quiet=quiet_ms, max_wait=max_wait_ms):
+                return await self.adapter.evaluate(
+                    page, scroll_step_js, {"y": y, "quietMs": quiet, "maxWaitMs": max_wait}
+                )
 
-            # total_height = await page.evaluate("document.documentElement.scrollHeight")
-            dimensions = await self.get_page_dimensions(page)
-            total_height = dimensions["height"]
+            current_position = viewport_height
+            result = await scroll_step(current_position)
+            total_height = result["height"]
 
+            quiet = quiet_ms
             scroll_step_count = 0
-            while current_position < total_height:
+            while True:
                 #### 
                 # NEW FEATURE: Check if we've reached the maximum allowed scroll steps
                 # This prevents infinite scrolling on very long pages or infinite scroll scenarios
@@ -1122,21 +1172,28 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 ####
                 if max_scroll_steps is not None and scroll_step_count >= max_scroll_steps:
                     break
+                if current_position >= total_height - viewport_height:
+                    # At the bottom: give lazy loaders one longer chance before stopping
+                    result = await scroll_step(total_height, max_wait=max_wait_ms * 2)
+                    scroll_step_count += 1
+                    if not result["grew"]:
+                        break
+                    total_height = result["height"]
+                    quiet = quiet_ms
+                    continue
+
                 current_position = min(current_position + viewport_height, total_height)
-                await self.safe_scroll(page, 0, current_position, delay=scroll_delay)
+                result = await scroll_step(current_position, quiet)
 
                 # Increment the step counter for max_scroll_steps tracking
                 scroll_step_count += 1
-                
-                # await page.evaluate(f"window.scrollTo(0, {current_position})")
-                # await asyncio.sleep(scroll_delay)
-
-                # new_height = await page.evaluate("document.documentElement.scrollHeight")
-                dimensions = await self.get_page_dimensions(page)
-                new_height = dimensions["height"]
 
-                if new_height > total_height:
-                    total_height = new_height
+                if result["grew"] or result["mutations"]:
+                    # Content is loading as we go, give it the full wait again
+                    quiet = quiet_ms
+                else:
+                    quiet = max(quiet / 2, min_quiet_ms)
+                total_height = max(total_height, result["height"])
 
             # await page.evaluate("window.scrollTo(0, 0)")
             await self.safe_scroll(page, 0, 0)
@@ -1157,14 +1214,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         content at different scroll positions and merging unique elements.
         
         Following the design:
-        1. Get container HTML
-        2. Scroll by container height
-        3. Wait and check if container HTML changed
-        4. Three cases:
-           - No change: continue scrolling
-           - New items added (appended): continue (items already in page)
-           - Items replaced: capture HTML chunk and add to list
-        5. After N scrolls, merge chunks if any were captured
+        1. Record the container's children, keyed by a hash of their normalized text
+        2. Scroll by the configured amount
+        3. Wait until the container stops changing (at most wait_after_scroll)
+        4. Record any children not seen before. If the container now holds fewer
+           children than were seen, items are being replaced (virtualized list)
+        5. Stop after scroll_count steps, or at the end once nothing new appears;
+           if items were replaced, rebuild the container from the unique children
         
         Args:
             page: The Playwright page object
@@ -1184,19 +1240,62 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"selector": config.container_selector}
             )
             
-            # JavaScript function to handle virtual scroll capture
+            # JavaScript function to handle virtual scroll capture.
+            # Children are collected as we scroll, keyed by a hash of their normalized
+            # text, so each step only hashes the children currently mounted instead of
+            # comparing (and re-parsing) whole innerHTML snapshots.
             virtual_scroll_js = """
             async (config) => {
                 const container = document.querySelector(config.container_selector);
                 if (!container) {
                     throw new Error(`Container not found: ${config.container_selector}`);
                 }
-                
-                // List to store HTML chunks when content is replaced
-                const htmlChunks = [];
-                let previousHTML = container.innerHTML;
-                let scrollCount = 0;
-                
+
+                // FNV-1a over the normalized text; collisions only merge duplicates
+                const keyOf = (element) => {
+                    const text = (element.textContent || '').toLowerCase().replace(/[\\s\\W]/g, '');
+                    let hash = 0x811c9dc5;
+                    for (let i = 0; i < text.length; i++) {
+                        hash ^= text.charCodeAt(i);
+                        hash = Math.imul(hash, 0x01000193);
+                    }
+                    return `${text.length}:${hash >>> 0}`;
+                };
+
+                // Insertion-ordered map of unique children seen so far
+                const seen = new Map();
+                const collect = () => {
+                    let added = 0;
+                    for (const element of container.children) {
+                        const key = keyOf(element);
+                        if (!seen.has(key)) {
+                            seen.set(key, element.outerHTML);
+                            added++;
+                        }
+                    }
+                    return added;
+                };
+
+                // Wait until the container stops changing, at most wait_after_scroll
+                const maxWaitMs = config.wait_after_scroll * 1000;
+                const quietMs = Math.min(100, maxWaitMs / 2);
+                const settle = () => new Promise(resolve => {
+                    let last = performance.now();
+                    const start = last;
+                    const observer = new MutationObserver(() => { last = performance.now(); });
+                    observer.observe(container, { childList: true, subtree: true, characterData: true });
+                    const tick = () => {
+                        const now = performance.now();
+                        if ((now - start >= quietMs && now - last >= quietMs) || now - start >= maxWaitMs) {
+                            observer.disconnect();
+                            resolve();
+                        } else {
+                            setTimeout(tick, 16);
+                        }
+                    };
+                    tick();
+                });
+
                 // Determine scroll amount
                 let scrollAmount;
                 if (typeof config.scroll_by === 'number') {
@@ -1206,93 +1305,41 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 } else { // container_height
                     scrollAmount = container.offsetHeight;
                 }
-                
-                // Perform scrolling
+
+                collect();
+                let replaced = false;
+                let chunksCount = 0;
+                let scrollCount = 0;
                 while (scrollCount < config.scroll_count) {
-                    // Scroll the container
                     container.scrollTop += scrollAmount;
-                    
-                    // Wait for content to potentially load
-                    await new Promise(resolve => setTimeout(resolve, config.wait_after_scroll * 1000));
-                    
-                    // Get current HTML
-                    const currentHTML = container.innerHTML;
-                    
-                    // Determine what changed
-                    if (currentHTML === previousHTML) {
-                        // Case 0: No change - continue scrolling
-                        console.log(`Scroll ${scrollCount + 1}: No change in content`);
-                    } else if (currentHTML.startsWith(previousHTML)) {
-                        // Case 1: New items appended - content already in page
-                        console.log(`Scroll ${scrollCount + 1}: New items appended`);
-                    } else {
-                        // Case 2: Items replaced - capture the previous HTML
-                        console.log(`Scroll ${scrollCount + 1}: Content replaced, capturing chunk`);
-                        htmlChunks.push(previousHTML);
-                    }
-                    
-                    // Update previous HTML for next iteration
-                    previousHTML = currentHTML;
+                    await settle();
                     scrollCount++;
-                    
-                    // Check if we've reached the end
-                    if (container.scrollTop + container.clientHeight >= container.scrollHeight - 10) {
+
+                    const added = collect();
+                    // Items were unmounted if we've seen more than the container holds
+                    if (added > 0 && seen.size > container.children.length) {
+                        replaced = true;
+                        chunksCount++;
+                    }
+
+                    const atEnd = container.scrollTop + container.clientHeight >= container.scrollHeight - 10;
+                    if (atEnd && added === 0) {
                         console.log(`Reached end of scrollable content at scroll ${scrollCount}`);
-                        // Capture final chunk if content was replaced
-                        if (htmlChunks.length > 0) {
-                            htmlChunks.push(currentHTML);
-                        }
                         break;
                     }
                 }
-                
-                // If we have chunks (case 2 occurred), merge them
-                if (htmlChunks.length > 0) {
-                    console.log(`Merging ${htmlChunks.length} HTML chunks`);
-                    
-                    // Parse all chunks to extract unique elements
-                    const tempDiv = document.createElement('div');
-                    const seenTexts = new Set();
-                    const uniqueElements = [];
-                    
-                    // Process each chunk
-                    for (const chunk of htmlChunks) {
-                        tempDiv.innerHTML = chunk;
-                        const elements = tempDiv.children;
-                        
-                        for (let i = 0; i < elements.length; i++) {
-                            const element = elements[i];
-                            // Normalize text for deduplication
-                            const normalizedText = element.innerText
-                                .toLowerCase()
-                                .replace(/[\\s\\W]/g, ''); // Remove spaces and symbols
-                            
-                            if (!seenTexts.has(normalizedText)) {
-                                seenTexts.add(normalizedText);
-                                uniqueElements.push(element.outerHTML);
-                            }
-                        }
-                    }
-                    
+
+                if (replaced) {
                     // Replace container content with merged unique elements
-                    container.innerHTML = uniqueElements.join('\\n');
-                    console.log(`Merged ${uniqueElements.length} unique elements from ${htmlChunks.length} chunks`);
-                    
-                    return {
-                        success: true,
-                        chunksCount: htmlChunks.length,
-                        uniqueCount: uniqueElements.length,
-                        replaced: true
-                    };
-                } else {
-                    console.log('No content replacement detected, all content remains in page');
-                    return {
-                        success: true,
-                        chunksCount: 0,
-                        uniqueCount: 0,
-                        replaced: false
-                    };
+                    container.innerHTML = Array.from(seen.values()).join('\\n');
+                    console.log(`Merged ${seen.size} unique elements from ${chunksCount} chunks`);
                 }
+                return {
+                    success: true,
+                    chunksCount: replaced ? chunksCount : 0,
+                    uniqueCount: replaced ? seen.size : 0,
+                    replaced: replaced
+                };
             }
             """
             
@@ -1406,6 +1453,84 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"error": str(e)},
             )
 
+    async def _capture_artifacts(self, page: Page, config: CrawlerRunConfig):
+        """
+        Capture the PDF, MHTML and screenshot requested by `config`, overlapping what can run together.
+
+        MHTML is a CDP DOM snapshot and runs alongside the visual captures. The
+        screenshot is taken before the PDF, never concurrently with it: printing
+        switches the page to print media emulation, which would leak into the
+        screenshot.
+
+        Returns:
+            tuple: (pdf_data, mhtml_data, screenshot_data), each None if not requested
+        """
+        screenshot_kwargs = {}
+        if config.screenshot:
+            screenshot_kwargs = dict(
+                screenshot_height_threshold=config.screenshot_height_threshold,
+                screenshot_format=self._normalize_image_format(config.screenshot_format),
+                screenshot_quality=config.screenshot_quality,
+                screenshot_max_height=config.screenshot_max_height,
+                screenshot_max_width=config.screenshot_max_width,
+            )
+
+        async def screenshot(need_scroll):
+            if config.screenshot_wait_for:
+                await asyncio.sleep(config.screenshot_wait_for)
+            return await self.take_screenshot(page, need_scroll=need_scroll, **screenshot_kwargs)
+
+        async def visual():
+            screenshot_data = None
+            if config.screenshot:
+                need_scroll = config.screenshot_full_page and await self._screenshot_needs_scroll(
+                    page, config.screenshot_max_height
+                )
+                screenshot_data = await screenshot(need_scroll)
+            pdf_data = await self.export_pdf(page) if config.pdf else None
+            return pdf_data, screenshot_data
+
+        async def mhtml():
+            return await self.capture_mhtml(page) if config.capture_mhtml else None
+
+        (pdf_data, screenshot_data), mhtml_data = await asyncio.gather(visual(), mhtml())
+        return pdf_data, mhtml_data, screenshot_data
+
+    @staticmethod
+    def _normalize_image_format(image_format: Optional[str]) -> str:
+        image_format = (image_format or "png").lower()
+        if image_format == "jpg":
+            image_format = "jpeg"
+        if image_format not in ("png", "jpeg", "webp"):
+            raise ValueError(
+                f"Unsupported screenshot format '{image_format}', expected 'png', 'jpeg' or 'webp'"
+            )
+        return image_format
+
+    @staticmethod
+    def _encode_image(
+        img: Image.Image, image_format: str, quality: int = 85, max_width: Optional[int] = None
+    ) -> bytes:
+        """Encode a PIL image, downscaled to max_width; CPU-bound, so callers run it in a worker thread."""
+        if max_width and img.width > max_width:
+            height = max(1, round(img.height * max_width / img.width))
+            img = img.resize((max_width, height), Image.LANCZOS)
+        buffered = BytesIO()
+        if image_format == "jpeg":
+            img.convert("RGB").save(buffered, format="JPEG", quality=quality)
+        elif image_format == "webp":
+            img.save(buffered, format="WEBP", quality=quality)
+        else:
+            img.save(buffered, format="PNG")
+        return buffered.getvalue()
+
+    async def _screenshot_needs_scroll(self, page: Page, max_height: Optional[int] = None) -> bool:
+        if max_height:
+            viewport = page.viewport_size or {}
+            if viewport.get("height") and max_height <= viewport["height"]:
+                return False
+        return await self.page_need_scroll(page)
+
     async def export_pdf(self, page: Page) -> bytes:
         """
         Exports the current page as a PDF.
@@ -1525,16 +1650,19 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
         Args:
             page (Page): The Playwright page object
-            kwargs: Additional keyword arguments
+            kwargs: Additional keyword arguments (screenshot_format, screenshot_quality,
+                screenshot_max_height, screenshot_height_threshold, need_scroll)
 
         Returns:
             str: The base64-encoded screenshot data
         """
-        need_scroll = await self.page_need_scroll(page)
+        need_scroll = kwargs.pop("need_scroll", None)
+        if need_scroll is None:
+            need_scroll = await self._screenshot_needs_scroll(page, kwargs.get("screenshot_max_height"))
 
         if not need_scroll:
             # Page is short enough, just take a screenshot
-            return await self.take_screenshot_naive(page)
+            return await self.take_screenshot_naive(page, **kwargs)
         else:
             # Page is too long, try to take a full-page screenshot
             return await self.take_screenshot_scroller(page, **kwargs)
@@ -1595,6 +1723,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             dimensions = await self.get_page_dimensions(page)
             page_width = dimensions["width"]
             page_height = dimensions["height"]
+            if kwargs.get("screenshot_max_height"):
+                page_height = min(page_height, kwargs["screenshot_max_height"])
+            image_format = kwargs.get("screenshot_format", "png")
+            quality = kwargs.get("screenshot_quality", 85)
             # page_height = await page.evaluate("document.documentElement.scrollHeight")
             # page_width = await page.evaluate("document.documentElement.scrollWidth")
 
@@ -1631,30 +1763,19 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 await page.evaluate(f"window.scrollTo(0, {y_offset})")
                 await asyncio.sleep(0.01)  # wait for render
                 
-                # Capture the current segment
-                # Note: Using compression options (format, quality) would go here
-                seg_shot = await page.screenshot(full_page=False, type="jpeg", quality=85)
-                # seg_shot = await page.screenshot(full_page=False)
-                img = Image.open(BytesIO(seg_shot)).convert("RGB")
-                segments.append(img)
+                # Capture the current segment; decoding and stitching happen off the event loop
+                if image_format == "png":
+                    seg_shot = await page.screenshot(full_page=False, type="png")
+                else:
+                    seg_shot = await page.screenshot(full_page=False, type="jpeg", quality=95)
+                segments.append(seg_shot)
 
             # Reset viewport to original size after capturing segments
             await page.set_viewport_size({"width": page_width, "height": viewport_height})
 
-            total_height = sum(img.height for img in segments)
-            stitched = Image.new("RGB", (segments[0].width, total_height))
-            offset = 0
-            for img in segments:
-                # stitched.paste(img, (0, offset))
-                stitched.paste(img.convert("RGB"), (0, offset))
-                offset += img.height
-
-            buffered = BytesIO()
-            stitched = stitched.convert("RGB")
-            stitched.save(buffered, format="BMP", quality=85)
-            encoded = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-            return encoded
+            return await asyncio.to_thread(
+                self._stitch_segments, segments, image_format, quality, kwargs.get("screenshot_max_width")
+            )
         except Exception as e:
             error_message = f"Failed to take large viewport screenshot: {str(e)}"
             self.logger.error(
@@ -1673,19 +1794,50 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # finally:
         #     await page.close()
 
-    async def take_screenshot_naive(self, page: Page) -> str:
+    def _stitch_segments(
+        self, segments: List[bytes], image_format: str, quality: int, max_width: Optional[int] = None
+    ) -> str:
+        """Stitch viewport captures top to bottom and return the base64-encoded image."""
+        images = [Image.open(BytesIO(seg)).convert("RGB") for seg in segments]
+        total_height = sum(img.height for img in images)
+        stitched = Image.new("RGB", (images[0].width, total_height))
+        offset = 0
+        for img in images:
+            stitched.paste(img, (0, offset))
+            offset += img.height
+        encoded = self._encode_image(stitched, image_format, quality, max_width)
+        return base64.b64encode(encoded).decode("utf-8")
+
+    async def take_screenshot_naive(self, page: Page, **kwargs) -> str:
         """
         Takes a screenshot of the current page.
 
         Args:
             page (Page): The Playwright page instance
+            kwargs: screenshot_format, screenshot_quality, screenshot_max_height and screenshot_max_width
 
         Returns:
             str: Base64-encoded screenshot image
         """
         try:
             # The page is already loaded, just take the screenshot
-            screenshot = await page.screenshot(full_page=False)
+            image_format = kwargs.get("screenshot_format", "png")
+            quality = kwargs.get("screenshot_quality", 85)
+            options = {"full_page": False}
+            max_height = kwargs.get("screenshot_max_height")
+            viewport = page.viewport_size
+            if max_height and viewport and max_height < viewport["height"]:
+                options["clip"] = {"x": 0, "y": 0, "width": viewport["width"], "height": max_height}
+            if image_format == "jpeg":
+                options.update(type="jpeg", quality=quality)
+            screenshot = await page.screenshot(**options)
+            max_width = kwargs.get("screenshot_max_width")
+            if image_format == "webp" or (max_width and viewport and viewport["width"] > max_width):
+                # Playwright can neither encode WebP nor scale, so re-encode off the event loop
+                raw = Image.open(BytesIO(screenshot))
+                screenshot = await asyncio.to_thread(
+                    self._encode_image, raw, image_format, quality, max_width
+                )
             return base64.b64encode(screenshot).decode("utf-8")
         except Exception as e:
             error_message = f"Failed to take screenshot: {str(e)}"
@@ -2146,23 +2298,49 @@ class ConnectionTimeoutError(HTTPCrawlerError):
 
 class HTTPStatusError(HTTPCrawlerError):
     """Raised for unexpected status codes"""
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
         self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+class CircuitOpenError(HTTPCrawlerError):
+    """Raised without a request while a host's circuit breaker is open"""
+    pass
+
+
+class ResponseTooLargeError(HTTPCrawlerError):
+    """Raised when a response body exceeds HTTPCrawlerConfig.max_body_size"""
+    pass
+
+
 class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Fast, lightweight HTTP-only crawler strategy optimized for memory efficiency.
     """
     
-    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config')
+    __slots__ = ('logger', 'max_connections', 'max_connections_per_host', 'keepalive_timeout', 'http2',
+                 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config', '_circuits', '_host_slots',
+                 '_connection_slots')
 
     DEFAULT_TIMEOUT: Final[int] = 30
     DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024  
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
+    DEFAULT_MAX_CONNECTIONS_PER_HOST: Final[int] = 8
+    DEFAULT_KEEPALIVE_TIMEOUT: Final[float] = 30.0
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
+    CHARSET_SNIFF_BYTES: Final[int] = 64 * 1024
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
+    IDEMPOTENT_METHODS: Final = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+    # Statuses that tell us the request was not processed, so even POST may be retried
+    _NOT_PROCESSED_STATUSES: Final = frozenset({429, 503})
+
+    _META_CHARSET_RE: Final = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_:.-]+)', re.I)
+    _BOMS: Final = (
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
 
     _BASE_HEADERS: Final = MappingProxyType({
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -2179,15 +2357,35 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         logger: Optional[AsyncLogger] = None,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
-        chunk_size: int = DEFAULT_CHUNK_SIZE
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        http2: bool = False,
     ):
-        """Initialize the HTTP crawler with config"""
+        """
+        Initialize the HTTP crawler with config.
+
+        max_connections caps connections overall and max_connections_per_host caps
+        them per host, so one slow host can't take every slot. Idle connections are
+        kept for keepalive_timeout seconds. With http2=True requests go through
+        httpx, which negotiates HTTP/2 (and multiplexes) with hosts that support it.
+        """
         self.browser_config = browser_config or HTTPCrawlerConfig()
         self.logger = logger
         self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.http2 = http2
+        # Requests wait for a slot here, before their timeout starts, rather than in the
+        # connection pool (httpx has no per-host limit, and aiohttp times pool waits);
+        # host -> [semaphore, requests holding or waiting for it], dropped once unused
+        self._host_slots: Dict[str, list] = {}
+        self._connection_slots = asyncio.Semaphore(max_connections)
         self.dns_cache_ttl = dns_cache_ttl
         self.chunk_size = chunk_size
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[Union[aiohttp.ClientSession, httpx.AsyncClient]] = None
+        # host -> [consecutive failures, opened_at, probe in flight]
+        self._circuits: Dict[str, list] = {}
         
         self.hooks = {
             k: partial(self._execute_hook, k) 
@@ -2235,8 +2433,23 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
 
     async def start(self) -> None:
         if not self._session:
+            if self.http2:
+                self._session = httpx.AsyncClient(
+                    http2=True,
+                    headers=dict(self._BASE_HEADERS),
+                    verify=self.browser_config.verify_ssl,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                        keepalive_expiry=self.keepalive_timeout,
+                    ),
+                    timeout=self.DEFAULT_TIMEOUT,
+                )
+                return
             connector = aiohttp.TCPConnector(
                 limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
                 ttl_dns_cache=self.dns_cache_ttl,
                 use_dns_cache=True,
                 force_close=False
@@ -2248,9 +2461,13 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             )
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
+        if not self._session:
+            return
+        closed = self._session.is_closed if self.http2 else self._session.closed
+        if not closed:
+            close = self._session.aclose if self.http2 else self._session.close
             try:
-                await asyncio.wait_for(self._session.close(), timeout=5.0)
+                await asyncio.wait_for(close(), timeout=5.0)
             except asyncio.TimeoutError:
                 if self.logger:
                     self.logger.warning(
@@ -2287,15 +2504,273 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         )
 
 
+    async def _read_body(self, chunks: AsyncIterator[bytes], content_length: Optional[int], url: str) -> bytearray:
+        """Stream the body into one buffer, giving up once it exceeds max_body_size."""
+        limit = self.browser_config.max_body_size
+        if limit is not None and (content_length or 0) > limit:
+            raise ResponseTooLargeError(
+                f"Response for {url} is {content_length} bytes, over the {limit} byte limit"
+            )
+        body = bytearray()
+        async for chunk in chunks:
+            body += chunk
+            if limit is not None and len(body) > limit:
+                raise ResponseTooLargeError(f"Response for {url} exceeded the {limit} byte limit")
+        return body
+
+    def _decode_body(self, content: Union[bytes, bytearray], header_charset: Optional[str] = None) -> str:
+        """
+        Decode the body once, picking the encoding without scanning all of it:
+        byte order mark, Content-Type charset, <meta charset>, strict UTF-8, then
+        a detector over a bounded prefix.
+        """
+        for bom, name in self._BOMS:
+            if content.startswith(bom):
+                return content.decode(name, errors='replace')
+        candidates = [header_charset]
+        head = bytes(content[:4096])
+        match = self._META_CHARSET_RE.search(head)
+        if match:
+            candidates.append(match.group(1).decode('ascii'))
+        for candidate in candidates:
+            if candidate:
+                try:
+                    return content.decode(codecs.lookup(candidate).name, errors='replace')
+                except LookupError:
+                    continue
+
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+
+        sample = bytes(content[:self.CHARSET_SNIFF_BYTES])
+        if self.browser_config.charset_detector == "charset_normalizer" and HAS_CHARSET_NORMALIZER:
+            best = charset_normalizer.from_bytes(sample).best()
+            encoding = best.encoding if best else None
+        else:
+            encoding = chardet.detect(sample)['encoding']
+        try:
+            return content.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return content.decode('utf-8', errors='replace')
+
+    def _check_circuit(self, host: str) -> bool:
+        """
+        Raise CircuitOpenError while the host is cooling down; let one probe through after.
+        Returns True if this request is that probe.
+        """
+        circuit = self._circuits.get(host)
+        if not circuit or circuit[1] is None:
+            return False
+        failures, opened_at, probing = circuit
+        if probing or time.monotonic() - opened_at < self.browser_config.circuit_breaker_cooldown:
+            raise CircuitOpenError(
+                f"Circuit open for {host} after {failures} consecutive failures"
+            )
+        circuit[2] = True
+        return True
+
+    def _end_probe(self, host: str) -> None:
+        """Let the next request probe again if this probe ended without an outcome."""
+        circuit = self._circuits.get(host)
+        if circuit:
+            circuit[2] = False
+
+    def _record_outcome(self, host: str, ok: bool) -> None:
+        threshold = self.browser_config.circuit_breaker_threshold
+        if not threshold:
+            return
+        if ok:
+            self._circuits.pop(host, None)
+            return
+        circuit = self._circuits.setdefault(host, [0, None, False])
+        circuit[0] += 1
+        if circuit[2] or circuit[0] >= threshold:
+            if circuit[1] is None and self.logger:
+                self.logger.warning(
+                    message="Opening circuit for {host} after {failures} consecutive failures",
+                    tag="HTTP",
+                    params={"host": host, "failures": circuit[0]},
+                )
+            circuit[1], circuit[2] = time.monotonic(), False
+
+    def _retry_delay(self, error: Exception, method: str, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying after `error`, or None if it shouldn't be retried."""
+        cfg = self.browser_config
+        if attempt >= cfg.max_retries:
+            return None
+        may_repeat = method in self.IDEMPOTENT_METHODS or cfg.retry_non_idempotent
+
+        if isinstance(error, HTTPStatusError):
+            if error.status_code not in cfg.retry_statuses:
+                return None
+            if not (may_repeat or error.status_code in self._NOT_PROCESSED_STATUSES):
+                return None
+            if error.retry_after is not None:
+                # Don't sleep longer than we'd ever back off; give up instead
+                return error.retry_after if error.retry_after <= cfg.retry_backoff_max else None
+        elif isinstance(error, ConnectionError):
+            pass  # Never connected, nothing was sent
+        elif isinstance(error, ConnectionTimeoutError) or isinstance(error.__cause__, (aiohttp.ClientError, httpx.TransportError)):
+            if not may_repeat:
+                return None
+        else:
+            return None
+
+        # Exponential backoff with random jitter
+        delay = min(cfg.retry_backoff * (2 ** attempt), cfg.retry_backoff_max)
+        return delay * random.uniform(0.75, 1.25)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
     async def _handle_http(
         self, 
         url: str, 
         config: CrawlerRunConfig
+    ) -> AsyncCrawlResponse:
+        host = urlparse(url).netloc
+        method = self.browser_config.method.upper()
+        attempt = 0
+        while True:
+            probing = self._check_circuit(host)
+            try:
+                result = await self._request_once(url, config)
+            except (HTTPCrawlerError, ConnectionError) as e:
+                if isinstance(e, CircuitOpenError):
+                    raise
+                # Only server-side trouble says anything about the host's health;
+                # any other HTTP response, 4xx included, shows it is up
+                if isinstance(e, HTTPStatusError):
+                    host_failure = e.status_code >= 500
+                else:
+                    host_failure = not isinstance(e, ResponseTooLargeError)
+                self._record_outcome(host, ok=not host_failure)
+                delay = self._retry_delay(e, method, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                if self.logger:
+                    self.logger.warning(
+                        message="Retrying {url} in {delay:.1f}s (attempt {attempt}/{max_retries}): {error}",
+                        tag="HTTP",
+                        params={
+                            "url": url,
+                            "delay": delay,
+                            "attempt": attempt,
+                            "max_retries": self.browser_config.max_retries,
+                            "error": str(e),
+                        },
+                    )
+                await asyncio.sleep(delay)
+                continue
+            finally:
+                # Cancellation or an unexpected error must not leave the host stuck half-open
+                if probing:
+                    self._end_probe(host)
+            self._record_outcome(host, ok=True)
+            return result
+
+    @contextlib.asynccontextmanager
+    async def _host_slot(self, host: str):
+        """Hold one of the host's max_connections_per_host slots and one of max_connections."""
+        entry = self._host_slots.get(host)
+        if entry is None:
+            entry = self._host_slots[host] = [asyncio.Semaphore(self.max_connections_per_host), 0]
+        entry[1] += 1
+        try:
+            async with entry[0], self._connection_slots:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._host_slots[host]
+
+    def _httpx_request_kwargs(self, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Translate the aiohttp-style request_kwargs (as before_request hooks see them) for httpx.
+
+        Options httpx only takes per client, such as a proxy or a different ssl
+        setting, raise ValueError instead of being silently dropped.
+        """
+        kwargs = dict(request_kwargs)
+        timeout = kwargs.pop('timeout')
+        headers = dict(kwargs.pop('headers'))
+        translated = {
+            'follow_redirects': kwargs.pop('allow_redirects'),
+            'timeout': httpx.Timeout(
+                timeout.total, connect=timeout.sock_connect or timeout.connect, read=timeout.sock_read
+            ),
+        }
+        if kwargs.get('ssl', self.browser_config.verify_ssl) == self.browser_config.verify_ssl:
+            kwargs.pop('ssl', None)
+        for key in ('data', 'json', 'params'):
+            if key in kwargs:
+                translated[key] = kwargs.pop(key)
+        if isinstance(kwargs.get('cookies'), dict):
+            cookies = '; '.join(f'{name}={value}' for name, value in kwargs.pop('cookies').items())
+            if cookies:
+                headers['Cookie'] = f"{headers['Cookie']}; {cookies}" if headers.get('Cookie') else cookies
+        if isinstance(kwargs.get('auth'), aiohttp.BasicAuth):
+            auth = kwargs.pop('auth')
+            translated['auth'] = httpx.BasicAuth(auth.login, auth.password)
+        if kwargs:
+            raise ValueError(
+                f"Request options not supported with http2=True: {', '.join(sorted(kwargs))}"
+            )
+        translated['headers'] = headers
+        return translated
+
+    async def _request_httpx(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        httpx_kwargs: Dict[str, Any]
+    ) -> AsyncCrawlResponse:
+        async with client.stream(self.browser_config.method, url, **httpx_kwargs) as response:
+            if not (200 <= response.status_code < 300):
+                raise HTTPStatusError(
+                    response.status_code,
+                    f"Unexpected status code for {url}",
+                    retry_after=self._parse_retry_after(response.headers.get('Retry-After')),
+                )
+
+            length = response.headers.get('Content-Length')
+            content = await self._read_body(
+                response.aiter_bytes(self.chunk_size),
+                int(length) if length and length.isdigit() else None,
+                url,
+            )
+            result = AsyncCrawlResponse(
+                html=self._decode_body(content, response.charset_encoding),
+                response_headers=dict(response.headers),
+                status_code=response.status_code,
+                redirected_url=str(response.url)
+            )
+
+        await self.hooks['after_request'](result)
+        return result
+
+    async def _request_once(
+        self,
+        url: str,
+        config: CrawlerRunConfig
     ) -> AsyncCrawlResponse:
         async with self._session_context() as session:
             timeout = ClientTimeout(
                 total=config.page_timeout or self.DEFAULT_TIMEOUT,
-                connect=10,
+                sock_connect=10,
                 sock_read=30
             )
             
@@ -2317,30 +2792,40 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     request_kwargs['json'] = self.browser_config.json
 
             await self.hooks['before_request'](url, request_kwargs)
+            httpx_kwargs = self._httpx_request_kwargs(request_kwargs) if self.http2 else None
 
             try:
-                async with session.request(self.browser_config.method, url, **request_kwargs) as response:
-                    content = memoryview(await response.read())
-                    
-                    if not (200 <= response.status < 300):
-                        raise HTTPStatusError(
-                            response.status,
-                            f"Unexpected status code for {url}"
+                # Waiting for a host slot is queueing, not part of the request's timeout
+                async with self._host_slot(urlparse(url).netloc):
+                    if self.http2:
+                        return await asyncio.wait_for(
+                            self._request_httpx(session, url, httpx_kwargs), timeout.total
+                        )
+                    async with session.request(self.browser_config.method, url, **request_kwargs) as response:
+                        if not (200 <= response.status < 300):
+                            raise HTTPStatusError(
+                                response.status,
+                                f"Unexpected status code for {url}",
+                                retry_after=self._parse_retry_after(response.headers.get('Retry-After')),
+                            )
+
+                        content = await self._read_body(
+                            response.content.iter_chunked(self.chunk_size), response.content_length, url
+                        )
+
+                        result = AsyncCrawlResponse(
+                            html=self._decode_body(content, response.charset),
+                            response_headers=dict(response.headers),
+                            status_code=response.status,
+                            redirected_url=str(response.url)
                         )
                     
-                    encoding = response.charset
-                    if not encoding:
-                        encoding = chardet.detect(content.tobytes())['encoding'] or 'utf-8'                    
-                    
-                    result = AsyncCrawlResponse(
-                        html=content.tobytes().decode(encoding, errors='replace'),
-                        response_headers=dict(response.headers),
-                        status_code=response.status,
-                        redirected_url=str(response.url)
-                    )
-                    
-                    await self.hooks['after_request'](result)
-                    return result
+                        await self.hooks['after_request'](result)
+                        return result
+
+            except HTTPCrawlerError as e:
+                await self.hooks['on_error'](e)
+                raise
 
             except aiohttp.ServerTimeoutError as e:
                 await self.hooks['on_error'](e)
@@ -2352,11 +2837,23 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 
             except aiohttp.ClientError as e:
                 await self.hooks['on_error'](e)
-                raise HTTPCrawlerError(f"HTTP client error: {str(e)}")
+                raise HTTPCrawlerError(f"HTTP client error: {str(e)}") from e
             
             except asyncio.exceptions.TimeoutError as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
+
+            except httpx.TimeoutException as e:
+                await self.hooks['on_error'](e)
+                raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
+
+            except httpx.ConnectError as e:
+                await self.hooks['on_error'](e)
+                raise ConnectionError(f"Connection failed: {str(e)}")
+
+            except httpx.HTTPError as e:
+                await self.hooks['on_error'](e)
+                raise HTTPCrawlerError(f"HTTP client error: {str(e)}") from e
             
             except Exception as e:
                 await self.hooks['on_error'](e)
@@ -2392,3 +2889,191 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     params={"error": str(e), "url": url}
                 )
             raise
+
+
+####################################################################################################
+# Hybrid Crawler Strategy
+####################################################################################################
+
+class AsyncHybridCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    HTTP-first crawler strategy that escalates to a browser only when needed.
+
+    Every URL is fetched with AsyncHTTPCrawlerStrategy first. The browser
+    (AsyncPlaywrightCrawlerStrategy) is used instead when the run config asks for
+    something only a browser can do (screenshots, js_code, sessions, ...), when the
+    HTTP request fails, or when the response looks like it needs JavaScript:
+    almost no visible text, an empty SPA mount point, a noscript "enable
+    JavaScript" warning, or a configured CSS selector that isn't in the HTML.
+
+    The browser is launched lazily on the first escalation. The path taken is
+    recorded in AsyncCrawlResponse.fetch_strategy ("http" or "browser") and
+    counted in `stats`.
+
+    Args:
+        browser_config (BrowserConfig): Config for the fallback browser.
+        http_config (HTTPCrawlerConfig): Config for the HTTP fetch.
+        logger (AsyncLogger): Logger shared by both strategies.
+        min_text_length (int): Pages with less visible text than this are escalated.
+        spa_markers (list of str): Regexes that mark a client-rendered page. Defaults to SPA_MARKERS.
+    """
+
+    DEFAULT_MIN_TEXT_LENGTH: Final[int] = 200
+
+    # Empty mount points left behind by client-side frameworks
+    SPA_MARKERS: Final = (
+        r'<div[^>]*\bid=["\'](?:root|app|__next|__nuxt|svelte)["\'][^>]*>\s*</div>',
+        r"<app-root[^>]*>\s*</app-root>",
+        r"<noscript[^>]*>(?:(?!</noscript).){0,500}?(?:enable|requires?|turn on)\s+(?:your\s+)?javascript",
+    )
+
+    _INVISIBLE_RE: Final = re.compile(
+        r"<(script|style|noscript|template|svg)\b.*?</\1\s*>|<!--.*?-->", re.I | re.S
+    )
+    _TAG_RE: Final = re.compile(r"<[^>]+>")
+
+    # Run config flags that only make sense in a browser
+    _BROWSER_ONLY_FIELDS: Final = (
+        "screenshot", "pdf", "capture_mhtml", "js_code", "session_id", "scan_full_page",
+        "virtual_scroll_config", "capture_network_requests", "capture_console_messages",
+        "simulate_user", "magic", "process_iframes", "remove_overlay_elements",
+    )
+
+    def __init__(
+        self,
+        browser_config: Optional[BrowserConfig] = None,
+        http_config: Optional[HTTPCrawlerConfig] = None,
+        logger: Optional[AsyncLogger] = None,
+        min_text_length: int = DEFAULT_MIN_TEXT_LENGTH,
+        spa_markers: Optional[List[str]] = None,
+        **kwargs,
+    ):
+        self.logger = logger
+        # No logger: HTTP failures are expected here and reported as escalations
+        self.http_strategy = AsyncHTTPCrawlerStrategy(browser_config=http_config)
+        self.browser_strategy = AsyncPlaywrightCrawlerStrategy(
+            browser_config=browser_config, logger=logger, **kwargs
+        )
+        self.min_text_length = min_text_length
+        self._spa_re = re.compile(
+            "|".join(f"(?:{m})" for m in (spa_markers or self.SPA_MARKERS)), re.I | re.S
+        )
+        self._browser_started = False
+        self._browser_lock = asyncio.Lock()
+        self.stats = {"http": 0, "browser": 0}
+
+    @property
+    def browser_manager(self) -> BrowserManager:
+        """The fallback browser's manager, e.g. for config signatures in dispatchers."""
+        return self.browser_strategy.browser_manager
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        await self.http_strategy.start()
+
+    async def close(self):
+        await self.http_strategy.close()
+        if self._browser_started:
+            await self.browser_strategy.close()
+            self._browser_started = False
+
+    async def _ensure_browser(self):
+        if self._browser_started:
+            return
+        async with self._browser_lock:
+            if not self._browser_started:
+                await self.browser_strategy.start()
+                self._browser_started = True
+
+    def set_hook(self, hook_type: str, hook: Callable):
+        if hook_type in self.http_strategy.hooks:
+            self.http_strategy.set_hook(hook_type, hook)
+        else:
+            self.browser_strategy.set_hook(hook_type, hook)
+
+    def update_user_agent(self, user_agent: str):
+        self.browser_strategy.update_user_agent(user_agent)
+        http_config = self.http_strategy.browser_config
+        http_config.headers = {**(http_config.headers or {}), "User-Agent": user_agent}
+
+    async def kill_session(self, session_id: str):
+        if self._browser_started:
+            await self.browser_strategy.kill_session(session_id)
+
+    def browser_required(self, config: CrawlerRunConfig) -> Optional[str]:
+        """Return why the run config can only be served by a browser, or None."""
+        for field in self._BROWSER_ONLY_FIELDS:
+            if getattr(config, field, None):
+                return f"{field} requested"
+        wait_for = (config.wait_for or "").strip()
+        if wait_for and not wait_for.startswith("css:"):
+            return "wait_for requires a browser"
+        return None
+
+    def escalation_reason(self, html: str, config: CrawlerRunConfig) -> Optional[str]:
+        """Return why an HTTP-fetched page needs a browser to render, or None."""
+        text = self._TAG_RE.sub(" ", self._INVISIBLE_RE.sub(" ", html))
+        if len(" ".join(text.split())) < self.min_text_length:
+            return "too little visible text"
+        match = self._spa_re.search(html)
+        if match:
+            return f"client-side rendering marker: {match.group(0)[:60]}"
+
+        selectors = list(config.target_elements or [])
+        if config.css_selector:
+            selectors.append(config.css_selector)
+        wait_for = (config.wait_for or "").strip()
+        if wait_for.startswith("css:"):
+            selectors.append(wait_for[4:].strip())
+        if selectors:
+            from lxml import html as lhtml
+            try:
+                document = lhtml.fromstring(html)
+            except Exception:
+                return "unparseable HTML"
+            for selector in selectors:
+                try:
+                    if not document.cssselect(selector):
+                        return f"selector not found: {selector}"
+                except Exception:
+                    return f"selector not checkable without a browser: {selector}"
+        return None
+
+    async def _crawl_with_browser(self, url: str, config: CrawlerRunConfig, reason: str) -> AsyncCrawlResponse:
+        if self.logger:
+            self.logger.info(
+                message="Using browser for {url}: {reason}",
+                tag="HYBRID",
+                params={"url": url, "reason": reason},
+            )
+        await self._ensure_browser()
+        response = await self.browser_strategy.crawl(url, config=config)
+        response.fetch_strategy = "browser"
+        self.stats["browser"] += 1
+        return response
+
+    async def crawl(self, url: str, config: Optional[CrawlerRunConfig] = None, **kwargs) -> AsyncCrawlResponse:
+        config = config or CrawlerRunConfig.from_kwargs(kwargs)
+
+        reason = self.browser_required(config)
+        if reason:
+            return await self._crawl_with_browser(url, config, reason)
+
+        try:
+            response = await self.http_strategy.crawl(url, config=config)
+        except Exception as e:
+            return await self._crawl_with_browser(url, config, f"HTTP fetch failed: {e}")
+
+        reason = self.escalation_reason(response.html, config)
+        if reason:
+            return await self._crawl_with_browser(url, config, reason)
+
+        response.fetch_strategy = "http"
+        self.stats["http"] += 1
+        return response
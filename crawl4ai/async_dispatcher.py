@@ -1,5 +1,6 @@
-from typing import Dict, Optional, List, Tuple, Union
-from .async_configs import CrawlerRunConfig
+from typing import Any, Callable, Dict, Optional, List, Tuple, Union
+from .async_configs import BrowserConfig, CrawlerRunConfig
+from .ssl_certificate import SSLCertificate
 from .models import (
     CrawlResult,
     CrawlerTaskResult,
@@ -12,37 +13,108 @@ from .components.crawler_monitor import CrawlerMonitor
 from .types import AsyncWebCrawler
 
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
 
+import os
+import json
+import hashlib
 import time
 import psutil
 import asyncio
 import uuid
+import queue
+import multiprocessing
 
 from urllib.parse import urlparse
+from base64 import b64encode, b64decode
 import random
 from abc import ABC, abstractmethod
 
-from .utils import get_true_memory_usage_percent
+from .utils import get_true_memory_usage_percent, RobotsParser
 
 
 class RateLimiter:
+    """
+    Paces requests per domain and backs off on rate-limit responses.
+
+    By default each domain gets a random delay from `base_delay` between requests.
+    With `requests_per_second` set, a token bucket per domain is used instead:
+    up to `burst` requests go out back to back, then they are spaced at that rate.
+
+    When a robots parser is available, either attached as `robots_parser` or
+    passed per call (dispatchers pass the crawler's own parser for crawls with
+    `check_robots_txt=True`), `Crawl-delay` and `Request-rate` from robots.txt
+    files it has read slow the domain down further. Robots delays above
+    `max_crawl_delay` are capped, so a site can't stall the crawl with an
+    extreme value.
+    """
+
     def __init__(
         self,
         base_delay: Tuple[float, float] = (1.0, 3.0),
         max_delay: float = 60.0,
         max_retries: int = 3,
         rate_limit_codes: List[int] = None,
+        robots_parser: Optional[RobotsParser] = None,
+        robots_user_agent: str = "*",
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
+        respect_robots: bool = True,
+        max_crawl_delay: Optional[float] = None,
     ):
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.max_retries = max_retries
         self.rate_limit_codes = rate_limit_codes or [429, 503]
         self.domains: Dict[str, DomainState] = {}
+        self.robots_parser = robots_parser
+        self.robots_user_agent = robots_user_agent
+        self.requests_per_second = requests_per_second
+        self.burst = max(1, burst)
+        self.respect_robots = respect_robots
+        self.max_crawl_delay = max_delay if max_crawl_delay is None else max_crawl_delay
 
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
-    async def wait_if_needed(self, url: str) -> None:
+    def robots_interval(
+        self,
+        url: str,
+        robots_parser: Optional[RobotsParser] = None,
+        robots_user_agent: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Seconds between requests asked for by robots.txt, capped at max_crawl_delay.
+
+        `robots_parser` and `robots_user_agent` override the attached ones for this call.
+        """
+        robots_parser = robots_parser or self.robots_parser
+        robots_user_agent = robots_user_agent or self.robots_user_agent
+        if not (self.respect_robots and robots_parser):
+            return None
+        intervals = []
+        crawl_delay = robots_parser.crawl_delay(url, robots_user_agent)
+        if crawl_delay:
+            intervals.append(crawl_delay)
+        request_rate = robots_parser.request_rate(url, robots_user_agent)
+        if request_rate:
+            intervals.append(1 / request_rate)
+        if not intervals:
+            return None
+        return min(max(intervals), self.max_crawl_delay)
+
+    def domain_rate(self, url: str, **robots) -> Tuple[Optional[float], int]:
+        """Token bucket (requests per second, burst) for the URL's domain, or (None, 0) for delay pacing."""
+        if self.requests_per_second is None:
+            return None, 0
+        interval = self.robots_interval(url, **robots)
+        if interval:
+            # Robots-limited sites get the slower of both rates and no bursts
+            return min(self.requests_per_second, 1 / interval), 1
+        return self.requests_per_second, self.burst
+
+    async def wait_if_needed(self, url: str, **robots) -> None:
+        """Wait for the URL's domain; `robots` may carry robots_parser/robots_user_agent for this call."""
         domain = self.get_domain(url)
         state = self.domains.get(domain)
 
@@ -50,9 +122,19 @@ class RateLimiter:
             self.domains[domain] = DomainState()
             state = self.domains[domain]
 
+        rate, burst = self.domain_rate(url, **robots)
+        if rate is not None:
+            await self._take_token(state, rate, burst)
+            return
+
+        delay = state.current_delay
+        interval = self.robots_interval(url, **robots)
+        if interval:
+            delay = max(delay, interval)
+
         now = time.time()
         if state.last_request_time:
-            wait_time = max(0, state.current_delay - (now - state.last_request_time))
+            wait_time = max(0, delay - (now - state.last_request_time))
             if wait_time > 0:
                 await asyncio.sleep(wait_time)
 
@@ -62,9 +144,27 @@ class RateLimiter:
 
         state.last_request_time = time.time()
 
+    async def _take_token(self, state: DomainState, rate: float, burst: int) -> None:
+        now = time.time()
+        if not state.last_refill:
+            state.tokens, state.last_refill = burst, now
+        state.tokens = min(burst, state.tokens + (now - state.last_refill) * rate)
+        state.last_refill = now
+        # Reserve the token before sleeping so concurrent callers queue up behind it
+        state.tokens -= 1
+        wait_time = -state.tokens / rate if state.tokens < 0 else 0
+
+        # Backoff after rate-limit responses spaces requests out on top of the bucket
+        if state.current_delay and state.last_request_time:
+            wait_time = max(wait_time, state.current_delay - (now - state.last_request_time))
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        state.last_request_time = time.time()
+
     def update_delay(self, url: str, status_code: int) -> bool:
         domain = self.get_domain(url)
         state = self.domains[domain]
+        token_bucket = self.requests_per_second is not None
 
         if status_code in self.rate_limit_codes:
             state.fail_count += 1
@@ -72,9 +172,14 @@ class RateLimiter:
                 return False
 
             # Exponential backoff with random jitter
+            current = state.current_delay or (1 / self.requests_per_second if token_bucket else 0)
             state.current_delay = min(
-                state.current_delay * 2 * random.uniform(0.75, 1.25), self.max_delay
+                current * 2 * random.uniform(0.75, 1.25), self.max_delay
             )
+        elif token_bucket:
+            # Ease back to the bucket's own pace
+            state.current_delay = state.current_delay * 0.75 if state.current_delay > 0.05 else 0
+            state.fail_count = 0
         else:
             # Gradually reduce delay on success
             state.current_delay = max(
@@ -98,6 +203,17 @@ class BaseDispatcher(ABC):
         self.rate_limiter = rate_limiter
         self.monitor = monitor
 
+    def _robots_kwargs(self, config: CrawlerRunConfig) -> Dict[str, Any]:
+        """Robots source for the rate limiter: the crawler's parser, if this crawl reads robots.txt."""
+        robots_parser = getattr(self.crawler, "robots_parser", None)
+        if robots_parser is None or not getattr(config, "check_robots_txt", False):
+            return {}
+        browser_config = getattr(self.crawler, "browser_config", None)
+        return {
+            "robots_parser": robots_parser,
+            "robots_user_agent": getattr(browser_config, "user_agent", None) or "*",
+        }
+
     def select_config(self, url: str, configs: Union[CrawlerRunConfig, List[CrawlerRunConfig]]) -> Optional[CrawlerRunConfig]:
         """Select the appropriate config for a given URL.
         
@@ -124,6 +240,84 @@ class BaseDispatcher(ABC):
         # No match found - return None to indicate URL should be skipped
         return None
 
+    @staticmethod
+    def _time_remaining(deadline: Optional[float]) -> Optional[float]:
+        """Seconds left until `deadline` (an absolute time.time()), or None without one."""
+        if deadline is None:
+            return None
+        return deadline - time.time()
+
+    @classmethod
+    def _deadline_passed(cls, deadline: Optional[float]) -> bool:
+        remaining = cls._time_remaining(deadline)
+        return remaining is not None and remaining <= 0
+
+    @staticmethod
+    def _deadline_crawl_result(url: str, error_message: str) -> CrawlResult:
+        return CrawlResult(
+            url=url,
+            html="",
+            metadata={"status": "deadline_exceeded"},
+            success=False,
+            error_message=error_message,
+        )
+
+    @staticmethod
+    def _is_deadline_result(result: CrawlResult) -> bool:
+        return bool(result.metadata) and result.metadata.get("status") == "deadline_exceeded"
+
+    async def _arun_within_deadline(
+        self, url: str, config: CrawlerRunConfig, task_id: str, deadline: Optional[float] = None
+    ) -> CrawlResult:
+        """Run one crawl, giving it whatever time is left before the job deadline."""
+        remaining = self._time_remaining(deadline)
+        if remaining is None:
+            return await self.crawler.arun(url, config=config, session_id=task_id)
+        try:
+            return await asyncio.wait_for(
+                self.crawler.arun(url, config=config, session_id=task_id),
+                timeout=max(remaining, 0),
+            )
+        except asyncio.TimeoutError:
+            if not self._deadline_passed(deadline):
+                # Timed out on its own, not because of the deadline
+                raise
+            return self._deadline_crawl_result(url, "Deadline exceeded during the crawl")
+
+    def _context_signature(self, config: CrawlerRunConfig) -> str:
+        """Signature of the browser context `config` needs, as computed by the BrowserManager."""
+        browser_manager = getattr(
+            getattr(self.crawler, "crawler_strategy", None), "browser_manager", None
+        )
+        if browser_manager is not None:
+            return browser_manager._make_config_signature(config)
+        return config.browser_signature()
+
+    def _group_urls(
+        self,
+        urls: List[str],
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> List[Tuple[str, Tuple[int, str]]]:
+        """
+        Order URLs so that URLs sharing a browser context, then a domain, are adjacent.
+
+        Returns (url, group_key) pairs where group_key is (context_rank, domain).
+        Context ranks follow the order in which signatures first appear; URLs
+        without a matching config get rank -1 so they fail fast.
+        """
+        ranks: Dict[str, int] = {}
+        grouped = []
+        for url in urls:
+            selected_config = self.select_config(url, config)
+            if selected_config is None:
+                rank = -1
+            else:
+                rank = ranks.setdefault(self._context_signature(selected_config), len(ranks))
+            grouped.append((url, (rank, urlparse(url).netloc)))
+        # sort() is stable, so the original order is kept within a group
+        grouped.sort(key=lambda item: item[1])
+        return grouped
+
     @abstractmethod
     async def crawl_url(
         self,
@@ -141,7 +335,15 @@ class BaseDispatcher(ABC):
         crawler: AsyncWebCrawler,  # noqa: F821
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
         monitor: Optional[CrawlerMonitor] = None,
+        deadline: Optional[float] = None,
     ) -> List[CrawlerTaskResult]:
+        """
+        Crawl `urls` and return one CrawlerTaskResult per URL.
+
+        `deadline` is an absolute time.time() by which the job must finish; crawls
+        still running or not yet started at that point come back as failed results
+        with deadline_exceeded set. Dispatchers that cannot honour it raise ValueError.
+        """
         pass
 
 
@@ -155,6 +357,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         max_session_permit: int = 20,
         fairness_timeout: float = 600.0,  # 10 minutes before prioritizing long-waiting URLs
         memory_wait_timeout: Optional[float] = 600.0,
+        group_by_context: bool = False,
+        max_open_contexts: Optional[int] = None,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
     ):
@@ -166,6 +370,12 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.max_session_permit = max_session_permit
         self.fairness_timeout = fairness_timeout
         self.memory_wait_timeout = memory_wait_timeout
+        # Dispatch URLs sharing a browser context (then a domain) together, and
+        # optionally cap how many distinct contexts are in use at once
+        self.group_by_context = group_by_context or max_open_contexts is not None
+        self.max_open_contexts = max_open_contexts
+        self._task_groups: Dict[str, Tuple[int, str]] = {}
+        self._active_groups: Dict[int, int] = {}
         self.result_queue = asyncio.Queue()
         self.task_queue = asyncio.PriorityQueue()  # Priority queue for better management
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
@@ -224,6 +434,41 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             return -wait_time
         # Standard priority based on retries
         return retry_count
+
+    async def _enqueue_urls(
+        self,
+        urls: List[str],
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> None:
+        if self.group_by_context:
+            grouped = self._group_urls(urls, config)
+        else:
+            # A constant group key keeps the plain priority ordering
+            grouped = [(url, (0, "")) for url in urls]
+        for url, group_key in grouped:
+            task_id = str(uuid.uuid4())
+            if self.monitor:
+                self.monitor.add_task(task_id, url)
+            self._task_groups[task_id] = group_key
+            # Add to queue with initial priority 0, retry count 0, and current time
+            await self.task_queue.put((0, group_key, (url, task_id, 0, time.time())))
+
+    def _can_open_context(self, group_key: Tuple[int, str]) -> bool:
+        if self.max_open_contexts is None:
+            return True
+        rank = group_key[0]
+        return rank in self._active_groups or len(self._active_groups) < self.max_open_contexts
+
+    def _track_group(self, task: asyncio.Task, group_key: Tuple[int, str]) -> None:
+        rank = group_key[0]
+        self._active_groups[rank] = self._active_groups.get(rank, 0) + 1
+
+        def release(_):
+            self._active_groups[rank] -= 1
+            if not self._active_groups[rank]:
+                del self._active_groups[rank]
+
+        task.add_done_callback(release)
     
     async def crawl_url(
         self,
@@ -231,10 +476,14 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
         task_id: str,
         retry_count: int = 0,
+        enqueue_time: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> CrawlerTaskResult:
         start_time = time.time()
+        wait_time = start_time - enqueue_time if enqueue_time else 0.0
         error_message = ""
         memory_usage = peak_memory = 0.0
+        deadline_exceeded = False
         
         # Select appropriate config for this URL
         selected_config = self.select_config(url, config)
@@ -266,6 +515,29 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 error_message=error_message,
                 retry_count=retry_count
             )
+
+        # Queued work is cancelled once the job deadline has passed
+        if self._deadline_passed(deadline):
+            error_message = "Deadline exceeded before the crawl started"
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    status=CrawlStatus.FAILED,
+                    error_message=error_message
+                )
+            return CrawlerTaskResult(
+                task_id=task_id,
+                url=url,
+                result=self._deadline_crawl_result(url, error_message),
+                memory_usage=0,
+                peak_memory=0,
+                start_time=start_time,
+                end_time=time.time(),
+                error_message=error_message,
+                retry_count=retry_count,
+                wait_time=wait_time,
+                deadline_exceeded=True,
+            )
         
         # Get starting memory for accurate measurement
         process = psutil.Process()
@@ -283,14 +555,15 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             self.concurrent_sessions += 1
             
             if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(url)
+                await self.rate_limiter.wait_if_needed(url, **self._robots_kwargs(selected_config))
                 
             # Check if we're in critical memory state
             if self.current_memory_percent >= self.critical_threshold_percent:
                 # Requeue this task with increased priority and retry count
                 enqueue_time = time.time()
                 priority = self._get_priority_score(enqueue_time - start_time, retry_count + 1)
-                await self.task_queue.put((priority, (url, task_id, retry_count + 1, enqueue_time)))
+                group_key = self._task_groups.get(task_id, (0, ""))
+                await self.task_queue.put((priority, group_key, (url, task_id, retry_count + 1, enqueue_time)))
                 
                 # Update monitoring
                 if self.monitor:
@@ -317,7 +590,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 )
             
             # Execute the crawl with selected config
-            result = await self.crawler.arun(url, config=selected_config, session_id=task_id)
+            result = await self._arun_within_deadline(url, selected_config, task_id, deadline)
+            deadline_exceeded = self._is_deadline_result(result)
             
             # Measure memory usage
             end_memory = process.memory_info().rss / (1024 * 1024)
@@ -368,7 +642,9 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             start_time=start_time,
             end_time=end_time,
             error_message=error_message,
-            retry_count=retry_count
+            retry_count=retry_count,
+            wait_time=wait_time,
+            deadline_exceeded=deadline_exceeded,
         )
         
     async def run_urls(
@@ -376,6 +652,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         urls: List[str],
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        deadline: Optional[float] = None,
     ) -> List[CrawlerTaskResult]:
         self.crawler = crawler
         
@@ -389,12 +666,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
 
         try:
             # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
+            await self._enqueue_urls(urls, config)
 
             active_tasks = []
 
@@ -407,18 +679,26 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                             t.cancel()
                         raise exc
 
-                # If memory pressure is low, greedily fill all available slots
-                if not self.memory_pressure_mode:
+                # If memory pressure is low, greedily fill all available slots.
+                # Past the deadline queued tasks resolve immediately, so drain them regardless.
+                if not self.memory_pressure_mode or self._deadline_passed(deadline):
                     slots = self.max_session_permit - len(active_tasks)
                     while slots > 0:
                         try:
                             # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
+                            item = self.task_queue.get_nowait()
+                            priority, group_key, (url, task_id, retry_count, enqueue_time) = item
+                            
+                            # Wait for a context to free up instead of opening another one
+                            if not self._can_open_context(group_key):
+                                self.task_queue.put_nowait(item)
+                                break
                             
                             # Create and start the task
                             task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
+                                self.crawl_url(url, config, task_id, retry_count, enqueue_time, deadline)
                             )
+                            self._track_group(task, group_key)
                             active_tasks.append(task)
                             
                             # Update waiting time in monitor
@@ -463,6 +743,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         finally:
             # Clean up
             memory_monitor.cancel()
+            self._task_groups.clear()
             if self.monitor:
                 self.monitor.stop()
             return results
@@ -482,7 +763,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             while not self.task_queue.empty() and time.time() - drain_start < 5.0:  # 5 second safety timeout
                 try:
                     # Get item from queue with timeout
-                    priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
+                    priority, group_key, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
                         self.task_queue.get(), timeout=0.1
                     )
                     
@@ -492,7 +773,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     new_priority = self._get_priority_score(wait_time, retry_count)
                     
                     # Store with updated priority
-                    temp_items.append((new_priority, (url, task_id, retry_count, enqueue_time)))
+                    temp_items.append((new_priority, group_key, (url, task_id, retry_count, enqueue_time)))
                     
                     # Update monitoring stats for this task
                     if self.monitor and task_id in self.monitor.stats:
@@ -508,7 +789,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         # Calculate queue statistics
         if temp_items and self.monitor:
             total_queued = len(temp_items)
-            wait_times = [item[1][3] for item in temp_items]
+            wait_times = [item[2][3] for item in temp_items]
             highest_wait_time = time.time() - min(wait_times) if wait_times else 0
             avg_wait_time = sum(time.time() - t for t in wait_times) / len(wait_times) if wait_times else 0
             
@@ -531,6 +812,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         urls: List[str],
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        deadline: Optional[float] = None,
     ) -> AsyncGenerator[CrawlerTaskResult, None]:
         self.crawler = crawler
         
@@ -542,12 +824,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             
         try:
             # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
+            await self._enqueue_urls(urls, config)
                 
             active_tasks = []
             completed_count = 0
@@ -560,18 +837,26 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                         for t in active_tasks:
                             t.cancel()
                         raise exc
-                # If memory pressure is low, greedily fill all available slots
-                if not self.memory_pressure_mode:
+                # If memory pressure is low, greedily fill all available slots.
+                # Past the deadline queued tasks resolve immediately, so drain them regardless.
+                if not self.memory_pressure_mode or self._deadline_passed(deadline):
                     slots = self.max_session_permit - len(active_tasks)
                     while slots > 0:
                         try:
                             # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
+                            item = self.task_queue.get_nowait()
+                            priority, group_key, (url, task_id, retry_count, enqueue_time) = item
+                            
+                            # Wait for a context to free up instead of opening another one
+                            if not self._can_open_context(group_key):
+                                self.task_queue.put_nowait(item)
+                                break
                             
                             # Create and start the task
                             task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
+                                self.crawl_url(url, config, task_id, retry_count, enqueue_time, deadline)
                             )
+                            self._track_group(task, group_key)
                             active_tasks.append(task)
                             
                             # Update waiting time in monitor
@@ -615,6 +900,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         finally:
             # Clean up
             memory_monitor.cancel()
+            self._task_groups.clear()
             if self.monitor:
                 self.monitor.stop()
                 
@@ -624,12 +910,14 @@ class SemaphoreDispatcher(BaseDispatcher):
         self,
         semaphore_count: int = 5,
         max_session_permit: int = 20,
+        group_by_context: bool = False,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
     ):
         super().__init__(rate_limiter, monitor)
         self.semaphore_count = semaphore_count
         self.max_session_permit = max_session_permit
+        self.group_by_context = group_by_context
 
     async def crawl_url(
         self,
@@ -637,10 +925,13 @@ class SemaphoreDispatcher(BaseDispatcher):
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
         task_id: str,
         semaphore: asyncio.Semaphore = None,
+        deadline: Optional[float] = None,
     ) -> CrawlerTaskResult:
         start_time = time.time()
+        wait_time = 0.0
         error_message = ""
         memory_usage = peak_memory = 0.0
+        deadline_exceeded = False
 
         # Select appropriate config for this URL
         selected_config = self.select_config(url, config)
@@ -679,12 +970,33 @@ class SemaphoreDispatcher(BaseDispatcher):
                 )
 
             if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(url)
+                await self.rate_limiter.wait_if_needed(url, **self._robots_kwargs(selected_config))
 
             async with semaphore:
+                # Time spent waiting for a slot is queue time, not execution time
+                wait_time = time.time() - start_time
+                start_time = time.time()
+                if self._deadline_passed(deadline):
+                    error_message = "Deadline exceeded before the crawl started"
+                    if self.monitor:
+                        self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
+                    return CrawlerTaskResult(
+                        task_id=task_id,
+                        url=url,
+                        result=self._deadline_crawl_result(url, error_message),
+                        memory_usage=0,
+                        peak_memory=0,
+                        start_time=start_time,
+                        end_time=time.time(),
+                        error_message=error_message,
+                        wait_time=wait_time,
+                        deadline_exceeded=True,
+                    )
+
                 process = psutil.Process()
                 start_memory = process.memory_info().rss / (1024 * 1024)
-                result = await self.crawler.arun(url, config=selected_config, session_id=task_id)
+                result = await self._arun_within_deadline(url, selected_config, task_id, deadline)
+                deadline_exceeded = self._is_deadline_result(result)
                 end_memory = process.memory_info().rss / (1024 * 1024)
 
                 memory_usage = peak_memory = end_memory - start_memory
@@ -703,6 +1015,7 @@ class SemaphoreDispatcher(BaseDispatcher):
                             start_time=start_time,
                             end_time=time.time(),
                             error_message=error_message,
+                            wait_time=wait_time,
                         )
 
                 if not result.success:
@@ -740,6 +1053,8 @@ class SemaphoreDispatcher(BaseDispatcher):
             start_time=start_time,
             end_time=end_time,
             error_message=error_message,
+            wait_time=wait_time,
+            deadline_exceeded=deadline_exceeded,
         )
 
     async def run_urls(
@@ -747,6 +1062,7 @@ class SemaphoreDispatcher(BaseDispatcher):
         crawler: AsyncWebCrawler,  # noqa: F821
         urls: List[str],
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        deadline: Optional[float] = None,
     ) -> List[CrawlerTaskResult]:
         self.crawler = crawler
         if self.monitor:
@@ -756,16 +1072,973 @@ class SemaphoreDispatcher(BaseDispatcher):
             semaphore = asyncio.Semaphore(self.semaphore_count)
             tasks = []
 
+            if self.group_by_context:
+                # Tasks acquire the semaphore in creation order
+                urls = [url for url, _ in self._group_urls(urls, config)]
+
             for url in urls:
                 task_id = str(uuid.uuid4())
                 if self.monitor:
                     self.monitor.add_task(task_id, url)
                 task = asyncio.create_task(
-                    self.crawl_url(url, config, task_id, semaphore)
+                    self.crawl_url(url, config, task_id, semaphore, deadline)
                 )
                 tasks.append(task)
 
             return await asyncio.gather(*tasks, return_exceptions=True)
         finally:
             if self.monitor:
-                self.monitor.stop()
\ No newline at end of file
+                self.monitor.stop()
+
+def _result_to_payload(result: CrawlResult) -> Dict[str, Any]:
+    """Convert a CrawlResult into a picklable dict for cross-process transfer."""
+    data = result.model_dump()
+    # `fit_html` is shadowed by a deprecated property and does not round-trip
+    data.pop("fit_html", None)
+    return data
+
+
+def _result_from_payload(data: Dict[str, Any]) -> CrawlResult:
+    return CrawlResult(**data)
+
+
+async def _process_worker_loop(
+    worker_id: int,
+    browser_config_data: Dict[str, Any],
+    crawler_strategy_factory: Optional[Callable[[], Any]],
+    task_queue,
+    result_queue,
+    max_session_permit: int,
+) -> None:
+    # Imported here to avoid a circular import at module load time
+    from .async_webcrawler import AsyncWebCrawler
+
+    browser_config = BrowserConfig.load(browser_config_data)
+    crawler_strategy = crawler_strategy_factory() if crawler_strategy_factory else None
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_session_permit)
+    configs: Dict[int, CrawlerRunConfig] = {}
+    active_tasks = set()
+
+    async def crawl_one(task_id: str, url: str, config_key: int, config_data: dict):
+        start_time = time.time()
+        error_message = ""
+        process = psutil.Process()
+        start_memory = process.memory_info().rss / (1024 * 1024)
+        try:
+            result_queue.put({"type": "started", "task_id": task_id, "worker_id": worker_id})
+            config = configs.get(config_key)
+            if config is None:
+                config = configs[config_key] = CrawlerRunConfig.load(config_data)
+            result = await crawler.arun(url, config=config)
+            if not result.success:
+                error_message = result.error_message or ""
+            payload = _result_to_payload(result)
+        except Exception as e:
+            error_message = str(e)
+            payload = _result_to_payload(
+                CrawlResult(url=url, html="", metadata={}, success=False, error_message=error_message)
+            )
+        finally:
+            semaphore.release()
+        memory_usage = process.memory_info().rss / (1024 * 1024) - start_memory
+        result_queue.put({
+            "type": "result",
+            "task_id": task_id,
+            "worker_id": worker_id,
+            "result": payload,
+            "memory_usage": memory_usage,
+            "peak_memory": memory_usage,
+            "start_time": start_time,
+            "end_time": time.time(),
+            "error_message": error_message,
+        })
+
+    async with AsyncWebCrawler(config=browser_config, crawler_strategy=crawler_strategy) as crawler:
+        while True:
+            await semaphore.acquire()
+            item = await loop.run_in_executor(None, task_queue.get)
+            if item is None:
+                semaphore.release()
+                break
+            task = asyncio.create_task(crawl_one(*item))
+            active_tasks.add(task)
+            task.add_done_callback(active_tasks.discard)
+        if active_tasks:
+            await asyncio.gather(*active_tasks, return_exceptions=True)
+
+
+def _process_worker_main(
+    worker_id: int,
+    browser_config_data: Dict[str, Any],
+    crawler_strategy_factory: Optional[Callable[[], Any]],
+    task_queue,
+    result_queue,
+    max_session_permit: int,
+) -> None:
+    """Entry point of a MultiProcessDispatcher worker process."""
+    try:
+        asyncio.run(
+            _process_worker_loop(
+                worker_id,
+                browser_config_data,
+                crawler_strategy_factory,
+                task_queue,
+                result_queue,
+                max_session_permit,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+class MultiProcessDispatcher(BaseDispatcher):
+    """
+    Shards URLs across several worker processes on one host.
+
+    Each worker process runs its own event loop and its own AsyncWebCrawler (and
+    therefore its own browser), so CPU-heavy post-processing such as scraping,
+    markdown generation and extraction scales past a single core. The parent
+    process owns the queue, the rate limiter and the monitor, so rate limits are
+    enforced globally across all workers. `run_urls` returns results in input
+    order; `run_urls_stream` yields them in order of completion.
+
+    Each worker has its own task queue, so the parent knows which tasks every
+    worker holds. When a worker dies, tasks it had not started yet are handed to
+    another worker, and tasks it was crawling fail.
+
+    Configs are shipped to the workers with `CrawlerRunConfig.dump()`, so they
+    must be serializable the same way they are for the Docker API. Config
+    selection via `url_matcher` happens in the parent process.
+
+    Example:
+        ```python
+        dispatcher = MultiProcessDispatcher(num_workers=8, max_session_permit=4)
+        results = await crawler.arun_many(urls, config=run_config, dispatcher=dispatcher)
+        ```
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        max_session_permit: int = 5,
+        browser_config: Optional[BrowserConfig] = None,
+        crawler_strategy_factory: Optional[Callable[[], Any]] = None,
+        start_method: str = "spawn",
+        shutdown_timeout: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        monitor: Optional[CrawlerMonitor] = None,
+    ):
+        """
+        Args:
+            num_workers: Number of worker processes. Defaults to the number of CPUs.
+            max_session_permit: Maximum number of concurrent crawls inside each worker.
+            browser_config: Browser configuration for the workers. Defaults to the
+                            browser config of the crawler passed to `run_urls`.
+            crawler_strategy_factory: Optional picklable, module-level callable returning
+                                      the crawler strategy each worker should use
+                                      (e.g. an AsyncHTTPCrawlerStrategy). If None the
+                                      default Playwright strategy is used.
+            start_method: multiprocessing start method. "spawn" is the safe choice
+                          with browsers and event loops.
+            shutdown_timeout: Seconds to wait for workers to exit before terminating them.
+            rate_limiter: Rate limiter shared by all workers (enforced in the parent).
+            monitor: Optional CrawlerMonitor, updated from the parent process.
+        """
+        super().__init__(rate_limiter, monitor)
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.max_session_permit = max_session_permit
+        self.browser_config = browser_config
+        self.crawler_strategy_factory = crawler_strategy_factory
+        self.start_method = start_method
+        self.shutdown_timeout = shutdown_timeout
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._result_queue = None
+        self._workers: Dict[int, multiprocessing.Process] = {}
+        self._task_queues: Dict[int, Any] = {}
+        self._next_worker_id = 0
+        self._browser_config_data: Optional[Dict[str, Any]] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Per worker, the queue items of the tasks sent to it and not yet answered
+        self._outstanding: Dict[int, Dict[str, tuple]] = {}
+        self._started: set = set()
+        self._config_payloads: Dict[int, Tuple[CrawlerRunConfig, dict]] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _spawn_worker(self) -> None:
+        worker_id = self._next_worker_id
+        self._next_worker_id += 1
+        task_queue = self._mp_context.Queue()
+        process = self._mp_context.Process(
+            target=_process_worker_main,
+            args=(
+                worker_id,
+                self._browser_config_data,
+                self.crawler_strategy_factory,
+                task_queue,
+                self._result_queue,
+                self.max_session_permit,
+            ),
+            daemon=True,
+        )
+        process.start()
+        self._workers[worker_id] = process
+        self._task_queues[worker_id] = task_queue
+        self._outstanding[worker_id] = {}
+
+    def _submit(self, task_id: str, item: tuple) -> None:
+        """Send a task to the worker with the fewest outstanding tasks."""
+        worker_id = min(self._workers, key=lambda w: len(self._outstanding[w]))
+        self._outstanding[worker_id][task_id] = item
+        self._task_queues[worker_id].put(item)
+
+    def _config_payload(self, config: CrawlerRunConfig) -> Tuple[int, dict]:
+        key = id(config)
+        if key not in self._config_payloads:
+            # Keep a reference to the config so its id() stays unique for the run
+            self._config_payloads[key] = (config, config.dump())
+        return key, self._config_payloads[key][1]
+
+    def _get_message(self) -> Optional[dict]:
+        try:
+            return self._result_queue.get(timeout=0.2)
+        except queue.Empty:
+            return None
+
+    def _handle_dead_workers(self) -> None:
+        """Replace crashed workers, re-queue their unstarted tasks and fail the started ones."""
+        for worker_id, process in list(self._workers.items()):
+            if process.is_alive():
+                continue
+            del self._workers[worker_id]
+            task_queue = self._task_queues.pop(worker_id)
+            task_queue.cancel_join_thread()
+            task_queue.close()
+            outstanding = self._outstanding.pop(worker_id)
+            if self._pending:
+                self._spawn_worker()
+            for task_id, item in outstanding.items():
+                future = self._pending.get(task_id)
+                if future is None or future.done():
+                    continue
+                if task_id not in self._started:
+                    self._submit(task_id, item)
+                    continue
+                # The task may be what crashed the worker, so it is not retried
+                self._started.discard(task_id)
+                del self._pending[task_id]
+                future.set_exception(
+                    RuntimeError(
+                        f"Worker process {worker_id} exited unexpectedly "
+                        f"(exit code {process.exitcode})"
+                    )
+                )
+
+    async def _read_results(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await loop.run_in_executor(None, self._get_message)
+            if message is None:
+                self._handle_dead_workers()
+                continue
+            task_id = message["task_id"]
+            if message["type"] == "started":
+                self._started.add(task_id)
+                continue
+            self._started.discard(task_id)
+            self._outstanding.get(message["worker_id"], {}).pop(task_id, None)
+            future = self._pending.pop(task_id, None)
+            if future and not future.done():
+                future.set_result(message)
+
+    async def crawl_url(
+        self,
+        url: str,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        task_id: str,
+        deadline: Optional[float] = None,
+    ) -> CrawlerTaskResult:
+        start_time = time.time()
+        error_message = ""
+        memory_usage = peak_memory = 0.0
+        deadline_exceeded = False
+
+        selected_config = self.select_config(url, config)
+        if selected_config is None:
+            error_message = f"No matching configuration found for URL: {url}"
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    status=CrawlStatus.FAILED,
+                    error_message=error_message
+                )
+            return CrawlerTaskResult(
+                task_id=task_id,
+                url=url,
+                result=CrawlResult(
+                    url=url,
+                    html="",
+                    metadata={"status": "no_config_match"},
+                    success=False,
+                    error_message=error_message
+                ),
+                memory_usage=0,
+                peak_memory=0,
+                start_time=start_time,
+                end_time=time.time(),
+                error_message=error_message
+            )
+
+        try:
+            async with self._slots:
+                if self.rate_limiter:
+                    await self.rate_limiter.wait_if_needed(url, **self._robots_kwargs(selected_config))
+
+                # Queued work is cancelled once the job deadline has passed
+                if self._deadline_passed(deadline):
+                    raise asyncio.TimeoutError("Deadline exceeded before the crawl started")
+
+                if self.monitor:
+                    self.monitor.update_task(
+                        task_id,
+                        status=CrawlStatus.IN_PROGRESS,
+                        start_time=time.time(),
+                        wait_time=time.time() - start_time,
+                    )
+
+                config_key, config_data = self._config_payload(selected_config)
+                future = asyncio.get_running_loop().create_future()
+                self._pending[task_id] = future
+                self._submit(task_id, (task_id, url, config_key, config_data))
+                remaining = self._time_remaining(deadline)
+                # Past the deadline the worker's result, if it ever arrives, is dropped
+                message = await asyncio.wait_for(
+                    future, None if remaining is None else max(remaining, 0)
+                )
+
+            result = _result_from_payload(message["result"])
+            memory_usage = message["memory_usage"]
+            peak_memory = message["peak_memory"]
+            error_message = message["error_message"]
+
+            if self.rate_limiter and result.status_code:
+                if not self.rate_limiter.update_delay(url, result.status_code):
+                    error_message = f"Rate limit retry count exceeded for domain {urlparse(url).netloc}"
+
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    status=CrawlStatus.COMPLETED if result.success and not error_message else CrawlStatus.FAILED,
+                )
+
+        except asyncio.TimeoutError as e:
+            error_message = str(e) or "Deadline exceeded during the crawl"
+            deadline_exceeded = True
+            if self.monitor:
+                self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
+            result = self._deadline_crawl_result(url, error_message)
+
+        except Exception as e:
+            error_message = str(e)
+            if self.monitor:
+                self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
+            result = CrawlResult(
+                url=url, html="", metadata={}, success=False, error_message=error_message
+            )
+
+        finally:
+            self._pending.pop(task_id, None)
+            end_time = time.time()
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    end_time=end_time,
+                    memory_usage=memory_usage,
+                    peak_memory=peak_memory,
+                    error_message=error_message,
+                )
+
+        return CrawlerTaskResult(
+            task_id=task_id,
+            url=url,
+            result=result,
+            memory_usage=memory_usage,
+            peak_memory=peak_memory,
+            start_time=start_time,
+            end_time=end_time,
+            error_message=error_message,
+            deadline_exceeded=deadline_exceeded,
+        )
+
+    async def _start_workers(self, crawler: AsyncWebCrawler) -> None:
+        browser_config = self.browser_config or getattr(crawler, "browser_config", None) or BrowserConfig()
+        self._browser_config_data = browser_config.dump()
+        self._result_queue = self._mp_context.Queue()
+        self._slots = asyncio.Semaphore(self.num_workers * self.max_session_permit)
+        for _ in range(self.num_workers):
+            self._spawn_worker()
+
+    async def _stop_workers(self) -> None:
+        for task_queue in self._task_queues.values():
+            task_queue.put(None)
+        deadline = time.time() + self.shutdown_timeout
+        for process in self._workers.values():
+            remaining = max(0.0, deadline - time.time())
+            await asyncio.get_running_loop().run_in_executor(None, process.join, remaining)
+            if process.is_alive():
+                process.terminate()
+        self._workers.clear()
+        self._task_queues.clear()
+        self._pending.clear()
+        self._outstanding.clear()
+        self._started.clear()
+        self._config_payloads.clear()
+
+    async def _run_indexed(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        deadline: Optional[float] = None,
+    ) -> AsyncGenerator[Tuple[int, CrawlerTaskResult], None]:
+        """Yield (input position, result) pairs in order of completion."""
+        self.crawler = crawler
+        if self.monitor:
+            self.monitor.start()
+
+        async def indexed(index: int, url: str, task_id: str):
+            return index, await self.crawl_url(url, config, task_id, deadline)
+
+        await self._start_workers(crawler)
+        reader = asyncio.create_task(self._read_results())
+        tasks = []
+        try:
+            for index, url in enumerate(urls):
+                task_id = str(uuid.uuid4())
+                if self.monitor:
+                    self.monitor.add_task(task_id, url)
+                tasks.append(asyncio.create_task(indexed(index, url, task_id)))
+
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            reader.cancel()
+            await self._stop_workers()
+            if self.monitor:
+                self.monitor.stop()
+
+    async def run_urls_stream(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        deadline: Optional[float] = None,
+    ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        # aclosing() stops the workers as soon as the caller stops iterating
+        async with aclosing(self._run_indexed(urls, crawler, config, deadline)) as results:
+            async for _, result in results:
+                yield result
+
+    async def run_urls(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        deadline: Optional[float] = None,
+    ) -> List[CrawlerTaskResult]:
+        results: List[Optional[CrawlerTaskResult]] = [None] * len(urls)
+        async with aclosing(self._run_indexed(urls, crawler, config, deadline)) as indexed:
+            async for index, result in indexed:
+                results[index] = result
+        return results
+
+
+class RedisQueueDispatcher(BaseDispatcher):
+    """
+    Cooperatively crawls one job across any number of processes and hosts.
+
+    URLs are pushed to a Redis stream and consumed through a consumer group,
+    so every `AsyncWebCrawler` pointed at the same `job_id` pulls work from the
+    same queue. A claimed URL stays invisible to other workers while it is being
+    crawled; if a worker dies without acknowledging it, the entry becomes
+    claimable again after `visibility_timeout` seconds. URLs delivered more than
+    `max_deliveries` times are reported as failed. Every result (from any
+    worker) is appended to a results stream that can be read with
+    `read_results()`.
+
+    Any node can submit URLs by passing them to `arun_many`; nodes that only
+    help out call `arun_many([], dispatcher=...)` and work until the job is
+    complete. Configs are shipped via `CrawlerRunConfig.dump()`, so they must be
+    serializable. Requires the `redis` package.
+
+    Example:
+        ```python
+        dispatcher = RedisQueueDispatcher("redis://queue:6379/0", job_id="news-2024")
+        # submitting node
+        results = await crawler.arun_many(urls, config=run_config, dispatcher=dispatcher)
+        # any other node
+        results = await crawler.arun_many([], dispatcher=dispatcher)
+        ```
+    """
+
+    GROUP_NAME = "workers"
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        redis_client: Optional[Any] = None,
+        job_id: str = "default",
+        key_prefix: str = "crawl4ai",
+        max_session_permit: int = 10,
+        visibility_timeout: float = 300.0,
+        max_deliveries: int = 3,
+        poll_interval: float = 1.0,
+        consumer_name: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        monitor: Optional[CrawlerMonitor] = None,
+    ):
+        """
+        Args:
+            redis_url: Redis connection URL, used when `redis_client` is not given.
+            redis_client: Existing `redis.asyncio.Redis` client to use.
+            job_id: Identifier shared by all workers cooperating on one job.
+            key_prefix: Prefix for all Redis keys used by the dispatcher.
+            max_session_permit: Maximum concurrent crawls in this process.
+            visibility_timeout: Seconds after which an unacknowledged URL is
+                                handed to another worker.
+            max_deliveries: Maximum number of times a URL is handed out before
+                            it is reported as failed.
+            poll_interval: Seconds to block waiting for new work.
+            consumer_name: Name of this worker in the consumer group. Defaults to
+                           host name, pid and a random suffix.
+            rate_limiter: Per-process rate limiter.
+            monitor: Optional CrawlerMonitor for URLs crawled by this process.
+        """
+        super().__init__(rate_limiter, monitor)
+        self.redis_url = redis_url
+        self.redis = redis_client
+        self._owns_client = redis_client is None
+        self.job_id = job_id
+        self.key_prefix = key_prefix
+        self.max_session_permit = max_session_permit
+        self.visibility_timeout = visibility_timeout
+        self.max_deliveries = max_deliveries
+        self.poll_interval = poll_interval
+        self.consumer_name = consumer_name or (
+            f"{os.uname().nodename if hasattr(os, 'uname') else 'host'}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        )
+        self._configs: Dict[str, CrawlerRunConfig] = {}
+        # Where the current XAUTOCLAIM scan of the pending list resumes, and when
+        # the next scan may start once it has gone through the whole list
+        self._reclaim_cursor = "0-0"
+        self._next_reclaim = 0.0
+
+    def _key(self, name: str) -> str:
+        return f"{self.key_prefix}:{self.job_id}:{name}"
+
+    @staticmethod
+    def _text(value: Any) -> Any:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def _fields(self, fields: Dict[Any, Any]) -> Dict[str, str]:
+        return {self._text(k): self._text(v) for k, v in fields.items()}
+
+    async def _get_redis(self):
+        if self.redis is None:
+            try:
+                from redis import asyncio as aioredis
+            except ImportError:
+                raise ImportError(
+                    "RedisQueueDispatcher requires the 'redis' package. "
+                    "Install it with: pip install redis"
+                )
+            self.redis = aioredis.from_url(self.redis_url, decode_responses=True)
+            self._owns_client = True
+        return self.redis
+
+    async def close(self) -> None:
+        """Close the Redis client if it was created by the dispatcher."""
+        if self.redis is not None and self._owns_client:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def _ensure_group(self) -> None:
+        redis = await self._get_redis()
+        try:
+            await redis.xgroup_create(self._key("tasks"), self.GROUP_NAME, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    @staticmethod
+    def _encode_result(result: CrawlResult) -> str:
+        data = _result_to_payload(result)
+        # Raw bytes (the PDF, a screenshot_output="bytes" screenshot) travel base64-encoded;
+        # their names are listed so base64 or path screenshots are left alone on decode
+        binary = [name for name in ("pdf", "screenshot") if isinstance(data.get(name), bytes)]
+        for name in binary:
+            data[name] = b64encode(data[name]).decode("utf-8")
+        data["_binary_fields"] = binary
+        return json.dumps(data, default=str)
+
+    @staticmethod
+    def _decode_result(payload: str) -> CrawlResult:
+        data = json.loads(payload)
+        for name in data.pop("_binary_fields"):
+            data[name] = b64decode(data[name])
+        if data.get("ssl_certificate") is not None:
+            data["ssl_certificate"] = SSLCertificate(data["ssl_certificate"])
+        return _result_from_payload(data)
+
+    async def enqueue(
+        self,
+        urls: List[str],
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> List[str]:
+        """
+        Submit URLs to the shared queue.
+
+        URLs without a matching config are reported as failed right away.
+
+        Returns:
+            The task ids of the submitted URLs.
+        """
+        redis = await self._get_redis()
+        await self._ensure_group()
+
+        task_ids = []
+        pipe = redis.pipeline(transaction=True)
+        # Count first so no worker can observe done >= total mid-submission
+        pipe.incrby(self._key("total"), len(urls))
+        config_payloads: Dict[int, str] = {}
+        for url in urls:
+            task_id = str(uuid.uuid4())
+            task_ids.append(task_id)
+            selected_config = self.select_config(url, config)
+            if selected_config is None:
+                error_message = f"No matching configuration found for URL: {url}"
+                result = CrawlResult(
+                    url=url,
+                    html="",
+                    metadata={"status": "no_config_match"},
+                    success=False,
+                    error_message=error_message,
+                )
+                pipe.xadd(self._key("results"), {
+                    "task_id": task_id, "url": url, "worker": self.consumer_name,
+                    "result": self._encode_result(result),
+                })
+                pipe.incr(self._key("done"))
+                continue
+
+            if id(selected_config) not in config_payloads:
+                config_payloads[id(selected_config)] = json.dumps(selected_config.dump())
+            payload = config_payloads[id(selected_config)]
+            config_key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            pipe.hset(self._key("configs"), config_key, payload)
+            pipe.xadd(self._key("tasks"), {"task_id": task_id, "url": url, "config": config_key})
+        await pipe.execute()
+        return task_ids
+
+    async def is_complete(self) -> bool:
+        """Whether every submitted URL of the job has a result."""
+        redis = await self._get_redis()
+        total, done = await redis.mget(self._key("total"), self._key("done"))
+        total, done = int(total or 0), int(done or 0)
+        return total > 0 and done >= total
+
+    async def _load_config(self, config_key: str) -> CrawlerRunConfig:
+        if config_key not in self._configs:
+            redis = await self._get_redis()
+            payload = await redis.hget(self._key("configs"), config_key)
+            self._configs[config_key] = CrawlerRunConfig.load(json.loads(self._text(payload)))
+        return self._configs[config_key]
+
+    async def _publish(self, entry_id: str, task_id: str, url: str, result: CrawlResult) -> None:
+        redis = await self._get_redis()
+        # An entry reclaimed by another worker may be finished twice; whoever acks it
+        # first publishes, so `done` is bumped once per task
+        if not await redis.xack(self._key("tasks"), self.GROUP_NAME, entry_id):
+            return
+        pipe = redis.pipeline(transaction=True)
+        pipe.xadd(self._key("results"), {
+            "task_id": task_id, "url": url, "worker": self.consumer_name,
+            "result": self._encode_result(result),
+        })
+        pipe.incr(self._key("done"))
+        await pipe.execute()
+
+    async def _reclaim(self, count: int) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Take over entries whose visibility timeout expired.
+
+        Entries only expire after visibility_timeout, so once a scan has gone through
+        the whole pending list the next one starts half a timeout later.
+        """
+        if time.time() < self._next_reclaim:
+            return []
+        redis = await self._get_redis()
+        reply = await redis.xautoclaim(
+            self._key("tasks"),
+            self.GROUP_NAME,
+            self.consumer_name,
+            min_idle_time=int(self.visibility_timeout * 1000),
+            start_id=self._reclaim_cursor,
+            count=count,
+        )
+        self._reclaim_cursor = self._text(reply[0])
+        if self._reclaim_cursor == "0-0":
+            self._next_reclaim = time.time() + self.visibility_timeout / 2
+        claimed = [(self._text(entry_id), self._fields(fields)) for entry_id, fields in reply[1] if fields is not None]
+        if not claimed:
+            return []
+        # One XPENDING over the claimed range; other entries this worker holds may fall inside it
+        pending = await redis.xpending_range(
+            self._key("tasks"),
+            self.GROUP_NAME,
+            min=claimed[0][0],
+            max=claimed[-1][0],
+            count=len(claimed) + self.max_session_permit,
+            consumername=self.consumer_name,
+        )
+        delivered = {self._text(p["message_id"]): p["times_delivered"] for p in pending}
+        entries = []
+        for entry_id, fields in claimed:
+            deliveries = delivered.get(entry_id, 1)
+            if deliveries > self.max_deliveries:
+                error_message = f"Gave up after {deliveries - 1} deliveries without acknowledgement"
+                await self._publish(
+                    entry_id,
+                    fields["task_id"],
+                    fields["url"],
+                    CrawlResult(url=fields["url"], html="", metadata={}, success=False, error_message=error_message),
+                )
+                continue
+            entries.append((entry_id, fields))
+        return entries
+
+    async def _read_new(self, count: int, block: bool = True) -> List[Tuple[str, Dict[str, str]]]:
+        redis = await self._get_redis()
+        reply = await redis.xreadgroup(
+            self.GROUP_NAME,
+            self.consumer_name,
+            {self._key("tasks"): ">"},
+            count=count,
+            block=int(self.poll_interval * 1000) if block else None,
+        )
+        entries = []
+        for _, messages in reply or []:
+            for entry_id, fields in messages:
+                entries.append((self._text(entry_id), self._fields(fields)))
+        return entries
+
+    async def _heartbeat(self, entry_ids: List[str]) -> None:
+        """Reset the idle time of in-flight entries so they stay invisible."""
+        if not entry_ids:
+            return
+        redis = await self._get_redis()
+        await redis.xclaim(
+            self._key("tasks"),
+            self.GROUP_NAME,
+            self.consumer_name,
+            min_idle_time=0,
+            message_ids=entry_ids,
+            justid=True,
+        )
+
+    async def crawl_url(
+        self,
+        url: str,
+        config: CrawlerRunConfig,
+        task_id: str,
+    ) -> CrawlerTaskResult:
+        start_time = time.time()
+        error_message = ""
+        memory_usage = peak_memory = 0.0
+
+        try:
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id, status=CrawlStatus.IN_PROGRESS, start_time=start_time
+                )
+            if self.rate_limiter:
+                await self.rate_limiter.wait_if_needed(url, **self._robots_kwargs(config))
+
+            process = psutil.Process()
+            start_memory = process.memory_info().rss / (1024 * 1024)
+            result = await self.crawler.arun(url, config=config, session_id=task_id)
+            end_memory = process.memory_info().rss / (1024 * 1024)
+            memory_usage = peak_memory = end_memory - start_memory
+
+            if self.rate_limiter and result.status_code:
+                if not self.rate_limiter.update_delay(url, result.status_code):
+                    error_message = f"Rate limit retry count exceeded for domain {urlparse(url).netloc}"
+
+            if not result.success and not error_message:
+                error_message = result.error_message or ""
+
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    status=CrawlStatus.COMPLETED if result.success and not error_message else CrawlStatus.FAILED,
+                )
+
+        except Exception as e:
+            error_message = str(e)
+            if self.monitor:
+                self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
+            result = CrawlResult(
+                url=url, html="", metadata={}, success=False, error_message=error_message
+            )
+
+        finally:
+            end_time = time.time()
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    end_time=end_time,
+                    memory_usage=memory_usage,
+                    peak_memory=peak_memory,
+                    error_message=error_message,
+                )
+
+        return CrawlerTaskResult(
+            task_id=task_id,
+            url=url,
+            result=result,
+            memory_usage=memory_usage,
+            peak_memory=peak_memory,
+            start_time=start_time,
+            end_time=end_time,
+            error_message=error_message,
+        )
+
+    async def _process_entry(self, entry_id: str, fields: Dict[str, str]) -> CrawlerTaskResult:
+        task_id, url = fields["task_id"], fields["url"]
+        try:
+            config = await self._load_config(fields["config"])
+        except Exception as e:
+            error_message = f"Failed to load config: {e}"
+            now = time.time()
+            task_result = CrawlerTaskResult(
+                task_id=task_id,
+                url=url,
+                result=CrawlResult(url=url, html="", metadata={}, success=False, error_message=error_message),
+                memory_usage=0,
+                peak_memory=0,
+                start_time=now,
+                end_time=now,
+                error_message=error_message,
+            )
+        else:
+            task_result = await self.crawl_url(url, config, task_id)
+        await self._publish(entry_id, task_id, url, task_result.result)
+        return task_result
+
+    async def run_urls_stream(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Optional[Union[CrawlerRunConfig, List[CrawlerRunConfig]]] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        """
+        Submit `urls` (if any) and work on the shared job until it is complete.
+
+        Yields the results crawled by this process; use `read_results()` to
+        consume the results of all workers.
+        """
+        if deadline is not None:
+            # The job outlives any one process, so a per-call deadline has nothing to bound
+            raise ValueError("RedisQueueDispatcher does not support deadline")
+        self.crawler = crawler
+        await self._ensure_group()
+        if urls:
+            await self.enqueue(urls, config)
+
+        if self.monitor:
+            self.monitor.start()
+
+        in_flight: Dict[asyncio.Task, str] = {}
+        heartbeat_interval = self.visibility_timeout / 3
+        last_heartbeat = time.time()
+        try:
+            while True:
+                free = self.max_session_permit - len(in_flight)
+                if free > 0:
+                    entries = await self._reclaim(free)
+                    if len(entries) < free:
+                        # Only block on Redis when there is nothing to wait for locally
+                        entries += await self._read_new(free - len(entries), block=not in_flight)
+                    for entry_id, fields in entries:
+                        if self.monitor:
+                            self.monitor.add_task(fields["task_id"], fields["url"])
+                        task = asyncio.create_task(self._process_entry(entry_id, fields))
+                        in_flight[task] = entry_id
+
+                if in_flight:
+                    done, _ = await asyncio.wait(
+                        in_flight,
+                        timeout=self.poll_interval,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        in_flight.pop(task)
+                        yield task.result()
+                elif await self.is_complete():
+                    break
+
+                if in_flight and time.time() - last_heartbeat >= heartbeat_interval:
+                    await self._heartbeat(list(in_flight.values()))
+                    last_heartbeat = time.time()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if self.monitor:
+                self.monitor.stop()
+
+    async def run_urls(
+        self,
+        urls: List[str],
+        crawler: AsyncWebCrawler,
+        config: Optional[Union[CrawlerRunConfig, List[CrawlerRunConfig]]] = None,
+        deadline: Optional[float] = None,
+    ) -> List[CrawlerTaskResult]:
+        return [
+            result
+            async for result in self.run_urls_stream(
+                urls=urls, crawler=crawler, config=config, deadline=deadline
+            )
+        ]
+
+    async def read_results(
+        self, last_id: str = "0-0", follow: bool = False
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Read results of all workers from the results stream.
+
+        Args:
+            last_id: Stream id to start after. "0-0" reads from the beginning.
+            follow: Keep waiting for new results until the job is complete.
+        """
+        redis = await self._get_redis()
+        while True:
+            reply = await redis.xread(
+                {self._key("results"): last_id},
+                count=100,
+                block=int(self.poll_interval * 1000) if follow else None,
+            )
+            if not reply:
+                if not follow:
+                    break
+                if await self.is_complete():
+                    # Results are written before `done` is bumped; drain what is left
+                    follow = False
+                continue
+            for _, messages in reply:
+                for entry_id, fields in messages:
+                    last_id = self._text(entry_id)
+                    fields = self._fields(fields)
+                    yield self._decode_result(fields["result"])
@@ -6,6 +6,9 @@ from pathlib import Path
 from typing import Optional, List
 import json
 import asyncio
+import base64
+import hashlib
+import aiofiles
 
 # from contextlib import nullcontext, asynccontextmanager
 from contextlib import asynccontextmanager
@@ -15,6 +18,7 @@ from .models import (
     DispatchResult,
     ScrapingResult,
     CrawlResultContainer,
+    Links,
     RunManyReturn
 )
 from .async_database import async_db_manager
@@ -39,6 +43,7 @@ from .async_configs import BrowserConfig, CrawlerRunConfig, ProxyConfig, Seeding
 from .async_dispatcher import *  # noqa: F403
 from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter
 from .async_url_seeder import AsyncUrlSeeder
+from .link_preview import LinkPreview
 
 from .utils import (
     sanitize_input_encode,
@@ -166,6 +171,7 @@ class AsyncWebCrawler:
         self.arun = self._deep_handler(self.arun)
         
         self.url_seeder: Optional[AsyncUrlSeeder] = None
+        self.link_preview: Optional[LinkPreview] = None
 
     async def start(self):
         """
@@ -189,6 +195,13 @@ class AsyncWebCrawler:
         2. Close any open pages and contexts
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        await self.robots_parser.close()
+        if self.link_preview:
+            await self.link_preview.close()
+            self.link_preview = None
+        if self.url_seeder:
+            await self.url_seeder.close()
+            self.url_seeder = None
 
     async def __aenter__(self):
         return await self.start()
@@ -379,6 +392,7 @@ class AsyncWebCrawler:
                     # Add captured network and console data if available
                     crawl_result.network_requests = async_response.network_requests
                     crawl_result.console_messages = async_response.console_messages
+                    crawl_result.fetch_strategy = async_response.fetch_strategy
 
                     crawl_result.success = bool(html)
                     crawl_result.session_id = getattr(
@@ -395,6 +409,10 @@ class AsyncWebCrawler:
                     if cache_context.should_write() and not bool(cached_result):
                         await async_db_manager.acache_url(crawl_result)
 
+                    # The cache always holds base64; convert only what is returned
+                    crawl_result.screenshot = await self._deliver_screenshot(
+                        crawl_result.screenshot, config, url
+                    )
                     return CrawlResultContainer(crawl_result)
 
                 else:
@@ -408,6 +426,9 @@ class AsyncWebCrawler:
                     cached_result.session_id = getattr(
                         config, "session_id", None)
                     cached_result.redirected_url = cached_result.redirected_url or url
+                    cached_result.screenshot = await self._deliver_screenshot(
+                        cached_result.screenshot, config, url
+                    )
                     return CrawlResultContainer(cached_result)
 
             except Exception as e:
@@ -432,6 +453,40 @@ class AsyncWebCrawler:
                     )
                 )
 
+    async def _deliver_screenshot(
+        self, screenshot: Optional[str], config: CrawlerRunConfig, url: str
+    ):
+        """
+        Convert a base64 screenshot to the form requested by config.screenshot_output.
+
+        Returns the base64 string unchanged for "base64", the decoded image bytes for
+        "bytes", or the path of the written image file for "file".
+        """
+        output = config.screenshot_output or "base64"
+        if not screenshot or output == "base64":
+            return screenshot
+        if output not in ("bytes", "file"):
+            raise ValueError(
+                f"Invalid screenshot_output '{output}', expected 'base64', 'bytes' or 'file'"
+            )
+        image = base64.b64decode(screenshot)
+        if output == "bytes":
+            return image
+
+        if image.startswith(b"\x89PNG"):
+            ext = "png"
+        elif image[:4] == b"RIFF" and image[8:12] == b"WEBP":
+            ext = "webp"
+        else:
+            ext = "jpg"
+        directory = config.screenshot_path or os.path.join(self.crawl4ai_folder, "screenshots")
+        os.makedirs(directory, exist_ok=True)
+        name = hashlib.sha256(f"{url}:{time.time_ns()}".encode()).hexdigest()[:24]
+        path = os.path.join(directory, f"{name}.{ext}")
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(image)
+        return path
+
     async def aprocess_html(
         self,
         url: str,
@@ -512,6 +567,12 @@ class AsyncWebCrawler:
             links = result.links.model_dump() if hasattr(result.links, 'model_dump') else result.links
             metadata = result.metadata
 
+        ################################
+        # Link Preview                 #
+        ################################
+        if config.link_preview_config is not None:
+            links = await self._preview_links(links, config)
+
         fit_html = preprocess_html_for_schema(html_content=html, text_threshold= 500, max_size= 300_000)
 
         ################################
@@ -667,6 +728,7 @@ class AsyncWebCrawler:
         urls: List[str],
         config: Optional[Union[CrawlerRunConfig, List[CrawlerRunConfig]]] = None,
         dispatcher: Optional[BaseDispatcher] = None,
+        deadline: Optional[float] = None,
         # Legacy parameters maintained for backwards compatibility
         # word_count_threshold=MIN_WORD_THRESHOLD,
         # extraction_strategy: ExtractionStrategy = None,
@@ -690,6 +752,10 @@ class AsyncWebCrawler:
             - Single CrawlerRunConfig: Used for all URLs
             - List[CrawlerRunConfig]: Configs with url_matcher for URL-specific settings
         dispatcher: The dispatcher strategy instance to use. Defaults to MemoryAdaptiveDispatcher
+        deadline: Optional time budget in seconds for the whole batch. Crawls still running
+            when it expires are cancelled, URLs not yet started are skipped, and both come
+            back as failed results with metadata["status"] == "deadline_exceeded" and
+            dispatch_result.deadline_exceeded set.
         [other parameters maintained for backwards compatibility]
 
         Returns:
@@ -748,6 +814,9 @@ class AsyncWebCrawler:
                         start_time=task_result.start_time,
                         end_time=task_result.end_time,
                         error_message=task_result.error_message,
+                        queue_wait_time=task_result.wait_time,
+                        execution_time=max(0.0, task_result.end_time - task_result.start_time),
+                        deadline_exceeded=task_result.deadline_exceeded,
                     ),
                 )
                 or task_result.result
@@ -759,19 +828,75 @@ class AsyncWebCrawler:
         else:
             stream = config.stream
 
+        # Passed per call rather than stored on the dispatcher, which may be shared
+        run_kwargs = {} if deadline is None else {"deadline": time.time() + deadline}
+
         if stream:
 
             async def result_transformer():
                 async for task_result in dispatcher.run_urls_stream(
-                    crawler=self, urls=urls, config=config
+                    crawler=self, urls=urls, config=config, **run_kwargs
                 ):
                     yield transform_result(task_result)
 
             return result_transformer()
         else:
-            _results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
+            _results = await dispatcher.run_urls(
+                crawler=self, urls=urls, config=config, **run_kwargs
+            )
             return [transform_result(res) for res in _results]
 
+    def _get_url_seeder(self) -> AsyncUrlSeeder:
+        """Return the crawler's AsyncUrlSeeder, creating it on first use."""
+        if not self.url_seeder:
+            # Pass the crawler's base_directory for seeder's cache management
+            # Pass the crawler's logger for consistent logging
+            self.url_seeder = AsyncUrlSeeder(
+                base_directory=self.crawl4ai_folder,
+                logger=self.logger
+            )
+        return self.url_seeder
+
+    async def _preview_links(self, links: dict, config: CrawlerRunConfig) -> dict:
+        """
+        Attach head data to the scraped links of one page.
+
+        Runs on the crawler's loop with one LinkPreview shared by every page, so the
+        seeder's HTTP client and connection pool are reused and heads already fetched
+        during this crawl are not requested again. Failures keep the original links.
+        """
+        if self.link_preview is None:
+            self.link_preview = LinkPreview(self.logger, seeder=self._get_url_seeder())
+        verbose = config.link_preview_config.verbose
+        try:
+            links_obj = Links(**links)
+            if verbose:
+                self.logger.info(
+                    message="Starting link head extraction for {internal} internal and {external} external links",
+                    tag="LINK_EXTRACT",
+                    params={"internal": len(links_obj.internal), "external": len(links_obj.external)},
+                )
+            updated = await self.link_preview.extract_link_heads(links_obj, config)
+            if verbose:
+                self.logger.info(
+                    message="Link head extraction completed: {internal_success}/{internal_total} internal, {external_success}/{external_total} external",
+                    tag="LINK_EXTRACT",
+                    params={
+                        "internal_success": len([l for l in updated.internal if l.head_extraction_status == "valid"]),
+                        "internal_total": len(updated.internal),
+                        "external_success": len([l for l in updated.external if l.head_extraction_status == "valid"]),
+                        "external_total": len(updated.external),
+                    },
+                )
+            return updated.model_dump()
+        except Exception as e:
+            self.logger.error(
+                message="Error during link head extraction: {error}",
+                tag="LINK_EXTRACT",
+                params={"error": str(e)},
+            )
+            return links
+
     async def aseed_urls(
         self,
         domain_or_domains: Union[str, List[str]],
@@ -815,13 +940,7 @@ class AsyncWebCrawler:
             >>> )
         """
         # Initialize AsyncUrlSeeder here if it hasn't been already
-        if not self.url_seeder:
-            # Pass the crawler's base_directory for seeder's cache management
-            # Pass the crawler's logger for consistent logging
-            self.url_seeder = AsyncUrlSeeder(
-                base_directory=self.crawl4ai_folder,
-                logger=self.logger
-            )                    
+        self._get_url_seeder()
 
         # Merge config object with direct kwargs, giving kwargs precedence
         seeding_config = config.clone(**kwargs) if config else SeedingConfig.from_kwargs(kwargs)
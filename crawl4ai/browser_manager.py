@@ -1,6 +1,8 @@
 import asyncio
+from collections import OrderedDict
 import time
-from typing import List, Optional
+import weakref
+from typing import Any, Dict, Iterable, List, Optional
 import os
 import sys
 import shutil
@@ -16,6 +18,141 @@ from .config import DOWNLOAD_PAGE_TIMEOUT
 from .async_configs import BrowserConfig, CrawlerRunConfig
 from .utils import get_chromium_path
 import warnings
+from functools import lru_cache
+from urllib.parse import urlsplit
+import tldextract
+
+
+# Longest a browser recycle waits for leased pages to be released before closing
+# them anyway; a leaked lease must not block every later get_page().
+RECYCLE_DRAIN_TIMEOUT = 60.0
+
+# Named resource-blocking profiles for BrowserConfig.block_resources. A request is
+# blocked if its Playwright resource_type, its URL path extension, or (for
+# "trackers") its host or any parent domain is listed.
+RESOURCE_BLOCKING_PROFILES = {
+    "images": {
+        "resource_types": {"image"},
+        "extensions": {"jpg", "jpeg", "png", "gif", "webp", "svg", "ico", "bmp", "tiff", "psd"},
+    },
+    "fonts": {
+        "resource_types": {"font"},
+        "extensions": {"woff", "woff2", "ttf", "otf", "eot"},
+    },
+    "media": {
+        "resource_types": {"media"},
+        "extensions": {
+            "mp4", "webm", "ogg", "avi", "mov", "wmv", "flv", "m4v",
+            "mp3", "wav", "aac", "m4a", "opus", "flac",
+        },
+    },
+    "stylesheets": {"resource_types": {"stylesheet"}},
+    "documents": {
+        "extensions": {
+            "pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx",
+            "zip", "rar", "7z", "tar", "gz", "xml", "swf", "wasm",
+        },
+    },
+    "trackers": {
+        "domains": {
+            "doubleclick.net", "googlesyndication.com", "googleadservices.com",
+            "google-analytics.com", "googletagmanager.com", "googletagservices.com",
+            "adservice.google.com", "connect.facebook.net", "analytics.twitter.com",
+            "ads-twitter.com", "bat.bing.com", "clarity.ms", "scorecardresearch.com",
+            "quantserve.com", "hotjar.com", "mixpanel.com", "segment.io", "segment.com",
+            "amplitude.com", "fullstory.com", "newrelic.com", "nr-data.net",
+            "criteo.com", "criteo.net", "taboola.com", "outbrain.com", "adnxs.com",
+            "rubiconproject.com", "pubmatic.com", "openx.net", "casalemedia.com",
+            "amazon-adsystem.com", "moatads.com", "adsrvr.org", "yieldmo.com",
+            "chartbeat.com", "optimizely.com", "crazyegg.com", "mouseflow.com",
+        },
+    },
+    "third_party_scripts": {"third_party_types": {"script"}},
+}
+
+# What text_mode has always blocked: these URL path extensions, matched by extension only
+TEXT_MODE_BLOCKED_EXTENSIONS = frozenset().union(
+    *(RESOURCE_BLOCKING_PROFILES[name]["extensions"] for name in ("images", "fonts", "media", "documents"))
+)
+
+# Bundled public suffix list snapshot: never fetched over the network, never cached to disk
+_extract_domain = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None, include_psl_private_domains=True)
+
+
+class ResourceBlocker:
+    """
+    Classifies requests against a set of blocking profiles with set lookups only,
+    so a single context-level route handler can serve every request.
+    """
+
+    def __init__(
+        self,
+        profiles: List[str],
+        blocked_domains: Optional[List[str]] = None,
+        extensions: Optional[Iterable[str]] = None,
+    ):
+        unknown = [name for name in profiles if name not in RESOURCE_BLOCKING_PROFILES]
+        if unknown:
+            raise ValueError(
+                f"Unknown resource blocking profile(s) {unknown}, "
+                f"expected any of {sorted(RESOURCE_BLOCKING_PROFILES)}"
+            )
+        self.profiles = list(dict.fromkeys(profiles))
+        self.resource_types = set()
+        self.extensions = set(extensions or ())
+        self.domains = {d.lower().lstrip(".") for d in blocked_domains or []}
+        self.third_party_types = set()
+        for name in self.profiles:
+            profile = RESOURCE_BLOCKING_PROFILES[name]
+            self.resource_types |= profile.get("resource_types", set())
+            self.extensions |= profile.get("extensions", set())
+            self.domains |= profile.get("domains", set())
+            self.third_party_types |= profile.get("third_party_types", set())
+
+    def __bool__(self):
+        return bool(self.resource_types or self.extensions or self.domains or self.third_party_types)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _site(host: str) -> str:
+        # Registrable domain per the public suffix list, so a.example.co.uk and
+        # b.example.co.uk match while foo.github.io and bar.github.io don't
+        return _extract_domain(host).top_domain_under_public_suffix or host
+
+    def should_block(self, url: str, resource_type: str, page_url: Optional[str] = None) -> bool:
+        if resource_type in self.resource_types:
+            return True
+        parts = urlsplit(url)
+        if self.extensions:
+            _, dot, ext = parts.path.rpartition(".")
+            if dot and ext.lower() in self.extensions:
+                return True
+        host = (parts.hostname or "").lower()
+        if self.domains and host:
+            labels = host.split(".")
+            for i in range(len(labels) - 1):
+                if ".".join(labels[i:]) in self.domains:
+                    return True
+        if resource_type in self.third_party_types and page_url and host:
+            page_host = (urlsplit(page_url).hostname or "").lower()
+            if page_host and self._site(host) != self._site(page_host):
+                return True
+        return False
+
+    async def handle_route(self, route):
+        """Context-level route handler: abort blocked requests, pass everything else on."""
+        request = route.request
+        page_url = None
+        if self.third_party_types:
+            try:
+                page_url = request.frame.page.url
+            except Exception:
+                # Service worker / detached frame requests have no page
+                page_url = None
+        if self.should_block(request.url, request.resource_type, page_url):
+            await route.abort()
+        else:
+            await route.fallback()
 
 
 BROWSER_DISABLE_OPTIONS = [
@@ -575,6 +712,8 @@ class BrowserManager:
     """
 
     _playwright_instance = None
+    # Per event loop lock around Playwright driver starts, see _start_playwright()
+    _driver_start_locks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
     
     @classmethod
     async def get_playwright(cls, use_undetected: bool = False):
@@ -608,15 +747,48 @@ class BrowserManager:
         self.sessions = {}
         self.session_ttl = 1800  # 30 minutes
 
-        # Keep track of contexts by a "config signature," so each unique config reuses a single context
-        self.contexts_by_config = {}
+        # Keep track of contexts by a "config signature," so each unique config reuses a single context.
+        # Ordered least- to most-recently used and capped at browser_config.max_contexts; a context
+        # is only evicted while no page leased from it is still live (_context_refs == 0).
+        self.contexts_by_config: "OrderedDict[str, BrowserContext]" = OrderedDict()
         self._contexts_lock = asyncio.Lock()
+        self._context_refs: Dict[str, int] = {}
+        self._page_signatures: Dict[Any, str] = {}
+        self.context_metrics = {"created": 0, "reused": 0, "evicted": 0}
         
         # Serialize context.new_page() across concurrent tasks to avoid races
         # when using a shared persistent context (context.pages may be empty
         # for all racers). Prevents 'Target page/context closed' errors.
         self._page_lock = asyncio.Lock()
+
+        # Idle pages per config signature, recycled across non-session crawls
+        # when browser_config.page_pool_size > 0. _page_meta maps every page
+        # created for pooling to [config_signature, use_count, listeners].
+        self._page_pools: Dict[str, List[Any]] = {}
+        self._page_meta: Dict[Any, list] = {}
+
+        # Configs declared via prewarm(): signature -> (config, idle pages to keep)
+        self._prewarm_targets: Dict[str, tuple] = {}
+        self._prewarm_tasks: Dict[str, asyncio.Task] = {}
         
+        # Browser recycling (recycle_after_pages / _seconds / memory_threshold_mb)
+        self._recycle_lock = asyncio.Lock()
+        self._pages_idle = asyncio.Event()
+        self._pages_idle.set()
+        self._pages_served = 0
+        self._browser_started_at = time.monotonic()
+        self._last_memory_check = 0.0
+        self._last_rss_mb = 0.0
+        self._driver_pid: Optional[int] = None
+        self.recycle_count = 0
+
+        # Request blocking (text_mode extensions plus browser_config.block_resources)
+        self.resource_blocker = ResourceBlocker(
+            list(self.config.block_resources or []),
+            self.config.blocked_domains,
+            extensions=TEXT_MODE_BLOCKED_EXTENSIONS if self.config.text_mode else None,
+        )
+
         # Stealth adapter for stealth mode
         self._stealth_adapter = None
         if self.config.enable_stealth and not self.use_undetected:
@@ -656,7 +828,7 @@ class BrowserManager:
             from playwright.async_api import async_playwright
 
         # Initialize playwright
-        self.playwright = await async_playwright().start()
+        self.playwright = await self._start_playwright(async_playwright)
 
         if self.config.cdp_url or self.config.use_managed_browser:
             self.config.use_managed_browser = True
@@ -674,17 +846,159 @@ class BrowserManager:
                 self.default_context = await self.create_browser_context()
             await self.setup_context(self.default_context)
         else:
-            browser_args = self._build_browser_args()
+            self.browser = await self._launch_browser()
+            self.default_context = self.browser
+        self._browser_started_at = time.monotonic()
+        self._pages_served = 0
 
-            # Launch appropriate browser type
-            if self.config.browser_type == "firefox":
-                self.browser = await self.playwright.firefox.launch(**browser_args)
-            elif self.config.browser_type == "webkit":
-                self.browser = await self.playwright.webkit.launch(**browser_args)
-            else:
-                self.browser = await self.playwright.chromium.launch(**browser_args)
+    async def _start_playwright(self, async_playwright):
+        """
+        Start Playwright and remember the pid of the driver process it spawns.
 
+        Every browser this manager launches runs under that driver, so its process
+        tree is what recycle_memory_threshold_mb measures. Starts are serialized per
+        event loop so the new child can be told apart from other crawlers' drivers.
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._driver_start_locks.get(loop)
+        if lock is None:
+            lock = self._driver_start_locks[loop] = asyncio.Lock()
+        async with lock:
+            before = self._child_pids()
+            playwright = await async_playwright().start()
+            spawned = self._child_pids() - before
+        # Anything but exactly one new child means we can't tell which is ours
+        self._driver_pid = spawned.pop() if len(spawned) == 1 else None
+        if self._driver_pid is None and self.config.recycle_memory_threshold_mb and self.logger:
+            self.logger.warning(
+                message="Could not identify the Playwright driver process; memory-based recycling is disabled",
+                tag="BROWSER",
+            )
+        return playwright
+
+    @staticmethod
+    def _child_pids() -> set:
+        try:
+            return {child.pid for child in psutil.Process().children()}
+        except psutil.Error:
+            return set()
+
+    async def _launch_browser(self):
+        browser_args = self._build_browser_args()
+
+        # Launch appropriate browser type
+        if self.config.browser_type == "firefox":
+            return await self.playwright.firefox.launch(**browser_args)
+        elif self.config.browser_type == "webkit":
+            return await self.playwright.webkit.launch(**browser_args)
+        else:
+            return await self.playwright.chromium.launch(**browser_args)
+
+    def _recycle_reason(self) -> Optional[str]:
+        """Why the browser should be recycled now, or None."""
+        cfg = self.config
+        if self.config.use_managed_browser or self.browser is None or self.sessions:
+            # Never recycle under a CDP/managed browser or an open session
+            return None
+        if cfg.recycle_after_pages and self._pages_served >= cfg.recycle_after_pages:
+            return f"{self._pages_served} pages served"
+        if cfg.recycle_after_seconds and time.monotonic() - self._browser_started_at >= cfg.recycle_after_seconds:
+            return f"browser older than {cfg.recycle_after_seconds:.0f}s"
+        if cfg.recycle_memory_threshold_mb:
+            # Sampling the process tree is not free, so do it at most every 5s
+            now = time.monotonic()
+            if now - self._last_memory_check >= 5.0:
+                self._last_memory_check = now
+                self._last_rss_mb = self._browser_rss_mb()
+            if self._last_rss_mb >= cfg.recycle_memory_threshold_mb:
+                return f"browser RSS {self._last_rss_mb:.0f}MB"
+        return None
+
+    def _browser_rss_mb(self) -> float:
+        """
+        Resident memory of this manager's Playwright driver and the browser under it.
+        Other crawlers in the same Python process are not counted.
+        """
+        if self._driver_pid is None:
+            return 0.0
+        total = 0
+        try:
+            driver = psutil.Process(self._driver_pid)
+            processes = [driver] + driver.children(recursive=True)
+        except psutil.Error:
+            return 0.0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / (1024 * 1024)
+
+    async def _maybe_recycle_browser(self):
+        """
+        Restart the browser once a recycling threshold is hit.
+
+        New page requests wait while in-flight pages drain, for at most
+        RECYCLE_DRAIN_TIMEOUT seconds; then pre-warm fills are cancelled, all
+        contexts (and any pages still leased) and the browser are closed and a
+        fresh browser is launched.
+        Contexts are re-created lazily by get_page from contexts_by_config misses.
+        """
+        if not self._recycle_lock.locked() and self._recycle_reason() is None:
+            return
+        async with self._recycle_lock:
+            reason = self._recycle_reason()
+            if reason is None:
+                # Another task already recycled while we waited
+                return
+            deadline = time.monotonic() + RECYCLE_DRAIN_TIMEOUT
+            while sum(self._context_refs.values()) > 0:
+                self._pages_idle.clear()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if self.logger:
+                        self.logger.warning(
+                            message="Recycling with {count} pages still leased after {timeout:.0f}s",
+                            tag="BROWSER",
+                            params={
+                                "count": sum(self._context_refs.values()),
+                                "timeout": RECYCLE_DRAIN_TIMEOUT,
+                            },
+                        )
+                    self._context_refs.clear()
+                    self._page_signatures.clear()
+                    self._pages_idle.set()
+                    break
+                try:
+                    await asyncio.wait_for(self._pages_idle.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            # A fill still running would keep opening pages on the browser being closed
+            current = asyncio.current_task()
+            filling = [t for t in self._prewarm_tasks.values() if t is not current and not t.done()]
+            for task in filling:
+                task.cancel()
+            await asyncio.gather(*filling, return_exceptions=True)
+            self._prewarm_tasks.clear()
+            if self.logger:
+                self.logger.info(
+                    message="Recycling browser: {reason}",
+                    tag="BROWSER",
+                    params={"reason": reason},
+                )
+            await self._close_contexts()
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+            self.browser = await self._launch_browser()
             self.default_context = self.browser
+            self._browser_started_at = time.monotonic()
+            self._pages_served = 0
+            self._last_rss_mb = 0.0
+            self.recycle_count += 1
+            for signature in self._prewarm_targets:
+                self._schedule_prewarm(signature)
 
     async def _verify_cdp_ready(self, cdp_url: str) -> bool:
         """Verify CDP endpoint is ready with exponential backoff"""
@@ -878,61 +1192,6 @@ class BrowserManager:
         }
         proxy_settings = {"server": self.config.proxy} if self.config.proxy else None
 
-        blocked_extensions = [
-            # Images
-            "jpg",
-            "jpeg",
-            "png",
-            "gif",
-            "webp",
-            "svg",
-            "ico",
-            "bmp",
-            "tiff",
-            "psd",
-            # Fonts
-            "woff",
-            "woff2",
-            "ttf",
-            "otf",
-            "eot",
-            # Styles
-            # 'css', 'less', 'scss', 'sass',
-            # Media
-            "mp4",
-            "webm",
-            "ogg",
-            "avi",
-            "mov",
-            "wmv",
-            "flv",
-            "m4v",
-            "mp3",
-            "wav",
-            "aac",
-            "m4a",
-            "opus",
-            "flac",
-            # Documents
-            "pdf",
-            "doc",
-            "docx",
-            "xls",
-            "xlsx",
-            "ppt",
-            "pptx",
-            # Archives
-            "zip",
-            "rar",
-            "7z",
-            "tar",
-            "gz",
-            # Scripts and data
-            "xml",
-            "swf",
-            "wasm",
-        ]
-
         # Common context settings
         context_settings = {
             "user_agent": user_agent,
@@ -986,48 +1245,18 @@ class BrowserManager:
         # Create and return the context with all settings
         context = await self.browser.new_context(**context_settings)
 
-        # Apply text mode settings if enabled
-        if self.config.text_mode:
-            # Create and apply route patterns for each extension
-            for ext in blocked_extensions:
-                await context.route(f"**/*.{ext}", lambda route: route.abort())
+        # One route handler for every blocking profile (text_mode included)
+        if self.resource_blocker:
+            await context.route("**/*", self.resource_blocker.handle_route)
         return context
 
     def _make_config_signature(self, crawlerRunConfig: CrawlerRunConfig) -> str:
         """
-        Converts the crawlerRunConfig into a dict, excludes ephemeral fields,
-        then returns a hash of the sorted JSON. This yields a stable signature
-        that identifies configurations requiring a unique browser context.
+        Returns the signature identifying configurations that require a unique
+        browser context. Delegates to CrawlerRunConfig.browser_signature(), which
+        only hashes context-affecting fields and is memoized on the config.
         """
-        import json
-
-        config_dict = crawlerRunConfig.__dict__.copy()
-        # Exclude items that do not affect browser-level setup.
-        # Expand or adjust as needed, e.g. chunking_strategy is purely for data extraction, not for browser config.
-        ephemeral_keys = [
-            "session_id",
-            "js_code",
-            "scraping_strategy",
-            "extraction_strategy",
-            "chunking_strategy",
-            "cache_mode",
-            "content_filter",
-            "semaphore_count",
-            "url"
-        ]
-        
-        # Do NOT exclude locale, timezone_id, or geolocation as these DO affect browser context
-        # and should cause a new context to be created if they change
-        
-        for key in ephemeral_keys:
-            if key in config_dict:
-                del config_dict[key]
-        # Convert to canonical JSON string
-        signature_json = json.dumps(config_dict, sort_keys=True, default=str)
-
-        # Hash the JSON so we get a compact, unique string
-        signature_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
-        return signature_hash
+        return crawlerRunConfig.browser_signature()
 
     async def _apply_stealth_to_page(self, page):
         """Apply stealth to a page if stealth mode is enabled"""
@@ -1091,27 +1320,258 @@ class BrowserManager:
                                 await self._apply_stealth_to_page(page)
         else:
             # Otherwise, check if we have an existing context for this config
+            await self._maybe_recycle_browser()
+            self._pages_served += 1
             config_signature = self._make_config_signature(crawlerRunConfig)
 
-            async with self._contexts_lock:
-                if config_signature in self.contexts_by_config:
-                    context = self.contexts_by_config[config_signature]
-                else:
-                    # Create and setup a new context
-                    context = await self.create_browser_context(crawlerRunConfig)
-                    await self.setup_context(context, crawlerRunConfig)
-                    self.contexts_by_config[config_signature] = context
-
-            # Create a new page from the chosen context
-            page = await context.new_page()
-            await self._apply_stealth_to_page(page)
+            context = await self._get_or_create_context(crawlerRunConfig, config_signature, lease=True)
+
+            # Reuse an idle (or pre-warmed) page of this context, or create a new one
+            page = self._take_pooled_page(config_signature)
+            if config_signature in self._prewarm_targets:
+                self._schedule_prewarm(config_signature)
+            if page is None:
+                page = await context.new_page()
+                await self._apply_stealth_to_page(page)
+                if self._pool_capacity(config_signature) > 0:
+                    self._page_meta[page] = self._pooled_page_meta(page, config_signature)
+            self._page_signatures[page] = config_signature
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
+            # Session pages are owned by the session, never by the pool
+            self._page_meta.pop(page, None)
             self.sessions[crawlerRunConfig.session_id] = (context, page, time.time())
 
         return page, context
 
+    @staticmethod
+    def _pooled_page_meta(page, config_signature: str) -> list:
+        """
+        Pool bookkeeping for a new page: [config_signature, use_count, listeners].
+
+        page.on/page.once are wrapped so every listener a crawl or user hook adds
+        is recorded as (event, handler) and can be taken off again with
+        page.remove_listener before the page is reused.
+        """
+        listeners = []
+
+        def tracked(register):
+            def add_listener(event, handler):
+                listeners.append((event, handler))
+                return register(event, handler)
+            return add_listener
+
+        page.on = tracked(page.on)
+        page.once = tracked(page.once)
+        return [config_signature, 0, listeners]
+
+    async def _get_or_create_context(self, crawlerRunConfig: CrawlerRunConfig, config_signature: str, lease: bool):
+        async with self._contexts_lock:
+            if config_signature in self.contexts_by_config:
+                context = self.contexts_by_config[config_signature]
+                self.contexts_by_config.move_to_end(config_signature)
+                if lease:
+                    self.context_metrics["reused"] += 1
+            else:
+                # Create and setup a new context
+                context = await self.create_browser_context(crawlerRunConfig)
+                await self.setup_context(context, crawlerRunConfig)
+                self.contexts_by_config[config_signature] = context
+                self.context_metrics["created"] += 1
+            if lease:
+                # Lease the context before releasing the lock so it cannot be evicted under us
+                self._context_refs[config_signature] = self._context_refs.get(config_signature, 0) + 1
+            await self._evict_idle_contexts()
+        return context
+
+    def _pool_capacity(self, config_signature: str) -> int:
+        """Idle pages kept for a signature: page_pool_size, or more for pre-warmed configs."""
+        target = self._prewarm_targets.get(config_signature)
+        return max(self.config.page_pool_size, target[1] if target else 0)
+
+    async def prewarm(
+        self,
+        configs: List[CrawlerRunConfig],
+        pages_per_config: int = 1,
+        wait: bool = True,
+    ):
+        """
+        Keep ready-to-use contexts and pages for the given configs.
+
+        For each config the context is created and set up (cookies, init scripts,
+        storage state) and `pages_per_config` pages are opened with stealth
+        applied, so get_page() for a matching config skips that cold path. The
+        pages live in the page pool and are topped up in the background whenever
+        one is taken. Pre-warmed contexts are never evicted by max_contexts.
+
+        Args:
+            configs: Crawl configs whose browser contexts should be kept warm.
+            pages_per_config: Idle pages to keep per config.
+            wait: Wait for the initial warm-up instead of running it in the background.
+        """
+        if self.config.use_managed_browser:
+            return
+        signatures = []
+        for crawlerRunConfig in configs:
+            signature = self._make_config_signature(crawlerRunConfig)
+            self._prewarm_targets[signature] = (crawlerRunConfig, pages_per_config)
+            signatures.append(signature)
+        tasks = [self._schedule_prewarm(signature) for signature in signatures]
+        if wait:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _schedule_prewarm(self, config_signature: str) -> asyncio.Task:
+        task = self._prewarm_tasks.get(config_signature)
+        if task is None or task.done():
+            task = asyncio.create_task(self._fill_prewarmed(config_signature))
+            self._prewarm_tasks[config_signature] = task
+        return task
+
+    async def _fill_prewarmed(self, config_signature: str):
+        target = self._prewarm_targets.get(config_signature)
+        if target is None or self.browser is None:
+            return
+        crawlerRunConfig, count = target
+        try:
+            context = await self._get_or_create_context(crawlerRunConfig, config_signature, lease=False)
+            pool = self._page_pools.setdefault(config_signature, [])
+            while len(pool) < count and self.contexts_by_config.get(config_signature) is context:
+                page = await context.new_page()
+                await self._apply_stealth_to_page(page)
+                self._page_meta[page] = self._pooled_page_meta(page, config_signature)
+                pool.append(page)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(
+                    message="Failed to pre-warm browser context: {error}",
+                    tag="POOL",
+                    params={"error": str(e)},
+                )
+
+    async def _evict_idle_contexts(self):
+        """Close least recently used contexts with no live pages until within max_contexts."""
+        max_contexts = self.config.max_contexts
+        if not max_contexts or len(self.contexts_by_config) <= max_contexts:
+            return
+        for signature in list(self.contexts_by_config):
+            if len(self.contexts_by_config) <= max_contexts:
+                break
+            if self._context_refs.get(signature, 0) > 0 or signature in self._prewarm_targets:
+                continue
+            context = self.contexts_by_config.pop(signature)
+            self._context_refs.pop(signature, None)
+            for page in self._page_pools.pop(signature, []):
+                self._page_meta.pop(page, None)
+            try:
+                await context.close()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        message="Error closing context: {error}",
+                        tag="ERROR",
+                        params={"error": str(e)},
+                    )
+            self.context_metrics["evicted"] += 1
+
+    async def _release_context_ref(self, page):
+        """Drop the context lease held by `page`, evicting idle contexts if over capacity."""
+        signature = self._page_signatures.pop(page, None)
+        if signature is None or signature not in self._context_refs:
+            return
+        self._context_refs[signature] = max(self._context_refs[signature] - 1, 0)
+        if not any(self._context_refs.values()):
+            self._pages_idle.set()
+        max_contexts = self.config.max_contexts
+        if not self._context_refs[signature] and max_contexts and len(self.contexts_by_config) > max_contexts:
+            async with self._contexts_lock:
+                await self._evict_idle_contexts()
+
+    def context_stats(self) -> Dict[str, int]:
+        """Counters for the context cache: open/in-use contexts plus creations, reuses and evictions."""
+        return {
+            "open": len(self.contexts_by_config),
+            "in_use": sum(1 for refs in self._context_refs.values() if refs > 0),
+            "max_contexts": self.config.max_contexts,
+            **self.context_metrics,
+        }
+
+    def _take_pooled_page(self, config_signature: str):
+        pool = self._page_pools.get(config_signature)
+        while pool:
+            page = pool.pop()
+            if not page.is_closed():
+                return page
+            self._page_meta.pop(page, None)
+        return None
+
+    def is_pooled_page(self, page) -> bool:
+        """Whether `page` belongs to the page pool and should go back via release_page()."""
+        return page in self._page_meta
+
+    async def _reset_page(self, page):
+        """Strip per-crawl state from a page so the next crawl starts clean."""
+        meta = self._page_meta.get(page)
+        listeners = meta[2] if meta else []
+        # Removing one its owner already took off (or a once() that fired) is a no-op
+        while listeners:
+            page.remove_listener(*listeners.pop())
+        await page.unroute_all(behavior="ignoreErrors")
+        await page.set_extra_http_headers({})
+        await page.set_viewport_size(
+            {"width": self.config.viewport_width, "height": self.config.viewport_height}
+        )
+        await page.goto("about:blank")
+
+    async def release_page(self, page, keep_open: bool = False):
+        """
+        Return a page after a non-session crawl.
+
+        Pooled pages are reset and kept for the next crawl with the same config
+        signature until they reach page_pool_max_uses or the pool is full;
+        everything else is closed. With keep_open=True the page only stops
+        counting as in-flight and is left open as is.
+        """
+        await self._release_context_ref(page)
+        if keep_open:
+            self._page_meta.pop(page, None)
+            return
+        meta = self._page_meta.get(page)
+        if meta is None or page.is_closed():
+            self._page_meta.pop(page, None)
+            if not page.is_closed():
+                await page.close()
+            return
+
+        signature = meta[0]
+        meta[1] += 1
+        pool = self._page_pools.setdefault(signature, [])
+        if (
+            meta[1] >= self.config.page_pool_max_uses
+            or len(pool) >= self._pool_capacity(signature)
+            or signature not in self.contexts_by_config
+        ):
+            self._page_meta.pop(page, None)
+            await page.close()
+            return
+
+        try:
+            await self._reset_page(page)
+        except Exception as e:
+            self._page_meta.pop(page, None)
+            if self.logger:
+                self.logger.warning(
+                    message="Failed to reset pooled page, closing it: {error}",
+                    tag="POOL",
+                    params={"error": str(e)},
+                )
+            try:
+                await page.close()
+            except Exception:
+                pass
+            return
+        pool.append(page)
+
     async def kill_session(self, session_id: str):
         """
         Kill a browser session and clean up resources.
@@ -1121,10 +1581,15 @@ class BrowserManager:
         """
         if session_id in self.sessions:
             context, page, _ = self.sessions[session_id]
+            del self.sessions[session_id]
+            self._page_meta.pop(page, None)
             await page.close()
-            if not self.config.use_managed_browser:
+            if page in self._page_signatures:
+                # Shared per-config context: leave it to the LRU instead of closing it
+                # underneath other pages that use the same config
+                await self._release_context_ref(page)
+            elif not self.config.use_managed_browser:
                 await context.close()
-            del self.sessions[session_id]
 
     def _cleanup_expired_sessions(self):
         """Clean up expired sessions based on TTL."""
@@ -1137,6 +1602,23 @@ class BrowserManager:
         for sid in expired_sessions:
             asyncio.create_task(self.kill_session(sid))
 
+    async def _close_contexts(self):
+        for ctx in self.contexts_by_config.values():
+            try:
+                await ctx.close()
+            except Exception as e:
+                self.logger.error(
+                    message="Error closing context: {error}",
+                    tag="ERROR",
+                    params={"error": str(e)}
+                )
+        self.contexts_by_config.clear()
+        self._context_refs.clear()
+        self._page_signatures.clear()
+        self._page_pools.clear()
+        self._page_meta.clear()
+        self._pages_idle.set()
+
     async def close(self):
         """Close all browser resources and clean up."""
         if self.config.cdp_url:
@@ -1149,17 +1631,13 @@ class BrowserManager:
         for session_id in session_ids:
             await self.kill_session(session_id)
 
+        for task in self._prewarm_tasks.values():
+            task.cancel()
+        self._prewarm_tasks.clear()
+        self._prewarm_targets.clear()
+
         # Now close all contexts we created. This reclaims memory from ephemeral contexts.
-        for ctx in self.contexts_by_config.values():
-            try:
-                await ctx.close()
-            except Exception as e:
-                self.logger.error(
-                    message="Error closing context: {error}",
-                    tag="ERROR",
-                    params={"error": str(e)}
-                )
-        self.contexts_by_config.clear()
+        await self._close_contexts()
 
         if self.browser:
             await self.browser.close()
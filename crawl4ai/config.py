@@ -45,6 +45,8 @@ WORD_TOKEN_RATE = 1.3
 
 # Threshold for the minimum number of word in a HTML tag to be considered
 MIN_WORD_THRESHOLD = 1
+# Class of the wrapper the browser strategy puts around css_selector matches
+SELECTED_HTML_CLASS = "crawl4ai-result"
 IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD = 1
 
 IMPORTANT_ATTRS = ["src", "href", "alt", "title", "width", "height"]
@@ -101,6 +103,8 @@ SHOW_DEPRECATION_WARNINGS = True
 SCREENSHOT_HEIGHT_TRESHOLD = 10000
 PAGE_TIMEOUT = 60000
 DOWNLOAD_PAGE_TIMEOUT = 60000
+QUIESCENT_IDLE_MS = 500  # wait_for="quiescent": DOM and network idle this long
+QUIESCENT_STALE_REQUEST_MS = 5000  # In-flight requests older than this (beacons, long-polls) stop counting
 
 # Global user settings with descriptions and default values
 USER_SETTINGS = {
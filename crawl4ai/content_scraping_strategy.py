@@ -12,6 +12,7 @@ from .config import (
     ONLY_TEXT_ELIGIBLE_TAGS,
     IMPORTANT_ATTRS,
     SOCIAL_MEDIA_DOMAINS,
+    SELECTED_HTML_CLASS,
 )
 from bs4 import NavigableString, Comment
 from bs4 import PageElement, Tag
@@ -36,6 +37,15 @@ import copy
 OG_REGEX = re.compile(r"^og:")
 TWITTER_REGEX = re.compile(r"^twitter:")
 DIMENSION_REGEX = re.compile(r"(\d+)(\D*)")
+# excluded_tags entries that are plain tag names; anything else is used as an XPath step
+TAG_NAME_REGEX = re.compile(r"^[A-Za-z][A-Za-z0-9_-]*$")
+
+# Tags that never contribute to cleaned_html
+NON_CONTENT_TAGS = frozenset({"script", "style", "link", "meta", "noscript"})
+# Tags kept by empty-element removal even when they have no text
+EMPTY_BYPASS_TAGS = frozenset({
+    "a", "img", "br", "hr", "input", "meta", "link", "source", "track", "wbr", "tr", "td", "th",
+})
 
 
 # Function to parse srcset
@@ -222,6 +232,20 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
         self._process_element(
             url, element, media, internal_links_dict, external_links_dict, **kwargs
         )
+
+        # Clean up unwanted elements
+        drop_tags = set()
+        if kwargs.get("remove_forms", False):
+            drop_tags.add("form")
+        xpath_tags = self._split_excluded_tags(kwargs.get("excluded_tags", []), drop_tags)
+        self.prune_tree(element, drop_tags, xpath_tags=xpath_tags)
+        if excluded_selector := kwargs.get("excluded_selector", ""):
+            try:
+                for elem in element.cssselect(excluded_selector):
+                    elem.getparent().remove(elem)
+            except Exception:
+                pass  # Invalid selector
+
         return {
             "media": media,
             "internal_links_dict": internal_links_dict,
@@ -243,16 +267,23 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         # Process links
         try:
-            base_element = element.xpath("//head/base[@href]")
-            if base_element:
-                base_href = base_element[0].get("href", "").strip()
+            base_element = element.getroottree().getroot().find("head/base[@href]")
+            if base_element is not None:
+                base_href = base_element.get("href", "").strip()
                 if base_href:
                     url = base_href
         except Exception as e:
             self._log("error", f"Error extracting base URL: {str(e)}", "SCRAPE")
             pass
 
-        for link in element.xpath(".//a[@href]"):
+        # Collect links and media in one walk instead of an XPath per kind
+        found = {"a": [], "img": [], "video": [], "audio": []}
+        for el in element.iterdescendants("a", "img", "video", "audio"):
+            if el.tag != "a" or el.get("href") is not None:
+                found[el.tag].append(el)
+        removed_links = False
+
+        for link in found["a"]:
             href = link.get("href", "").strip()
             if not href:
                 continue
@@ -298,6 +329,7 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                         or link_base_domain in exclude_domains
                     ):
                         link.getparent().remove(link)
+                        removed_links = True
                         continue
 
                     if normalized_href not in external_links_dict:
@@ -310,8 +342,13 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 self._log("error", f"Error processing link: {str(e)}", "SCRAPE")
                 continue
 
+        if removed_links:
+            # Media inside a dropped link went with it
+            for tag in ("img", "video", "audio"):
+                found[tag] = [el for el in found[tag] if self._is_attached(el, element)]
+
         # Process images
-        images = element.xpath(".//img")
+        images = found["img"]
         total_images = len(images)
 
         for idx, img in enumerate(images):
@@ -342,7 +379,7 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         # Process videos and audios
         for media_type in ["video", "audio"]:
-            for elem in element.xpath(f".//{media_type}"):
+            for elem in found[media_type]:
                 media_info = {
                     "src": elem.get("src"),
                     "alt": elem.get("alt"),
@@ -358,25 +395,16 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                     if src := source.get("src"):
                         media[f"{media_type}s"].append({**media_info, "src": src})
 
-        # Clean up unwanted elements
-        if kwargs.get("remove_forms", False):
-            for form in element.xpath(".//form"):
-                form.getparent().remove(form)
-
-        if excluded_tags := kwargs.get("excluded_tags", []):
-            for tag in excluded_tags:
-                for elem in element.xpath(f".//{tag}"):
-                    elem.getparent().remove(elem)
-
-        if excluded_selector := kwargs.get("excluded_selector", ""):
-            try:
-                for elem in element.cssselect(excluded_selector):
-                    elem.getparent().remove(elem)
-            except Exception:
-                pass  # Invalid selector
-
         return True
 
+    @staticmethod
+    def _is_attached(el: lhtml.HtmlElement, root: lhtml.HtmlElement) -> bool:
+        while el is not None:
+            if el is root:
+                return True
+            el = el.getparent()
+        return False
+
     def find_closest_parent_with_useful_text(
         self, element: lhtml.HtmlElement, **kwargs
     ) -> Optional[str]:
@@ -519,34 +547,15 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
         Remove elements that fall below the desired word threshold in a single pass from the bottom up.
         Skips non-element nodes like HtmlComment and bypasses certain tags that are allowed to have no content.
         """
-        bypass_tags = {
-            "a",
-            "img",
-            "br",
-            "hr",
-            "input",
-            "meta",
-            "link",
-            "source",
-            "track",
-            "wbr",
-            "tr",
-            "td",
-            "th",
-        }
-
         for el in reversed(list(root.iterdescendants())):
             if not isinstance(el, lhtml.HtmlElement):
                 continue
 
-            if el.tag in bypass_tags:
+            if el.tag in EMPTY_BYPASS_TAGS:
                 continue
 
-            text_content = (el.text_content() or "").strip()
-            if (
-                len(text_content.split()) < word_count_threshold
-                and not el.getchildren()
-            ):
+            # A leaf's text_content() is its own text; skip the subtree walk for the rest
+            if len(el) == 0 and len((el.text or "").split()) < word_count_threshold:
                 parent = el.getparent()
                 if parent is not None:
                     parent.remove(el)
@@ -590,6 +599,161 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         return root
 
+    @staticmethod
+    def _is_preselected(doc: lhtml.HtmlElement) -> bool:
+        """Whether the HTML is the browser strategy's wrapper around css_selector matches."""
+        body = doc.find("body")
+        if body is None:
+            body = doc
+        return len(body) == 1 and body[0].get("class") == SELECTED_HTML_CLASS
+
+    def _crop_to_targets(
+        self, doc: lhtml.HtmlElement, selectors: List[str]
+    ) -> Optional[lhtml.HtmlElement]:
+        """
+        Move the elements matching `selectors` into a new <div> that becomes the only
+        child of <body>, leaving <head> (and so <base> and metadata) in place. A match
+        nested inside another match is kept once, inside its ancestor. Nothing is copied.
+
+        Returns the <div>, the <body> itself if a selector matched it, or None if a
+        selector is invalid.
+        """
+        try:
+            matches = []
+            for selector in selectors:
+                matches.extend(doc.cssselect(selector))
+        except Exception as e:
+            self._log("error", f"Error with target element detection: {str(e)}", "SCRAPE")
+            return None
+
+        body = doc.find("body")
+        if body is None:
+            body = doc
+        if any(el is body or el is doc for el in matches):
+            return body
+
+        chosen = set(matches)
+        crop = lhtml.Element("div")
+        for el in matches:
+            if el.getparent() is crop:
+                continue  # Matched by an earlier selector too
+            ancestor = el.getparent()
+            while ancestor is not None and ancestor not in chosen:
+                ancestor = ancestor.getparent()
+            if ancestor is None:
+                crop.append(el)
+
+        for child in list(body):
+            body.remove(child)
+        body.text = None
+        body.append(crop)
+        return crop
+
+    @staticmethod
+    def _split_excluded_tags(excluded_tags, drop_tags: set) -> List[str]:
+        """Add plain tag names to drop_tags; return the entries that need XPath."""
+        xpath_tags = []
+        for tag in excluded_tags or []:
+            if TAG_NAME_REGEX.match(tag):
+                drop_tags.add(tag.lower())
+            else:
+                xpath_tags.append(tag)
+        return xpath_tags
+
+    def prune_tree(
+        self,
+        root: lhtml.HtmlElement,
+        drop_tags,
+        drop_comments: bool = False,
+        xpath_tags: Optional[List[str]] = None,
+    ) -> lhtml.HtmlElement:
+        """
+        Remove every element whose tag is in `drop_tags` (and comments, if asked) in a
+        single top-down walk. Subtrees of removed elements are never visited.
+        `xpath_tags` are excluded_tags entries that are not plain names, like "div[@id='x']".
+        """
+        for tag in xpath_tags or []:
+            for el in root.xpath(f".//{tag}"):
+                if el.getparent() is not None:
+                    el.getparent().remove(el)
+
+        if not drop_tags and not drop_comments:
+            return root
+        stack = [root]
+        while stack:
+            parent = stack.pop()
+            for child in list(parent):
+                tag = child.tag
+                if tag is etree.Comment:
+                    if drop_comments:
+                        parent.remove(child)
+                elif isinstance(tag, str):
+                    if tag in drop_tags:
+                        parent.remove(child)
+                    else:
+                        stack.append(child)
+        return root
+
+    def finalize_tree(
+        self,
+        root: lhtml.HtmlElement,
+        word_count_threshold: int = 1,
+        only_text: bool = False,
+        important_attrs=None,
+        keep_data_attributes: bool = False,
+    ) -> lhtml.HtmlElement:
+        """
+        Output cleanup once links and media are collected, in one bottom-up walk:
+        base64 image payloads are stripped, empty elements removed (as in
+        `remove_empty_elements_fast`) and attributes filtered (as in
+        `remove_unwanted_attributes_fast`). `only_text` rewriting needs the untouched
+        subtrees, so it runs first as its own pass.
+        """
+        if only_text:
+            for element in list(root.iterdescendants(*ONLY_TEXT_ELIGIBLE_TAGS)):
+                if element.text and element.getparent() is not None:
+                    new_text = lhtml.Element("span")
+                    new_text.text = element.text_content()
+                    element.getparent().replace(element, new_text)
+
+        if important_attrs is None:
+            important_attrs = set(IMPORTANT_ATTRS)
+
+        def strip_attributes(el):
+            attrib = el.attrib
+            if not attrib:
+                return
+            kept = {
+                name: value for name, value in attrib.items()
+                if name in important_attrs
+                or (keep_data_attributes and name.startswith("data-"))
+            }
+            if len(kept) != len(attrib):
+                attrib.clear()
+                attrib.update(kept)
+
+        for el in reversed(list(root.iterdescendants())):
+            if not isinstance(el, lhtml.HtmlElement):
+                continue
+            tag = el.tag
+            if tag == "img":
+                src = el.get("src")
+                if src and self.BASE64_PATTERN.match(src):
+                    el.set("src", self.BASE64_PATTERN.sub("", src))
+            elif (
+                tag not in EMPTY_BYPASS_TAGS
+                and len(el) == 0
+                and len((el.text or "").split()) < word_count_threshold
+            ):
+                parent = el.getparent()
+                if parent is not None:
+                    parent.remove(el)
+                    continue
+            strip_attributes(el)
+
+        strip_attributes(root)
+        return root
+
 
     def _scrap(
         self,
@@ -639,26 +803,45 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 except Exception:
                     page_context = {}  # Fail gracefully
             
-            # Early removal of all images if exclude_all_images is set
-            # This is more efficient in lxml as we remove elements before any processing
-            if kwargs.get("exclude_all_images", False):
-                for img in body.xpath('//img'):
-                    if img.getparent() is not None:
-                        img.getparent().remove(img)
+            # Extract metadata before any content filtering
+            try:
+                meta = extract_metadata_using_lxml(
+                    "", doc
+                )  # Using same function as BeautifulSoup version
+            except Exception as e:
+                self._log("error", f"Error extracting metadata: {str(e)}", "SCRAPE")
+                meta = {}
 
-            # Add comment removal
-            if kwargs.get("remove_comments", False):
-                comments = body.xpath("//comment()")
-                for comment in comments:
-                    comment.getparent().remove(comment)
+            # With crop_to_target the matched elements replace the page body, so the
+            # passes below only see the crop. scope_links_to_target crops before link
+            # and media collection as well; otherwise that still covers the full page.
+            crop_selectors = list(target_elements or [])
+            if not crop_selectors and css_selector and not self._is_preselected(doc):
+                # The browser strategy has usually applied css_selector already; only
+                # crop with it when the HTML is still the full page (e.g. HTTP strategy)
+                crop_selectors = [css_selector]
+            crop = bool(kwargs.get("crop_to_target", False) and crop_selectors)
+            scoped = crop and kwargs.get("scope_links_to_target", False)
+            if scoped:
+                content_element = self._crop_to_targets(doc, crop_selectors)
+                if content_element is None:
+                    return None
 
-            # Handle tag-based removal first
+            # All tag-based removals (excluded tags, script/style/link/meta/noscript,
+            # images, forms, comments) happen in one walk over the tree
             excluded_tags = set(kwargs.get("excluded_tags", []) or [])
-            if excluded_tags:
-                for tag in excluded_tags:
-                    for element in body.xpath(f".//{tag}"):
-                        if element.getparent() is not None:
-                            element.getparent().remove(element)
+            drop_tags = set(NON_CONTENT_TAGS)
+            if kwargs.get("exclude_all_images", False):
+                drop_tags.add("img")
+            if kwargs.get("remove_forms", False):
+                drop_tags.add("form")
+            xpath_tags = self._split_excluded_tags(excluded_tags, drop_tags)
+            self.prune_tree(
+                body,
+                drop_tags,
+                drop_comments=kwargs.get("remove_comments", False),
+                xpath_tags=xpath_tags,
+            )
 
             # Handle CSS selector-based exclusion
             excluded_selector = kwargs.get("excluded_selector", "")
@@ -672,17 +855,9 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                         "error", f"Error with excluded CSS selector: {str(e)}", "SCRAPE"
                     )
 
-            # Extract metadata before any content filtering
-            try:
-                meta = extract_metadata_using_lxml(
-                    "", doc
-                )  # Using same function as BeautifulSoup version
-            except Exception as e:
-                self._log("error", f"Error extracting metadata: {str(e)}", "SCRAPE")
-                meta = {}
-
-            content_element = None
-            if target_elements:
+            if crop:
+                pass  # Cropped above, or after link and media collection below
+            elif target_elements:
                 try:
                     for_content_targeted_element = []
                     for target_element in target_elements:
@@ -695,12 +870,6 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             else:
                 content_element = body
 
-            # Remove script and style tags
-            for tag in ["script", "style", "link", "meta", "noscript"]:
-                for element in body.xpath(f".//{tag}"):
-                    if element.getparent() is not None:
-                        element.getparent().remove(element)
-
             # Handle social media and domain exclusions
             kwargs["exclude_domains"] = set(kwargs.get("exclude_domains", []))
             if kwargs.get("exclude_social_media_links", False):
@@ -710,12 +879,6 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 )
                 kwargs["exclude_domains"].update(kwargs["exclude_social_media_domains"])
 
-            # Process forms if needed
-            if kwargs.get("remove_forms", False):
-                for form in body.xpath(".//form"):
-                    if form.getparent() is not None:
-                        form.getparent().remove(form)
-
             # Process content
             media = {"images": [], "videos": [], "audios": [], "tables": []}
             internal_links_dict = {}
@@ -743,28 +906,17 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                     extracted_tables = table_extraction.extract_tables(body, **kwargs)
                     media["tables"].extend(extracted_tables)
 
-            # Handle only_text option
-            if kwargs.get("only_text", False):
-                for tag in ONLY_TEXT_ELIGIBLE_TAGS:
-                    for element in body.xpath(f".//{tag}"):
-                        if element.text:
-                            new_text = lhtml.Element("span")
-                            new_text.text = element.text_content()
-                            if element.getparent() is not None:
-                                element.getparent().replace(element, new_text)
-
-            # Clean base64 images
-            for img in body.xpath(".//img[@src]"):
-                src = img.get("src", "")
-                if self.BASE64_PATTERN.match(src):
-                    img.set("src", self.BASE64_PATTERN.sub("", src))
-
-            # Remove empty elements
-            self.remove_empty_elements_fast(body, 1)
-
-            # Remove unneeded attributes
-            self.remove_unwanted_attributes_fast(
-                body, keep_data_attributes=kwargs.get("keep_data_attributes", False)
+            if crop and not scoped:
+                content_element = self._crop_to_targets(doc, crop_selectors)
+                if content_element is None:
+                    return None
+
+            # only_text, base64 images, empty elements and attributes
+            self.finalize_tree(
+                content_element if crop else body,
+                1,
+                only_text=kwargs.get("only_text", False),
+                keep_data_attributes=kwargs.get("keep_data_attributes", False),
             )
 
             # Generate output HTML
@@ -777,78 +929,13 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 with_tail=False,
             ).strip()
             
-            # Create links dictionary in the format expected by LinkPreview
+            # Head data for these links is fetched later, as an async stage of
+            # AsyncWebCrawler.aprocess_html, when link_preview_config is set
             links = {
                 "internal": list(internal_links_dict.values()),
                 "external": list(external_links_dict.values()),
             }
-            
-            # Extract head content for links if configured
-            link_preview_config = kwargs.get("link_preview_config")
-            if link_preview_config is not None:
-                try:
-                    import asyncio
-                    from .link_preview import LinkPreview
-                    from .models import Links, Link
-                    
-                    verbose = link_preview_config.verbose
-                    
-                    if verbose:
-                        self._log("info", "Starting link head extraction for {internal} internal and {external} external links",
-                                  params={"internal": len(links["internal"]), "external": len(links["external"])}, tag="LINK_EXTRACT")
-                    
-                    # Convert dict links to Link objects
-                    internal_links = [Link(**link_data) for link_data in links["internal"]]
-                    external_links = [Link(**link_data) for link_data in links["external"]]
-                    links_obj = Links(internal=internal_links, external=external_links)
-                    
-                    # Create a config object for LinkPreview
-                    class TempCrawlerRunConfig:
-                        def __init__(self, link_config, score_links):
-                            self.link_preview_config = link_config
-                            self.score_links = score_links
-                    
-                    config = TempCrawlerRunConfig(link_preview_config, kwargs.get("score_links", False))
-                    
-                    # Extract head content (run async operation in sync context)
-                    async def extract_links():
-                        async with LinkPreview(self.logger) as extractor:
-                            return await extractor.extract_link_heads(links_obj, config)
-                    
-                    # Run the async operation
-                    try:
-                        # Check if we're already in an async context
-                        loop = asyncio.get_running_loop()
-                        # If we're in an async context, we need to run in a thread
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(asyncio.run, extract_links())
-                            updated_links = future.result()
-                    except RuntimeError:
-                        # No running loop, we can use asyncio.run directly
-                        updated_links = asyncio.run(extract_links())
-                    
-                    # Convert back to dict format
-                    links["internal"] = [link.dict() for link in updated_links.internal]
-                    links["external"] = [link.dict() for link in updated_links.external]
-                    
-                    if verbose:
-                        successful_internal = len([l for l in updated_links.internal if l.head_extraction_status == "valid"])
-                        successful_external = len([l for l in updated_links.external if l.head_extraction_status == "valid"])
-                        self._log("info", "Link head extraction completed: {internal_success}/{internal_total} internal, {external_success}/{external_total} external",
-                                  params={
-                                      "internal_success": successful_internal,
-                                      "internal_total": len(updated_links.internal),
-                                      "external_success": successful_external,
-                                      "external_total": len(updated_links.external)
-                                  }, tag="LINK_EXTRACT")
-                    else:
-                        self._log("info", "Link head extraction completed successfully", tag="LINK_EXTRACT")
-                        
-                except Exception as e:
-                    self._log("error", f"Error during link head extraction: {str(e)}", tag="LINK_EXTRACT")
-                    # Continue with original links if head extraction fails
-            
+
             return {
                 "cleaned_html": cleaned_html,
                 "success": success,
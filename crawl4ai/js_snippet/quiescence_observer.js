@@ -0,0 +1,14 @@
+() => {
+    // Install once per document, then report milliseconds since the last DOM change.
+    // Only structure and text count: attribute churn (animations, carousels) is ignored.
+    let state = window.__c4aiQuiescence;
+    if (!state) {
+        state = { last: performance.now() };
+        const observer = new MutationObserver(() => {
+            state.last = performance.now();
+        });
+        observer.observe(document, { subtree: true, childList: true, characterData: true });
+        window.__c4aiQuiescence = state;
+    }
+    return performance.now() - state.last;
+}
@@ -0,0 +1,38 @@
+async ({ y, quietMs, maxWaitMs }) => {
+    // Scroll to y, then wait until the DOM has been quiet for quietMs (capped at maxWaitMs).
+    // One round-trip per scroll step: reports the new height and how much changed.
+    const doc = document.scrollingElement || document.documentElement;
+    const before = doc.scrollHeight;
+    let mutations = 0;
+    let last = performance.now();
+    const observer = new MutationObserver((records) => {
+        mutations += records.length;
+        last = performance.now();
+    });
+    observer.observe(document.body || document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ["src", "srcset"],  // lazy loaders, not animation noise
+    });
+    window.scrollTo(0, y);
+    const start = performance.now();
+    await new Promise((resolve) => {
+        const tick = () => {
+            const now = performance.now();
+            if ((now - start >= quietMs && now - last >= quietMs) || now - start >= maxWaitMs) {
+                resolve();
+            } else {
+                setTimeout(tick, 16);
+            }
+        };
+        tick();
+    });
+    observer.disconnect();
+    return {
+        height: doc.scrollHeight,
+        grew: doc.scrollHeight > before,
+        mutations: mutations,
+        viewport: window.innerHeight,
+    };
+}
@@ -7,7 +7,8 @@ efficient parallel processing and caching infrastructure.
 
 import asyncio
 import fnmatch
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from .async_logger import AsyncLogger
 from .async_url_seeder import AsyncUrlSeeder
 from .async_configs import SeedingConfig, CrawlerRunConfig
@@ -25,18 +26,36 @@ class LinkPreview:
     - Caching for performance
     - BM25 relevance scoring
     - Memory-safe processing for large link sets
+
+    One instance is meant to live as long as the crawler: head results are kept
+    in an LRU keyed by URL and fetch settings, and a URL already being fetched for another
+    page is awaited rather than requested again. Only successful ("valid") heads are
+    cached, so a URL that failed or timed out is tried again by the next page.
     """
     
-    def __init__(self, logger: Optional[AsyncLogger] = None):
+    def __init__(
+        self,
+        logger: Optional[AsyncLogger] = None,
+        seeder: Optional[AsyncUrlSeeder] = None,
+        cache_size: int = 10000,
+    ):
         """
         Initialize the LinkPreview.
         
         Args:
             logger: Optional logger instance for recording events
+            seeder: Optional AsyncUrlSeeder to share (and its HTTP client). It is
+                not closed by this instance.
+            cache_size: Number of head results kept for reuse across pages.
+                0 disables the cache.
         """
         self.logger = logger
-        self.seeder: Optional[AsyncUrlSeeder] = None
+        self.seeder: Optional[AsyncUrlSeeder] = seeder
         self._owns_seeder = False
+        self.cache_size = cache_size
+        self._head_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.cache_hits = 0
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -60,6 +79,7 @@ class LinkPreview:
             await self.seeder.__aexit__(None, None, None)
             self.seeder = None
             self._owns_seeder = False
+        self._head_cache.clear()
     
     def _log(self, level: str, message: str, tag: str = "LINK_EXTRACT", **kwargs):
         """Helper method to safely log messages."""
@@ -98,8 +118,8 @@ class LinkPreview:
         self._log("info", "Extracting head content for {count} filtered links",
                   params={"count": len(filtered_urls)})
         
-        # Extract head content using URLSeeder
-        head_results = await self._extract_heads_parallel(filtered_urls, link_config)
+        # Extract head content using URLSeeder, skipping URLs seen on earlier pages
+        head_results = await self._extract_heads_cached(filtered_urls, link_config)
         
         # Merge results back into Link objects
         updated_links = self._merge_head_data(links, head_results, config)
@@ -174,6 +194,75 @@ class LinkPreview:
         
         return unique_urls
     
+    async def _extract_heads_cached(
+        self,
+        urls: List[str],
+        link_config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return head results for urls, fetching only those not cached or in flight.
+
+        Results are keyed by url, query, score threshold and timeout, since the
+        seeder scores and filters on the first two and a longer timeout may succeed
+        where a shorter one failed. URLs another page is already fetching are
+        awaited, not refetched.
+        """
+        settings = (link_config.query, link_config.score_threshold, link_config.timeout)
+        loop = asyncio.get_running_loop()
+        cached: Dict[str, Dict[str, Any]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        to_fetch: List[str] = []
+
+        for url in urls:
+            key = (url, *settings)
+            if key in self._head_cache:
+                self._head_cache.move_to_end(key)
+                cached[url] = self._head_cache[key]
+            elif key in self._inflight:
+                waiting[url] = self._inflight[key]
+            else:
+                self._inflight[key] = loop.create_future()
+                to_fetch.append(url)
+
+        self.cache_hits += len(cached) + len(waiting)
+        if cached or waiting:
+            self._log("debug", "Reusing head data for {count} links, fetching {fetch}",
+                      params={"count": len(cached) + len(waiting), "fetch": len(to_fetch)})
+
+        fetched: Dict[str, Dict[str, Any]] = {}
+        try:
+            if to_fetch:
+                for result in await self._extract_heads_parallel(to_fetch, link_config):
+                    if result.get("url"):
+                        fetched[result["url"]] = result
+        finally:
+            for url in to_fetch:
+                key = (url, *settings)
+                future = self._inflight.pop(key)
+                result = fetched.get(url)
+                if result is not None and result.get("status") == "valid":
+                    self._remember(key, result)
+                # Waiters on a URL that produced no result simply get nothing
+                if not future.done():
+                    future.set_result(result)
+
+        if waiting:
+            for url, future in waiting.items():
+                result = await asyncio.shield(future)
+                if result is not None:
+                    cached[url] = result
+
+        merged = {**cached, **fetched}
+        return [merged[url] for url in urls if url in merged]
+
+    def _remember(self, key: Tuple, result: Dict[str, Any]):
+        if self.cache_size <= 0:
+            return
+        self._head_cache[key] = result
+        self._head_cache.move_to_end(key)
+        while len(self._head_cache) > self.cache_size:
+            self._head_cache.popitem(last=False)
+
     async def _extract_heads_parallel(
         self, 
         urls: List[str], 
@@ -17,6 +17,8 @@ class DomainState:
     last_request_time: float = 0
     current_delay: float = 0
     fail_count: int = 0
+    tokens: float = 0  # Token bucket, used when RateLimiter.requests_per_second is set
+    last_refill: float = 0
 
 
 @dataclass
@@ -31,6 +33,7 @@ class CrawlerTaskResult:
     error_message: str = ""
     retry_count: int = 0
     wait_time: float = 0.0
+    deadline_exceeded: bool = False
     
     @property
     def success(self) -> bool:
@@ -115,6 +118,9 @@ class DispatchResult(BaseModel):
     start_time: Union[datetime, float]
     end_time: Union[datetime, float]
     error_message: str = ""
+    queue_wait_time: float = 0.0  # Seconds spent queued before the crawl started
+    execution_time: float = 0.0  # Seconds spent crawling
+    deadline_exceeded: bool = False  # Cancelled or skipped because the job deadline passed
 
 class MarkdownGenerationResult(BaseModel):
     raw_markdown: str
@@ -136,7 +142,7 @@ class CrawlResult(BaseModel):
     links: Dict[str, List[Dict]] = {}
     downloaded_files: Optional[List[str]] = None
     js_execution_result: Optional[Dict[str, Any]] = None
-    screenshot: Optional[str] = None
+    screenshot: Optional[Union[str, bytes]] = None  # base64, raw bytes or file path (screenshot_output)
     pdf: Optional[bytes] = None
     mhtml: Optional[str] = None
     _markdown: Optional[MarkdownGenerationResult] = PrivateAttr(default=None)
@@ -151,6 +157,7 @@ class CrawlResult(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    fetch_strategy: Optional[str] = None  # "http" or "browser" when fetched by the hybrid strategy
     tables: List[Dict] = Field(default_factory=list)  # NEW – [{headers,rows,caption,summary}]
 
     class Config:
@@ -331,6 +338,7 @@ class AsyncCrawlResponse(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    fetch_strategy: Optional[str] = None  # "http" or "browser" when fetched by the hybrid strategy
 
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,263 @@
+"""Filterable, optionally bounded capture of a page's network traffic."""
+
+import time
+from collections import deque
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+
+class NetworkCapture:
+    """
+    Records network events of a single page for ``CrawlerRunConfig.capture_network_requests``.
+
+    Events are filtered by resource type, URL pattern and response status before
+    anything is copied. With ``max_entries`` set they are kept in a ring buffer so
+    only the newest survive. In ``"summary"`` mode no events are stored at all;
+    counts, bytes and timings are aggregated per domain instead.
+
+    Response bodies are stored as ``{"text": ...}``. Only a body that was cut by
+    ``body_max_bytes`` also gets ``"truncated": True`` and its full ``"size"``.
+
+    Args:
+        mode (str): "full" to record individual events, "summary" for per-domain totals.
+        resource_types (Sequence[str] or None): Playwright resource types to keep
+            (e.g. ["document", "xhr", "fetch"]). None keeps all.
+        url_patterns (Sequence[str] or None): Glob patterns matched against the URL.
+            None keeps all.
+        status_ranges (Sequence[Tuple[int, int]] or None): Inclusive status ranges a
+            response must fall in to be kept, e.g. [(400, 599)]. Only applies to
+            response events.
+        max_entries (int or None): Ring buffer size. None keeps every event.
+        body_max_bytes (int or None): Response and post bodies are cut to this many
+            bytes. 0 skips bodies, None keeps them whole.
+    """
+
+    MODES = ("full", "summary")
+
+    def __init__(
+        self,
+        mode: str = "full",
+        resource_types: Optional[Sequence[str]] = None,
+        url_patterns: Optional[Sequence[str]] = None,
+        status_ranges: Optional[Sequence[Tuple[int, int]]] = None,
+        max_entries: Optional[int] = None,
+        body_max_bytes: Optional[int] = None,
+        logger=None,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unknown network capture mode '{mode}'. Expected one of: {', '.join(self.MODES)}"
+            )
+        self.mode = mode
+        self.resource_types = set(resource_types) if resource_types else None
+        self.url_patterns = list(url_patterns) if url_patterns else None
+        self.status_ranges = [tuple(r) for r in status_ranges] if status_ranges else None
+        self.max_entries = max_entries
+        self.body_max_bytes = body_max_bytes
+        self.logger = logger
+        self.events = deque(maxlen=max_entries)
+        self.dropped = 0
+        self.domains: Dict[str, Dict[str, Any]] = {}
+        self._handlers = []
+
+    @classmethod
+    def from_config(cls, config, logger=None) -> "NetworkCapture":
+        return cls(
+            mode=config.network_capture_mode,
+            resource_types=config.network_capture_resource_types,
+            url_patterns=config.network_capture_url_patterns,
+            status_ranges=config.network_capture_status_ranges,
+            max_entries=config.network_capture_max_entries,
+            body_max_bytes=config.network_capture_body_max_bytes,
+            logger=logger,
+        )
+
+    # --- filters -----------------------------------------------------------
+
+    def wants(self, url: str, resource_type: str) -> bool:
+        if self.resource_types is not None and resource_type not in self.resource_types:
+            return False
+        if self.url_patterns is not None and not any(fnmatch(url, p) for p in self.url_patterns):
+            return False
+        return True
+
+    def wants_status(self, status: int) -> bool:
+        if self.status_ranges is None:
+            return True
+        return any(low <= status <= high for low, high in self.status_ranges)
+
+    # --- recording ---------------------------------------------------------
+
+    def _append(self, event: Dict[str, Any]):
+        if self.max_entries is not None and len(self.events) == self.max_entries:
+            self.dropped += 1
+        self.events.append(event)
+
+    def _domain(self, url: str) -> Dict[str, Any]:
+        domain = urlparse(url).netloc or url.split(":", 1)[0]
+        stats = self.domains.get(domain)
+        if stats is None:
+            stats = self.domains[domain] = {
+                "event_type": "summary",
+                "domain": domain,
+                "requests": 0,
+                "responses": 0,
+                "failed": 0,
+                "bytes": 0,
+                "status_counts": {},
+                "total_time_ms": 0.0,
+                "max_time_ms": 0.0,
+            }
+        return stats
+
+    def _cap(self, data: bytes) -> Tuple[str, bool]:
+        truncated = self.body_max_bytes is not None and len(data) > self.body_max_bytes
+        if truncated:
+            data = data[: self.body_max_bytes]
+        return data.decode("utf-8", errors="replace"), truncated
+
+    def on_request(self, request):
+        if not self.wants(request.url, request.resource_type):
+            return
+        if self.mode == "summary":
+            self._domain(request.url)["requests"] += 1
+            return
+        try:
+            post_data = None
+            if self.body_max_bytes != 0:
+                try:
+                    buffer = request.post_data_buffer
+                    if buffer:
+                        post_data, _ = self._cap(buffer)
+                except Exception:
+                    post_data = "[Error retrieving post data]"
+            self._append({
+                "event_type": "request",
+                "url": request.url,
+                "method": request.method,
+                "headers": dict(request.headers),
+                "post_data": post_data,
+                "resource_type": request.resource_type,
+                "is_navigation_request": request.is_navigation_request(),
+                "timestamp": time.time(),
+            })
+        except Exception as e:
+            self._capture_error("request_capture_error", request.url, e)
+
+    async def on_response(self, response):
+        request = response.request
+        if not self.wants(response.url, request.resource_type):
+            return
+        if not self.wants_status(response.status):
+            return
+        if self.mode == "summary":
+            stats = self._domain(response.url)
+            stats["responses"] += 1
+            status = str(response.status)
+            stats["status_counts"][status] = stats["status_counts"].get(status, 0) + 1
+            try:
+                stats["bytes"] += int(response.headers.get("content-length", 0))
+            except ValueError:
+                pass
+            return
+        try:
+            event = {
+                "event_type": "response",
+                "url": response.url,
+                "status": response.status,
+                "status_text": response.status_text,
+                "headers": dict(response.headers),
+                "from_service_worker": response.from_service_worker,
+                "request_timing": request.timing,
+                "timestamp": time.time(),
+            }
+            # Append before awaiting the body so event order follows the page
+            self._append(event)
+            if self.body_max_bytes != 0:
+                event["body"] = await self._read_body(response)
+        except Exception as e:
+            self._capture_error("response_capture_error", response.url, e)
+
+    async def _read_body(self, response) -> Dict[str, Any]:
+        try:
+            length = int(response.headers.get("content-length", -1))
+        except ValueError:
+            length = -1
+        if self.body_max_bytes is not None and length > self.body_max_bytes * 4:
+            # Far over the cap; don't pull it across the wire just to drop it
+            return {"text": None, "truncated": True, "size": length}
+        try:
+            data = await response.body()
+        except Exception:
+            return {"text": None}
+        text, truncated = self._cap(data)
+        if not truncated:
+            return {"text": text}
+        return {"text": text, "truncated": True, "size": len(data)}
+
+    def on_request_finished(self, request):
+        if self.mode != "summary" or not self.wants(request.url, request.resource_type):
+            return
+        timing = request.timing or {}
+        elapsed = timing.get("responseEnd", -1)
+        if elapsed is not None and elapsed >= 0:
+            stats = self._domain(request.url)
+            stats["total_time_ms"] += elapsed
+            stats["max_time_ms"] = max(stats["max_time_ms"], elapsed)
+
+    def on_request_failed(self, request):
+        if not self.wants(request.url, request.resource_type):
+            return
+        if self.mode == "summary":
+            self._domain(request.url)["failed"] += 1
+            return
+        try:
+            self._append({
+                "event_type": "request_failed",
+                "url": request.url,
+                "method": request.method,
+                "resource_type": request.resource_type,
+                "failure_text": str(request.failure) if request.failure else "Unknown failure",
+                "timestamp": time.time(),
+            })
+        except Exception as e:
+            self._capture_error("request_failed_capture_error", request.url, e)
+
+    def _capture_error(self, event_type: str, url: str, error: Exception):
+        if self.logger:
+            self.logger.warning(
+                message="Error capturing network event for {url}: {error}",
+                tag="CAPTURE",
+                params={"url": url, "error": str(error)},
+            )
+        self._append({"event_type": event_type, "url": url, "error": str(error), "timestamp": time.time()})
+
+    # --- page wiring -------------------------------------------------------
+
+    def attach(self, page):
+        self._handlers = [
+            ("request", self.on_request),
+            ("response", self.on_response),
+            ("requestfailed", self.on_request_failed),
+        ]
+        if self.mode == "summary":
+            self._handlers.append(("requestfinished", self.on_request_finished))
+        for event, handler in self._handlers:
+            page.on(event, handler)
+
+    def detach(self, page):
+        for event, handler in self._handlers:
+            page.remove_listener(event, handler)
+        self._handlers = []
+
+    def results(self) -> List[Dict[str, Any]]:
+        if self.mode == "summary":
+            return list(self.domains.values())
+        if self.dropped and self.logger:
+            self.logger.info(
+                message="Network capture kept the last {kept} events, dropped {dropped} older ones",
+                tag="CAPTURE",
+                params={"kept": len(self.events), "dropped": self.dropped},
+            )
+        return list(self.events)
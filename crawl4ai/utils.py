@@ -26,6 +26,7 @@ import cProfile
 import pstats
 from functools import wraps
 import asyncio
+import weakref
 from lxml import etree, html as lhtml
 import sqlite3
 import hashlib
@@ -39,7 +40,7 @@ from . import __version__
 from typing import Sequence
 
 from itertools import chain
-from collections import deque
+from collections import deque, OrderedDict
 import psutil
 import numpy as np
 
@@ -252,17 +253,36 @@ class VersionManager:
 class RobotsParser:
     # Default 7 days cache TTL
     CACHE_TTL = 7 * 24 * 60 * 60
+    # Hosts whose robots.txt couldn't be fetched are retried after this long
+    ERROR_TTL = 5 * 60
+    # Parsed rules kept in memory per cache database
+    MEMORY_CACHE_SIZE = 4096
+
+    # Shared by every instance in the process: one connection and the parsed rules per
+    # database, in-flight fetches per host, and one HTTP session per event loop with
+    # the instances using it
+    _connections: Dict[str, sqlite3.Connection] = {}
+    _memory: Dict[str, "OrderedDict[str, tuple]"] = {}
+    _inflight: Dict[tuple, "asyncio.Future"] = {}
+    _sessions: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _session_users: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
 
     def __init__(self, cache_dir=None, cache_ttl=None):
         self.cache_dir = cache_dir or os.path.join(get_home_folder(), ".crawl4ai", "robots")
         self.cache_ttl = cache_ttl or self.CACHE_TTL
         os.makedirs(self.cache_dir, exist_ok=True)
         self.db_path = os.path.join(self.cache_dir, "robots_cache.db")
-        self._init_db()
+        self._conn = RobotsParser._connections.get(self.db_path)
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._init_db()
+            RobotsParser._connections[self.db_path] = self._conn
+        # domain -> (RobotFileParser or None, fetch_time, fetch_failed), most recently used last
+        self._rules = RobotsParser._memory.setdefault(self.db_path, OrderedDict())
 
     def _init_db(self):
         # Use WAL mode for better concurrency and performance
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS robots_cache (
@@ -276,24 +296,23 @@ class RobotsParser:
 
     def _get_cached_rules(self, domain: str) -> tuple[str, bool]:
         """Get cached rules. Returns (rules, is_fresh)"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT rules, fetch_time, hash FROM robots_cache WHERE domain = ?", 
-                (domain,)
-            )
-            result = cursor.fetchone()
+        cursor = self._conn.execute(
+            "SELECT rules, fetch_time, hash FROM robots_cache WHERE domain = ?", 
+            (domain,)
+        )
+        result = cursor.fetchone()
+        
+        if not result:
+            return None, False
             
-            if not result:
-                return None, False
-                
-            rules, fetch_time, _ = result
-            # Check if cache is still fresh based on TTL
-            return rules, (time.time() - fetch_time) < self.cache_ttl
+        rules, fetch_time, _ = result
+        # Check if cache is still fresh based on TTL
+        return rules, (time.time() - fetch_time) < self.cache_ttl
 
     def _cache_rules(self, domain: str, content: str):
         """Cache robots.txt content with hash for change detection"""
         hash_val = hashlib.md5(content.encode()).hexdigest()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             # Check if content actually changed
             cursor = conn.execute(
                 "SELECT hash FROM robots_cache WHERE domain = ?", 
@@ -309,6 +328,99 @@ class RobotsParser:
                        VALUES (?, ?, ?, ?)""",
                     (domain, content, int(time.time()), hash_val)
                 )
+            else:
+                conn.execute(
+                    "UPDATE robots_cache SET fetch_time = ? WHERE domain = ?",
+                    (int(time.time()), domain)
+                )
+
+    @staticmethod
+    def _parse(rules: Optional[str]) -> Optional[RobotFileParser]:
+        if not rules:
+            return None
+        parser = RobotFileParser()
+        parser.parse(rules.splitlines())
+        # If parser can't read rules, allow access
+        return parser if parser.mtime() else None
+
+    def _remember(self, domain: str, parser: Optional[RobotFileParser], fetch_time: float, failed: bool = False):
+        self._rules[domain] = (parser, fetch_time, failed)
+        self._rules.move_to_end(domain)
+        while len(self._rules) > self.MEMORY_CACHE_SIZE:
+            self._rules.popitem(last=False)
+
+    def _lookup(self, domain: str):
+        """Fresh parsed rules from memory, then from the database. Returns (found, parser)."""
+        entry = self._rules.get(domain)
+        if entry and self._is_fresh(entry):
+            self._rules.move_to_end(domain)
+            return True, entry[0]
+
+        cursor = self._conn.execute(
+            "SELECT rules, fetch_time FROM robots_cache WHERE domain = ?", (domain,)
+        )
+        result = cursor.fetchone()
+        if result and (time.time() - result[1]) < self.cache_ttl:
+            parser = self._parse(result[0])
+            self._remember(domain, parser, result[1])
+            return True, parser
+        return False, None
+
+    def _is_fresh(self, entry: tuple) -> bool:
+        _, fetch_time, failed = entry
+        return time.time() - fetch_time < (self.ERROR_TTL if failed else self.cache_ttl)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """The running loop's shared session; this instance counts as a user until close()."""
+        loop = asyncio.get_running_loop()
+        session = RobotsParser._sessions.get(loop)
+        if session is None or session.closed:
+            session = RobotsParser._sessions[loop] = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=2)
+            )
+        users = RobotsParser._session_users.get(loop)
+        if users is None:
+            users = RobotsParser._session_users[loop] = weakref.WeakSet()
+        users.add(self)
+        return session
+
+    async def _fetch(self, scheme: str, domain: str) -> Optional[RobotFileParser]:
+        # Ensure we use the same scheme as the input URL
+        robots_url = f"{scheme}://{domain}/robots.txt"
+        try:
+            async with self._get_session().get(robots_url, ssl=False) as response:
+                if 200 <= response.status < 300:
+                    rules = await response.text()
+                elif 400 <= response.status < 500 and response.status != 429:
+                    # No robots.txt means everything is allowed; remember that too
+                    rules = ""
+                else:
+                    # 5xx and 429 are temporary; allow for now but ask again soon
+                    self._remember(domain, None, time.time(), failed=True)
+                    return None
+        except Exception as _ex:
+            # On any error (timeout, connection failed, etc), allow access for now
+            self._remember(domain, None, time.time(), failed=True)
+            return None
+
+        self._cache_rules(domain, rules)
+        parser = self._parse(rules)
+        self._remember(domain, parser, time.time())
+        return parser
+
+    async def _get_parser(self, scheme: str, domain: str) -> Optional[RobotFileParser]:
+        found, parser = self._lookup(domain)
+        if found:
+            return parser
+
+        # One fetch per host, however many URLs of it are being checked
+        key = (self.db_path, domain)
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fetch(scheme, domain))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
 
     async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
         """
@@ -330,48 +442,56 @@ class RobotsParser:
         except Exception as _ex:
             return True
 
-        # Fast path - check cache first
-        rules, is_fresh = self._get_cached_rules(domain)
-        
-        # If rules not found or stale, fetch new ones
-        if not is_fresh:
-            try:
-                # Ensure we use the same scheme as the input URL
-                scheme = parsed.scheme or 'http'
-                robots_url = f"{scheme}://{domain}/robots.txt"
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(robots_url, timeout=2, ssl=False) as response:
-                        if response.status == 200:
-                            rules = await response.text()
-                            self._cache_rules(domain, rules)
-                        else:
-                            return True
-            except Exception as _ex:
-                # On any error (timeout, connection failed, etc), allow access
-                return True
-
-        if not rules:
+        parser = await self._get_parser(parsed.scheme or 'http', domain)
+        if parser is None:
             return True
-
-        # Create parser for this check
-        parser = RobotFileParser() 
-        parser.parse(rules.splitlines())
-        
-        # If parser can't read rules, allow access
-        if not parser.mtime():
-            return True
-            
         return parser.can_fetch(user_agent, url)
 
+    def crawl_delay(self, url: str, user_agent: str = "*") -> Optional[float]:
+        """
+        Crawl-delay for the URL's host, if its robots.txt has already been read.
+
+        Only looks at rules in memory, so it is cheap enough to call before every request.
+        """
+        entry = self._rules.get(urlparse(url).netloc)
+        if not entry or entry[0] is None:
+            return None
+        delay = entry[0].crawl_delay(user_agent)
+        return float(delay) if delay is not None else None
+
+    def request_rate(self, url: str, user_agent: str = "*") -> Optional[float]:
+        """Request-rate for the URL's host as requests per second, if its robots.txt has already been read."""
+        entry = self._rules.get(urlparse(url).netloc)
+        if not entry or entry[0] is None:
+            return None
+        rate = entry[0].request_rate(user_agent)
+        if rate is None or not rate.seconds:
+            return None
+        return rate.requests / rate.seconds
+
+    async def close(self):
+        """Stop using the running loop's shared session, closing it if no other instance does."""
+        loop = asyncio.get_running_loop()
+        users = RobotsParser._session_users.get(loop)
+        if users is not None:
+            users.discard(self)
+            if users:
+                return
+        session = RobotsParser._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
     def clear_cache(self):
         """Clear all cached robots.txt entries"""
-        with sqlite3.connect(self.db_path) as conn:
+        self._rules.clear()
+        with self._conn as conn:
             conn.execute("DELETE FROM robots_cache")
 
     def clear_expired(self):
         """Remove only expired entries from cache"""
-        with sqlite3.connect(self.db_path) as conn:
+        for domain in [d for d, entry in self._rules.items() if not self._is_fresh(entry)]:
+            del self._rules[domain]
+        with self._conn as conn:
             expire_time = int(time.time()) - self.cache_ttl
             conn.execute("DELETE FROM robots_cache WHERE fetch_time < ?", (expire_time,))
       
@@ -26,6 +26,7 @@ from crawl4ai import (
     LLMConfig
 )
 from crawl4ai.utils import perform_completion_with_backoff
+from scheduler import set_request_class
 from crawl4ai.content_filter_strategy import (
     PruningContentFilter,
     BM25ContentFilter,
@@ -782,6 +783,8 @@ async def handle_crawl_job(
     crawler_config: Dict,
     config: Dict,
     webhook_config: Optional[Dict] = None,
+    tenant: Optional[str] = None,
+    priority: str = "background",
 ) -> Dict:
     """
     Fire-and-forget version of handle_crawl_request.
@@ -809,6 +812,8 @@ async def handle_crawl_job(
     webhook_service = WebhookDeliveryService(config)
 
     async def _runner():
+        # Runs after the response is sent; schedule its page crawls as this caller's job
+        set_request_class(tenant, priority)
         try:
             result = await handle_crawl_request(
                 urls=urls,
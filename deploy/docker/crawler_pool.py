@@ -2,7 +2,7 @@
 import asyncio, json, hashlib, time
 from contextlib import suppress
 from typing import Dict, Optional
-from crawl4ai import AsyncWebCrawler, BrowserConfig
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 from utils import load_config, get_container_memory_percent
 import logging
 
@@ -20,6 +20,7 @@ LOCK = asyncio.Lock()
 # Config
 MEM_LIMIT = CONFIG.get("crawler", {}).get("memory_threshold_percent", 95.0)
 BASE_IDLE_TTL = CONFIG.get("crawler", {}).get("pool", {}).get("idle_ttl_sec", 300)
+PREWARM_PAGES = CONFIG.get("crawler", {}).get("pool", {}).get("prewarm_pages", 0)
 DEFAULT_CONFIG_SIG = None  # Cached sig for default config
 
 def _sig(cfg: BrowserConfig) -> str:
@@ -31,6 +32,14 @@ def _is_default_config(sig: str) -> bool:
     """Check if config matches default."""
     return sig == DEFAULT_CONFIG_SIG
 
+async def _prewarm(crawler: AsyncWebCrawler):
+    """Keep default-config pages ready so the first request skips context setup."""
+    if PREWARM_PAGES <= 0:
+        return
+    browser_manager = getattr(crawler.crawler_strategy, "browser_manager", None)
+    if browser_manager is not None:
+        await browser_manager.prewarm([CrawlerRunConfig()], PREWARM_PAGES, wait=False)
+
 async def get_crawler(cfg: BrowserConfig) -> AsyncWebCrawler:
     """Get crawler from pool with tiered strategy."""
     sig = _sig(cfg)
@@ -80,6 +89,7 @@ async def get_crawler(cfg: BrowserConfig) -> AsyncWebCrawler:
         logger.info(f"🆕 Creating new browser in cold pool (sig={sig[:8]}, mem={mem_pct:.1f}%)")
         crawler = AsyncWebCrawler(config=cfg, thread_safe=False)
         await crawler.start()
+        await _prewarm(crawler)
         COLD_POOL[sig] = crawler
         LAST_USED[sig] = time.time()
         USAGE_COUNT[sig] = 1
@@ -95,6 +105,7 @@ async def init_permanent(cfg: BrowserConfig):
         logger.info("🔥 Creating permanent default browser")
         PERMANENT = AsyncWebCrawler(config=cfg, thread_safe=False)
         await PERMANENT.start()
+        await _prewarm(PERMANENT)
         LAST_USED[DEFAULT_CONFIG_SIG] = time.time()
         USAGE_COUNT[DEFAULT_CONFIG_SIG] = 0
 
@@ -3,7 +3,7 @@ Job endpoints (enqueue + poll) for long-running LL​M extraction and raw crawl.
 Relies on the existing Redis task helpers in api.py
 """
 
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, Literal
 from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from pydantic import BaseModel, HttpUrl
 
@@ -13,6 +13,7 @@ from api import (
     handle_task_status,
 )
 from schemas import WebhookConfig
+from scheduler import cap_priority, request_tenant, set_request_class
 
 # ------------- dependency placeholders -------------
 _redis = None        # will be injected from server.py
@@ -48,6 +49,7 @@ class CrawlJobPayload(BaseModel):
     browser_config: Dict = {}
     crawler_config: Dict = {}
     webhook_config: Optional[WebhookConfig] = None
+    priority:       Literal["interactive", "batch", "background"] = "background"
 
 
 # ---------- LL​M job ---------------------------------------------------------
@@ -62,6 +64,8 @@ async def llm_job_enqueue(
     if payload.webhook_config:
         webhook_config = payload.webhook_config.model_dump(mode='json')
 
+    # Inherited by the background task that runs the crawl
+    set_request_class(request_tenant(request, _td), "background")
     return await handle_llm_request(
         _redis,
         background_tasks,
@@ -90,6 +94,7 @@ async def llm_job_status(
 # ---------- CRAWL job -------------------------------------------------------
 @router.post("/crawl/job", status_code=202)
 async def crawl_job_enqueue(
+        request: Request,
         payload: CrawlJobPayload,
         background_tasks: BackgroundTasks,
         _td: Dict = Depends(lambda: _token_dep()),
@@ -106,6 +111,8 @@ async def crawl_job_enqueue(
         payload.crawler_config,
         config=_config,
         webhook_config=webhook_config,
+        tenant=request_tenant(request, _td),
+        priority=cap_priority(payload.priority, "batch"),
     )
 
 
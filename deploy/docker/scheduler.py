@@ -0,0 +1,152 @@
+# scheduler.py - Cross-request crawl scheduler with priority classes and fair queuing
+import asyncio, contextvars, heapq, itertools, time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+PRIORITY_CLASSES = ("interactive", "batch", "background")  # Highest first
+DEFAULT_PRIORITY = "interactive"
+ANONYMOUS = "anonymous"
+FINISH_TAG_TTL = 300.0  # Seconds a tenant's finish tag is kept after its last crawl
+
+# (tenant, priority) of the request being served; inherited by every task it spawns
+_REQUEST_CLASS: contextvars.ContextVar[Tuple[Optional[str], Optional[str]]] = \
+    contextvars.ContextVar("crawl_request_class", default=(None, None))
+
+
+def set_request_class(tenant: Optional[str], priority: Optional[str]) -> None:
+    """Tag the current request so its page crawls are scheduled as (tenant, priority)."""
+    _REQUEST_CLASS.set((tenant, priority))
+
+
+def get_request_class() -> Tuple[str, str]:
+    tenant, priority = _REQUEST_CLASS.get()
+    return tenant or ANONYMOUS, priority or DEFAULT_PRIORITY
+
+
+def cap_priority(requested: Optional[str], ceiling: str) -> str:
+    """Clamp a client-chosen class to `ceiling`; callers may only demote themselves."""
+    if requested is None:
+        return ceiling
+    return PRIORITY_CLASSES[max(PRIORITY_CLASSES.index(requested), PRIORITY_CLASSES.index(ceiling))]
+
+
+def request_tenant(request, token_data: Optional[Dict] = None) -> str:
+    """Fair-queuing identity: the JWT subject when auth is on, else the client address."""
+    if token_data and token_data.get("sub"):
+        return str(token_data["sub"])
+    return request.client.host if request and request.client else ANONYMOUS
+
+
+class CrawlScheduler:
+    """
+    Hands out page-crawl slots across all requests.
+
+    Priority classes are served strictly in order (interactive, batch,
+    background), and `reserved_interactive` slots are never given to batch or
+    background work, so a free slot is always available to interactive calls
+    unless interactive load alone exceeds it. Within a class, tenants (API
+    tokens) share slots by start-time fair queuing: each crawl is tagged
+    max(virtual_time, tenant_last_finish) and advances the tenant's finish tag
+    by 1/weight, so a tenant queueing 10k URLs cannot starve one queueing a few.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        reserved_interactive: int = 0,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        default_weight: float = 1.0,
+    ):
+        self.capacity = capacity
+        self.reserved_interactive = min(reserved_interactive, max(capacity - 1, 0))
+        self.tenant_weights = tenant_weights or {}
+        self.default_weight = default_weight
+        self.in_use: Dict[str, int] = {p: 0 for p in PRIORITY_CLASSES}
+        self._waiting: Dict[str, List] = {p: [] for p in PRIORITY_CLASSES}
+        self._virtual_time: Dict[str, float] = {p: 0.0 for p in PRIORITY_CLASSES}
+        # (tenant, priority) -> (finish tag, monotonic time of the tenant's last crawl)
+        self._last_finish: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._next_prune = 0.0
+        self._seq = itertools.count()
+
+    def _weight(self, tenant: str) -> float:
+        return max(float(self.tenant_weights.get(tenant, self.default_weight)), 1e-6)
+
+    def _limit(self, priority: str) -> int:
+        if priority == "interactive":
+            return self.capacity
+        return self.capacity - self.reserved_interactive
+
+    def _prune(self, now: float) -> None:
+        """Forget finish tags of tenants that have not crawled for FINISH_TAG_TTL."""
+        if now < self._next_prune:
+            return
+        self._next_prune = now + FINISH_TAG_TTL
+        cutoff = now - FINISH_TAG_TTL
+        for key in [k for k, (_, seen) in self._last_finish.items() if seen < cutoff]:
+            del self._last_finish[key]
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the best waiters."""
+        total = sum(self.in_use.values())
+        for priority in PRIORITY_CLASSES:
+            heap = self._waiting[priority]
+            while heap:
+                if heap[0][3].done():  # Caller went away while queued
+                    heapq.heappop(heap)
+                    continue
+                if total >= self._limit(priority):
+                    break
+                start_tag, _, tenant, fut = heapq.heappop(heap)
+                self._virtual_time[priority] = start_tag
+                self.in_use[priority] += 1
+                total += 1
+                fut.set_result(priority)
+            if heap:
+                # Lower classes never jump ahead of a class that is still waiting
+                return
+
+    async def acquire(self, tenant: str, priority: str) -> str:
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority {priority!r}, expected one of {PRIORITY_CLASSES}")
+        now = time.monotonic()
+        self._prune(now)
+        key = (tenant, priority)
+        start_tag = max(self._virtual_time[priority], self._last_finish.get(key, (0.0, now))[0])
+        self._last_finish[key] = (start_tag + 1.0 / self._weight(tenant), now)
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting[priority], (start_tag, next(self._seq), tenant, fut))
+        self._dispatch()
+        try:
+            return await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was granted just as we were cancelled
+                self.release(fut.result())
+            raise
+
+    def release(self, priority: str) -> None:
+        self.in_use[priority] -= 1
+        if not any(self.in_use.values()) and not any(self._waiting.values()):
+            # Idle: no finish tag matters any more
+            self._last_finish.clear()
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, tenant: Optional[str] = None, priority: Optional[str] = None):
+        if tenant is None or priority is None:
+            ctx_tenant, ctx_priority = get_request_class()
+            tenant, priority = tenant or ctx_tenant, priority or ctx_priority
+        granted = await self.acquire(tenant, priority)
+        try:
+            yield
+        finally:
+            self.release(granted)
+
+    def stats(self) -> Dict:
+        return {
+            "capacity": self.capacity,
+            "reserved_interactive": self.reserved_interactive,
+            "in_use": dict(self.in_use),
+            "waiting": {p: sum(1 for *_, f in h if not f.done()) for p, h in self._waiting.items()},
+        }
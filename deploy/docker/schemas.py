@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
 from enum import Enum
 from pydantic import BaseModel, Field, HttpUrl
 from utils import FilterType
@@ -8,6 +8,10 @@ class CrawlRequest(BaseModel):
     urls: List[str] = Field(min_length=1, max_length=100)
     browser_config: Optional[Dict] = Field(default_factory=dict)
     crawler_config: Optional[Dict] = Field(default_factory=dict)
+    priority: Optional[Literal["interactive", "batch", "background"]] = Field(
+        default=None,
+        description="Scheduling class. Defaults to, and may not exceed, interactive for one URL and batch otherwise"
+    )
 
 
 class HookConfig(BaseModel):
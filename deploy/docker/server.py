@@ -55,6 +55,7 @@ from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.staticfiles import StaticFiles
 from job import init_job_router
+from scheduler import CrawlScheduler, cap_priority, set_request_class, request_tenant
 
 from mcp_bridge import attach_mcp, mcp_resource, mcp_template, mcp_tool
 
@@ -75,9 +76,14 @@ setup_logging(config)
 
 __version__ = "0.5.1-d1"
 
-# ── global page semaphore (hard cap) ─────────────────────────
+# ── global page scheduler (hard cap + fair sharing) ──────────
 MAX_PAGES = config["crawler"]["pool"].get("max_pages", 30)
-GLOBAL_SEM = asyncio.Semaphore(MAX_PAGES)
+_sched_cfg = config["crawler"].get("scheduler", {})
+SCHEDULER = CrawlScheduler(
+    capacity=MAX_PAGES,
+    reserved_interactive=_sched_cfg.get("reserved_interactive", 0),
+    tenant_weights=_sched_cfg.get("tenant_weights") or {},
+)
 
 # ── default browser config helper ─────────────────────────────
 def get_default_browser_config() -> BrowserConfig:
@@ -87,23 +93,12 @@ def get_default_browser_config() -> BrowserConfig:
         **config["crawler"]["browser"].get("kwargs", {}),
     )
 
-# import logging
-# page_log = logging.getLogger("page_cap")
-# orig_arun = AsyncWebCrawler.arun
-# async def capped_arun(self, *a, **kw):
-#     await GLOBAL_SEM.acquire()                        # ← take slot
-#     try:
-#         in_flight = MAX_PAGES - GLOBAL_SEM._value     # used permits
-#         page_log.info("🕸️  pages_in_flight=%s / %s", in_flight, MAX_PAGES)
-#         return await orig_arun(self, *a, **kw)
-#     finally:
-#         GLOBAL_SEM.release()                          # ← free slot
-
 orig_arun = AsyncWebCrawler.arun
 
 
 async def capped_arun(self, *a, **kw):
-    async with GLOBAL_SEM:
+    # Slot is chosen by the (tenant, priority) tagged on the current request
+    async with SCHEDULER.slot():
         return await orig_arun(self, *a, **kw)
 AsyncWebCrawler.arun = capped_arun
 
@@ -308,6 +303,7 @@ async def get_markdown(
     body: MarkdownRequest,
     _td: Dict = Depends(token_dep),
 ):
+    set_request_class(request_tenant(request, _td), "interactive")
     if not body.url.startswith(("http://", "https://")) and not body.url.startswith(("raw:", "raw://")):
         raise HTTPException(
             400, "Invalid URL format. Must start with http://, https://, or for raw HTML (raw:, raw://)")
@@ -337,6 +333,7 @@ async def generate_html(
     Crawls the URL, preprocesses the raw HTML for schema extraction, and returns the processed HTML.
     Use when you need sanitized HTML structures for building schemas or further processing.
     """
+    set_request_class(request_tenant(request, _td), "interactive")
     from crawler_pool import get_crawler
     cfg = CrawlerRunConfig()
     try:
@@ -368,6 +365,7 @@ async def generate_screenshot(
     Use when you need an image snapshot of the rendered page. Its recommened to provide an output path to save the screenshot.
     Then in result instead of the screenshot you will get a path to the saved file.
     """
+    set_request_class(request_tenant(request, _td), "interactive")
     from crawler_pool import get_crawler
     try:
         cfg = CrawlerRunConfig(screenshot=True, screenshot_wait_for=body.screenshot_wait_for)
@@ -402,6 +400,7 @@ async def generate_pdf(
     Use when you need a printable or archivable snapshot of the page. It is recommended to provide an output path to save the PDF.
     Then in result instead of the PDF you will get a path to the saved file.
     """
+    set_request_class(request_tenant(request, _td), "interactive")
     from crawler_pool import get_crawler
     try:
         cfg = CrawlerRunConfig(pdf=True)
@@ -474,6 +473,7 @@ async def execute_js(
         ```
 
     """
+    set_request_class(request_tenant(request, _td), "interactive")
     from crawler_pool import get_crawler
     try:
         cfg = CrawlerRunConfig(js_code=body.scripts)
@@ -494,6 +494,7 @@ async def llm_endpoint(
     q: str = Query(...),
     _td: Dict = Depends(token_dep),
 ):
+    set_request_class(request_tenant(request, _td), "interactive")
     if not q:
         raise HTTPException(400, "Query parameter 'q' is required")
     if not url.startswith(("http://", "https://")) and not url.startswith(("raw:", "raw://")):
@@ -600,6 +601,13 @@ async def crawl(
     """
     if not crawl_request.urls:
         raise HTTPException(400, "At least one URL required")
+    set_request_class(
+        request_tenant(request, _td),
+        cap_priority(
+            crawl_request.priority,
+            "interactive" if len(crawl_request.urls) == 1 else "batch",
+        ),
+    )
     # Check whether it is a redirection for a streaming request
     crawler_config = CrawlerRunConfig.load(crawl_request.crawler_config)
     if crawler_config.stream:
@@ -635,6 +643,13 @@ async def crawl_stream(
 ):
     if not crawl_request.urls:
         raise HTTPException(400, "At least one URL required")
+    set_request_class(
+        request_tenant(request, _td),
+        cap_priority(
+            crawl_request.priority,
+            "interactive" if len(crawl_request.urls) == 1 else "batch",
+        ),
+    )
 
     return await stream_process(crawl_request=crawl_request)
 
@@ -0,0 +1,97 @@
+import pytest
+
+from crawl4ai import BrowserConfig
+from crawl4ai.browser_manager import BrowserManager
+
+
+class FakePage:
+    """Stand-in for a Playwright page: tracks listeners and the calls a pool reset makes."""
+
+    def __init__(self):
+        self.listeners = []
+        self.closed = False
+        self.calls = []
+
+    def on(self, event, handler):
+        self.listeners.append((event, handler))
+
+    once = on
+
+    def remove_listener(self, event, handler):
+        if (event, handler) in self.listeners:
+            self.listeners.remove((event, handler))
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def unroute_all(self, behavior=None):
+        self.calls.append("unroute_all")
+
+    async def set_extra_http_headers(self, headers):
+        self.calls.append(("headers", headers))
+
+    async def set_viewport_size(self, size):
+        self.calls.append(("viewport", size))
+
+    async def goto(self, url):
+        self.calls.append(("goto", url))
+
+
+class FakeContext:
+    def __init__(self, config=None):
+        self.config = config
+        self.pages = []
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def make_browser_manager():
+    """
+    Build a BrowserManager that runs on fakes instead of Playwright.
+
+    Contexts it creates are FakeContexts, kept in order in `manager.created`;
+    launched browsers are FakeBrowsers in `manager.browsers`.
+    """
+
+    def make(**browser_kwargs) -> BrowserManager:
+        manager = BrowserManager(BrowserConfig(**browser_kwargs))
+        manager.browsers = [FakeBrowser()]
+        manager.browser = manager.browsers[0]
+        manager.created = []
+
+        async def launch_browser():
+            manager.browsers.append(FakeBrowser())
+            return manager.browsers[-1]
+
+        async def create_browser_context(config):
+            manager.created.append(FakeContext(config))
+            return manager.created[-1]
+
+        async def setup_context(context, config):
+            pass
+
+        manager._launch_browser = launch_browser
+        manager.create_browser_context = create_browser_context
+        manager.setup_context = setup_context
+        return manager
+
+    return make
@@ -0,0 +1,94 @@
+import pytest
+
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+
+
+class FakePage:
+    """Simulates a page whose height grows while scrolling near the bottom."""
+
+    viewport_size = {"width": 1000, "height": 1000}
+
+    def __init__(self, height, grow_times=0, grow_by=0, static=True, lazy_at=None):
+        self.height = height
+        self.grow_times = grow_times
+        self.grow_by = grow_by
+        self.static = static
+        self.lazy_at = lazy_at  # y of a section that only loads once it is in view
+        self.lazy_loaded = False
+        self.steps = []
+        self.quiet = []
+        self.scrolls = []
+
+    async def evaluate(self, expression, arg=None):
+        if arg is None or "y" not in arg:
+            return None
+        self.steps.append(arg["y"])
+        self.quiet.append(arg["quietMs"])
+        if self.lazy_at is not None and arg["y"] <= self.lazy_at < arg["y"] + 1000:
+            self.lazy_loaded = True
+        before = self.height
+        if self.grow_times and arg["y"] >= self.height - 1000:
+            self.grow_times -= 1
+            self.height += self.grow_by
+        grew = self.height > before
+        return {
+            "height": self.height,
+            "grew": grew,
+            "mutations": 0 if self.static and not grew else 3,
+            "viewport": 1000,
+        }
+
+
+@pytest.fixture
+def strategy(monkeypatch):
+    strategy = AsyncPlaywrightCrawlerStrategy()
+
+    async def safe_scroll(page, x, y, delay=0.1):
+        page.scrolls.append(y)
+
+    monkeypatch.setattr(strategy, "safe_scroll", safe_scroll)
+    return strategy
+
+
+@pytest.mark.asyncio
+async def test_static_page_steps_one_viewport_with_shrinking_waits(strategy):
+    page = FakePage(height=20000)
+    await strategy._handle_full_page_scan(page, scroll_delay=0.2)
+
+    deltas = [b - a for a, b in zip(page.steps, page.steps[1:-1])]
+    assert set(deltas) == {1000}
+    assert page.quiet[:4] == [100, 100, 50, 25]
+    assert min(page.quiet) == 16
+    assert page.scrolls == [0, 20000]
+
+
+@pytest.mark.asyncio
+async def test_lazy_section_mid_page_comes_into_view(strategy):
+    page = FakePage(height=20000, lazy_at=5500)
+    await strategy._handle_full_page_scan(page, scroll_delay=0.05)
+    assert page.lazy_loaded
+
+
+@pytest.mark.asyncio
+async def test_infinite_scroll_follows_growth_then_stops(strategy):
+    page = FakePage(height=3000, grow_times=2, grow_by=2000, static=False)
+    await strategy._handle_full_page_scan(page, scroll_delay=0.05)
+
+    assert page.height == 7000
+    assert page.steps[-1] == 7000  # Confirmation wait at the final bottom
+    assert page.scrolls == [0, 7000]
+
+
+@pytest.mark.asyncio
+async def test_max_scroll_steps_is_respected(strategy):
+    page = FakePage(height=100000, static=False)
+    await strategy._handle_full_page_scan(page, scroll_delay=0.05, max_scroll_steps=3)
+    assert len(page.steps) == 4  # Initial viewport plus three steps
+
+
+@pytest.mark.asyncio
+async def test_max_scroll_steps_counts_waits_at_the_bottom(strategy):
+    # Every scroll at the bottom loads more, so only the step limit can stop the scan
+    page = FakePage(height=1000, grow_times=1000, grow_by=200, static=False)
+    await strategy._handle_full_page_scan(page, scroll_delay=0.05, max_scroll_steps=5)
+    assert len(page.steps) == 6
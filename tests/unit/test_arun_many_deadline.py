@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from crawl4ai import (
+    AsyncWebCrawler,
+    CrawlerRunConfig,
+    MemoryAdaptiveDispatcher,
+    MultiProcessDispatcher,
+    SemaphoreDispatcher,
+)
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.models import CrawlResult
+
+
+def _slow_arun(delays):
+    async def arun(url, config=None, **kwargs):
+        await asyncio.sleep(delays[url])
+        return CrawlResult(url=url, html="<html></html>", success=True)
+    return arun
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dispatcher_factory", [
+    lambda: MemoryAdaptiveDispatcher(max_session_permit=2, check_interval=0.05),
+    lambda: SemaphoreDispatcher(semaphore_count=2),
+])
+async def test_deadline_returns_partial_results(dispatcher_factory):
+    delays = {
+        "https://example.com/fast-1": 0.01,
+        "https://example.com/fast-2": 0.01,
+        "https://example.com/slow-1": 5,
+        "https://example.com/slow-2": 5,
+        "https://example.com/queued-1": 0.01,
+        "https://example.com/queued-2": 0.01,
+    }
+    dispatcher = dispatcher_factory()
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        crawler.arun = _slow_arun(delays)
+        started = asyncio.get_running_loop().time()
+        results = await crawler.arun_many(
+            list(delays), config=CrawlerRunConfig(), dispatcher=dispatcher, deadline=0.5
+        )
+        elapsed = asyncio.get_running_loop().time() - started
+
+    assert elapsed < 2
+    by_url = {r.url: r for r in results}
+    assert len(by_url) == len(delays)
+    assert by_url["https://example.com/fast-1"].success
+    for url in ("https://example.com/slow-1", "https://example.com/slow-2"):
+        result = by_url[url]
+        assert not result.success
+        assert result.metadata["status"] == "deadline_exceeded"
+        assert result.dispatch_result.deadline_exceeded
+        assert result.dispatch_result.execution_time >= 0.4
+    for result in results:
+        assert result.dispatch_result.queue_wait_time >= 0
+
+
+@pytest.mark.asyncio
+async def test_no_deadline_leaves_results_untouched():
+    delays = {"https://example.com/a": 0.01, "https://example.com/b": 0.01}
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        crawler.arun = _slow_arun(delays)
+        results = await crawler.arun_many(
+            list(delays), config=CrawlerRunConfig(),
+            dispatcher=MemoryAdaptiveDispatcher(check_interval=0.05),
+        )
+    assert all(r.success and not r.dispatch_result.deadline_exceeded for r in results)
+
+
+@pytest.mark.asyncio
+async def test_deadline_does_not_leak_into_concurrent_batches():
+    delays = {"https://example.com/slow": 1.0}
+    dispatcher = SemaphoreDispatcher(semaphore_count=2)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        crawler.arun = _slow_arun(delays)
+        bounded, unbounded = await asyncio.gather(
+            crawler.arun_many(list(delays), config=CrawlerRunConfig(), dispatcher=dispatcher, deadline=0.2),
+            crawler.arun_many(list(delays), config=CrawlerRunConfig(), dispatcher=dispatcher),
+        )
+    assert bounded[0].dispatch_result.deadline_exceeded
+    assert unbounded[0].success and not unbounded[0].dispatch_result.deadline_exceeded
+
+
+@pytest.mark.asyncio
+async def test_multiprocess_dispatcher_honours_deadline():
+    dispatcher = MultiProcessDispatcher(num_workers=1, crawler_strategy_factory=AsyncHTTPCrawlerStrategy)
+    urls = [f"raw:<html><body>{i}</body></html>" for i in range(3)]
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        results = await crawler.arun_many(urls, config=CrawlerRunConfig(), dispatcher=dispatcher, deadline=0)
+    assert len(results) == len(urls)
+    assert all(r.metadata["status"] == "deadline_exceeded" for r in results)
+    assert all(r.dispatch_result.deadline_exceeded for r in results)
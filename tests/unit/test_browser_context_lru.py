@@ -0,0 +1,60 @@
+import pytest
+
+from crawl4ai import CrawlerRunConfig
+
+
+def _by_agent(manager):
+    return {context.config.user_agent: context for context in manager.created}
+
+
+def _config(name):
+    return CrawlerRunConfig(user_agent=name)
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_idle_context_is_evicted(make_browser_manager):
+    manager = make_browser_manager(max_contexts=2)
+
+    for name in ("a", "b"):
+        page, _ = await manager.get_page(_config(name))
+        await manager.release_page(page)
+    page, _ = await manager.get_page(_config("a"))  # "a" becomes most recently used
+    await manager.release_page(page)
+    page, _ = await manager.get_page(_config("c"))
+
+    created = _by_agent(manager)
+    assert created["b"].closed
+    assert not created["a"].closed and not created["c"].closed
+    stats = manager.context_stats()
+    assert stats["open"] == 2
+    assert stats["created"] == 3 and stats["evicted"] == 1 and stats["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_context_with_live_pages_is_never_evicted(make_browser_manager):
+    manager = make_browser_manager(max_contexts=1)
+
+    live, _ = await manager.get_page(_config("a"))
+    other, _ = await manager.get_page(_config("b"))
+    created = _by_agent(manager)
+    assert not created["a"].closed
+    assert manager.context_stats()["open"] == 2  # Over capacity until "a" is released
+
+    await manager.release_page(live)
+    assert created["a"].closed
+    assert not created["b"].closed
+    assert manager.context_stats()["open"] == 1
+
+
+@pytest.mark.asyncio
+async def test_killing_a_session_keeps_the_shared_context(make_browser_manager):
+    manager = make_browser_manager()
+
+    session_config = CrawlerRunConfig(user_agent="a", session_id="s1")
+    session_page, _ = await manager.get_page(session_config)
+    shared_page, _ = await manager.get_page(CrawlerRunConfig(user_agent="a", session_id="s2"))
+    await manager.kill_session("s1")
+
+    assert session_page.closed
+    assert not shared_page.closed
+    assert not any(ctx.closed for ctx in manager.created)
@@ -0,0 +1,71 @@
+import pytest
+
+from crawl4ai import CrawlerRunConfig
+
+
+@pytest.mark.asyncio
+async def test_released_page_is_reset_and_reused(make_browser_manager):
+    manager = make_browser_manager(page_pool_size=2, viewport_width=800, viewport_height=600)
+    run_config = CrawlerRunConfig()
+
+    page, context = await manager.get_page(run_config)
+    assert manager.is_pooled_page(page)
+    kept = (lambda request: None, lambda response: None)
+    page.on("request", kept[0])
+    page.once("response", kept[1])
+    page.remove_listener("request", kept[0])  # Owner cleaned up after itself
+    page.on("request", lambda request: None)
+    await manager.release_page(page)
+
+    assert not page.closed
+    assert page.listeners == []
+    assert page.calls == [
+        "unroute_all",
+        ("headers", {}),
+        ("viewport", {"width": 800, "height": 600}),
+        ("goto", "about:blank"),
+    ]
+
+    again, _ = await manager.get_page(run_config)
+    assert again is page
+    assert len(context.pages) == 1
+
+
+@pytest.mark.asyncio
+async def test_page_retired_after_max_uses_and_when_pool_full(make_browser_manager):
+    manager = make_browser_manager(page_pool_size=1, page_pool_max_uses=2)
+    run_config = CrawlerRunConfig()
+
+    first, _ = await manager.get_page(run_config)
+    second, _ = await manager.get_page(run_config)
+    await manager.release_page(first)
+    await manager.release_page(second)
+    assert not first.closed
+    assert second.closed  # Pool already holds one idle page
+
+    page, _ = await manager.get_page(run_config)
+    assert page is first
+    await manager.release_page(page)
+    assert page.closed  # Second use hits page_pool_max_uses
+    assert not manager.is_pooled_page(page)
+
+
+@pytest.mark.asyncio
+async def test_pooling_disabled_by_default_closes_pages(make_browser_manager):
+    manager = make_browser_manager()
+    run_config = CrawlerRunConfig()
+
+    page, _ = await manager.get_page(run_config)
+    assert not manager.is_pooled_page(page)
+    await manager.release_page(page)
+    assert page.closed
+    assert page.calls == []
+
+
+@pytest.mark.asyncio
+async def test_session_pages_are_not_pooled(make_browser_manager):
+    manager = make_browser_manager(page_pool_size=2)
+    run_config = CrawlerRunConfig(session_id="s1")
+
+    page, _ = await manager.get_page(run_config)
+    assert not manager.is_pooled_page(page)
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from crawl4ai import CrawlerRunConfig
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_pages_are_used_and_replenished(make_browser_manager):
+    manager = make_browser_manager()
+    config = CrawlerRunConfig(locale="de-DE")
+
+    await manager.prewarm([config], pages_per_config=2)
+    (context,) = manager.created
+    warm = list(context.pages)
+    assert len(warm) == 2
+
+    page, got_context = await manager.get_page(CrawlerRunConfig(locale="de-DE"))
+    assert got_context is context
+    assert page in warm
+    assert len(context.pages) == 2  # Served from the warm pool, no new page inline
+
+    await asyncio.sleep(0.01)  # Background top-up
+    signature = manager._make_config_signature(config)
+    assert len(manager._page_pools[signature]) == 2
+    assert len(context.pages) == 3
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_context_is_not_evicted(make_browser_manager):
+    manager = make_browser_manager(max_contexts=1)
+    await manager.prewarm([CrawlerRunConfig(locale="de-DE")])
+
+    page, _ = await manager.get_page(CrawlerRunConfig(locale="fr-FR"))
+    await manager.release_page(page)
+    page, _ = await manager.get_page(CrawlerRunConfig(locale="it-IT"))
+
+    assert not manager.created[0].closed  # Warm context kept
+    assert manager.created[1].closed  # LRU evicts the idle, non-warm one
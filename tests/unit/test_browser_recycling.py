@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from crawl4ai import CrawlerRunConfig
+
+
+@pytest.mark.asyncio
+async def test_recycles_after_page_count_once_in_flight_pages_drain(make_browser_manager):
+    manager = make_browser_manager(recycle_after_pages=2)
+    config = CrawlerRunConfig()
+
+    first, _ = await manager.get_page(config)
+    second, context = await manager.get_page(config)
+    await manager.release_page(first)
+
+    waiter = asyncio.create_task(manager.get_page(config))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()  # Waiting for `second` to drain
+    assert manager.recycle_count == 0
+
+    await manager.release_page(second)
+    page, new_context = await asyncio.wait_for(waiter, 1)
+
+    assert manager.recycle_count == 1
+    assert manager.browsers[0].closed
+    assert manager.browser is manager.browsers[1]
+    assert context.closed and new_context is not context
+    assert manager._pages_served == 1
+
+
+@pytest.mark.asyncio
+async def test_recycles_by_age_but_not_with_open_sessions(make_browser_manager):
+    manager = make_browser_manager(recycle_after_seconds=60)
+    await manager.get_page(CrawlerRunConfig(session_id="s1"))
+    manager._browser_started_at -= 120
+
+    page, _ = await manager.get_page(CrawlerRunConfig())
+    assert manager.recycle_count == 0
+    await manager.release_page(page)
+
+    await manager.kill_session("s1")
+    await manager.get_page(CrawlerRunConfig())
+    assert manager.recycle_count == 1
+
+
+@pytest.mark.asyncio
+async def test_recycles_on_memory_threshold(make_browser_manager):
+    manager = make_browser_manager(recycle_memory_threshold_mb=100)
+    manager._browser_rss_mb = lambda: 50.0
+    await manager.release_page((await manager.get_page(CrawlerRunConfig()))[0])
+    assert manager.recycle_count == 0
+
+    manager._browser_rss_mb = lambda: 500.0
+    manager._last_memory_check = 0.0
+    await manager.get_page(CrawlerRunConfig())
+    assert manager.recycle_count == 1
+
+
+@pytest.mark.asyncio
+async def test_leaked_lease_does_not_block_recycling_forever(make_browser_manager, monkeypatch):
+    import crawl4ai.browser_manager as module
+
+    monkeypatch.setattr(module, "RECYCLE_DRAIN_TIMEOUT", 0.1)
+    manager = make_browser_manager(recycle_after_pages=1)
+    await manager.get_page(CrawlerRunConfig())  # Never released
+
+    page, _ = await asyncio.wait_for(manager.get_page(CrawlerRunConfig()), 1)
+    assert manager.recycle_count == 1
+    assert sum(manager._context_refs.values()) == 1  # Only the new lease
+
+
+def test_rss_only_counts_own_driver_tree(make_browser_manager):
+    import os
+
+    manager = make_browser_manager()
+    assert manager._browser_rss_mb() == 0.0  # Driver unknown: nothing attributed to us
+    manager._driver_pid = os.getpid()
+    assert manager._browser_rss_mb() > 0
+
+
+@pytest.mark.asyncio
+async def test_recycling_cancels_running_prewarm_fills(make_browser_manager):
+    manager = make_browser_manager(recycle_after_pages=1)
+    opened = []
+    release = asyncio.Event()
+    create_fake_context = manager.create_browser_context
+
+    async def create_browser_context(config):
+        # Contexts whose pages only open once `release` is set
+        context = await create_fake_context(config)
+        new_page = context.new_page
+
+        async def slow_new_page():
+            await release.wait()
+            opened.append(await new_page())
+            return opened[-1]
+
+        context.new_page = slow_new_page
+        return context
+
+    manager.create_browser_context = create_browser_context
+    config = CrawlerRunConfig(locale="de-DE")
+    await manager.prewarm([config], pages_per_config=2, wait=False)
+    await asyncio.sleep(0.01)
+    (fill,) = manager._prewarm_tasks.values()
+
+    manager._pages_served = 1
+    await manager._maybe_recycle_browser()
+
+    assert fill.cancelled()
+    assert manager.recycle_count == 1
+    release.set()
+    await asyncio.sleep(0.01)
+    # Only the fill scheduled for the new browser opened pages
+    signature = manager._make_config_signature(config)
+    assert manager._page_pools[signature] == opened[-2:] and len(opened) == 2
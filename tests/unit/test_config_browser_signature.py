@@ -0,0 +1,51 @@
+from crawl4ai import CrawlerRunConfig, GeolocationConfig, ProxyConfig
+from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
+
+
+def test_signature_ignores_non_browser_fields():
+    base = CrawlerRunConfig(locale="en-US")
+    other = CrawlerRunConfig(
+        locale="en-US",
+        js_code=["window.scrollTo(0, 1e6)"] * 100,
+        extraction_strategy=JsonCssExtractionStrategy({"baseSelector": "div", "fields": []}),
+        session_id="s1",
+    )
+    assert base.browser_signature() == other.browser_signature()
+
+
+def test_signature_is_stable_across_instances():
+    def make():
+        return CrawlerRunConfig(
+            proxy_config=ProxyConfig(server="http://proxy:8080"),
+            geolocation=GeolocationConfig(latitude=1.0, longitude=2.0),
+        )
+
+    assert make().browser_signature() == make().browser_signature()
+
+
+def test_signature_is_memoized_and_invalidated_on_change():
+    config = CrawlerRunConfig()
+    first = config.browser_signature()
+    assert config.browser_signature() is first
+
+    config.proxy_config = ProxyConfig(server="http://proxy:8080")
+    assert config.browser_signature() != first
+
+    clone = config.clone(locale="fr-FR")
+    assert clone.browser_signature() != config.browser_signature()
+    assert "_browser_signature" not in config.to_dict()
+
+
+def test_signature_follows_in_place_changes_of_nested_configs():
+    config = CrawlerRunConfig(
+        geolocation=GeolocationConfig(latitude=1.0, longitude=2.0),
+        user_agent_generator_config={"device_type": "desktop"},
+    )
+    first = config.browser_signature()
+
+    config.geolocation.latitude = 50
+    moved = config.browser_signature()
+    assert moved != first
+
+    config.user_agent_generator_config["device_type"] = "mobile"
+    assert config.browser_signature() not in (first, moved)
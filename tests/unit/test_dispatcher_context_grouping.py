@@ -0,0 +1,79 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai import CrawlerRunConfig, MemoryAdaptiveDispatcher, SemaphoreDispatcher
+from crawl4ai.models import CrawlResult
+
+
+class FakeBrowserManager:
+    def _make_config_signature(self, config):
+        return config.user_agent
+
+
+class FakeCrawler:
+    """Records which browser contexts are in use while crawls run."""
+
+    def __init__(self):
+        self.crawler_strategy = SimpleNamespace(browser_manager=FakeBrowserManager())
+        self.active = {}
+        self.max_open = 0
+        self.order = []
+
+    async def arun(self, url, config=None, **kwargs):
+        sig = config.user_agent
+        self.order.append(url)
+        self.active[sig] = self.active.get(sig, 0) + 1
+        self.max_open = max(self.max_open, len(self.active))
+        await asyncio.sleep(0.01)
+        self.active[sig] -= 1
+        if not self.active[sig]:
+            del self.active[sig]
+        return CrawlResult(url=url, html="", success=True)
+
+
+def _configs():
+    return [
+        CrawlerRunConfig(url_matcher="*/a/*", user_agent="ua-a"),
+        CrawlerRunConfig(url_matcher="*/b/*", user_agent="ua-b"),
+    ]
+
+
+def _urls():
+    return [f"https://site{i % 2}.com/{'ab'[i % 2]}/{i}" for i in range(12)]
+
+
+def test_group_urls_orders_by_context_then_domain():
+    dispatcher = SemaphoreDispatcher()
+    dispatcher.crawler = FakeCrawler()
+    urls = ["https://y.com/a/1", "https://x.com/b/1", "https://x.com/a/2", "https://z.com/c/1"]
+    grouped = dispatcher._group_urls(urls, _configs())
+    assert [url for url, _ in grouped] == [
+        "https://z.com/c/1",  # no matching config, fails fast
+        "https://x.com/a/2",
+        "https://y.com/a/1",
+        "https://x.com/b/1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_memory_adaptive_dispatcher_bounds_open_contexts():
+    crawler = FakeCrawler()
+    dispatcher = MemoryAdaptiveDispatcher(max_session_permit=4, max_open_contexts=1, check_interval=0.05)
+    results = await dispatcher.run_urls(_urls(), crawler, _configs())
+
+    assert len(results) == 12
+    assert all(r.result.success for r in results)
+    assert crawler.max_open == 1
+    # All URLs of the first context are crawled before the second one is opened
+    contexts = ["a" if "/a/" in url else "b" for url in crawler.order]
+    assert contexts == sorted(contexts)
+
+
+@pytest.mark.asyncio
+async def test_dispatchers_interleave_contexts_by_default():
+    crawler = FakeCrawler()
+    dispatcher = MemoryAdaptiveDispatcher(max_session_permit=4, check_interval=0.05)
+    await dispatcher.run_urls(_urls(), crawler, _configs())
+    assert crawler.max_open == 2
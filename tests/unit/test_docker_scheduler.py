@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "deploy", "docker"))
+
+import scheduler as scheduler_module  # noqa: E402
+from scheduler import CrawlScheduler, cap_priority, set_request_class  # noqa: E402
+
+
+async def _run(scheduler, order, tenant, priority, name, hold=0.01):
+    async with scheduler.slot(tenant, priority):
+        order.append(name)
+        await asyncio.sleep(hold)
+
+
+@pytest.mark.asyncio
+async def test_interactive_never_waits_behind_batch():
+    scheduler = CrawlScheduler(capacity=4, reserved_interactive=1)
+    order = []
+    batch = [
+        asyncio.create_task(_run(scheduler, order, "bulk", "batch", f"b{i}", hold=0.2))
+        for i in range(20)
+    ]
+    await asyncio.sleep(0.01)
+    # Batch work can only take capacity - reserved slots
+    assert scheduler.in_use["batch"] == 3
+
+    started = asyncio.get_running_loop().time()
+    await _run(scheduler, order, "user", "interactive", "i0")
+    assert asyncio.get_running_loop().time() - started < 0.1
+
+    for task in batch:
+        task.cancel()
+    await asyncio.gather(*batch, return_exceptions=True)
+    assert sum(scheduler.in_use.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_classes_are_served_in_priority_order():
+    scheduler = CrawlScheduler(capacity=1)
+    order = []
+    holder = asyncio.create_task(_run(scheduler, order, "t", "batch", "first", hold=0.05))
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(_run(scheduler, order, "t", "background", "bg")),
+        asyncio.create_task(_run(scheduler, order, "t", "batch", "batch")),
+        asyncio.create_task(_run(scheduler, order, "t", "interactive", "int")),
+    ]
+    await asyncio.gather(holder, *waiters)
+    assert order == ["first", "int", "batch", "bg"]
+
+
+@pytest.mark.asyncio
+async def test_tenants_share_a_class_fairly_by_weight():
+    scheduler = CrawlScheduler(capacity=1, tenant_weights={"gold": 2})
+    order = []
+    holder = asyncio.create_task(_run(scheduler, order, "x", "batch", "hold", hold=0.05))
+    await asyncio.sleep(0)
+    big = [asyncio.create_task(_run(scheduler, order, "big", "batch", "big")) for _ in range(10)]
+    gold = [asyncio.create_task(_run(scheduler, order, "gold", "batch", "gold")) for _ in range(4)]
+    await asyncio.gather(holder, *big, *gold)
+
+    # The small tenant is interleaved instead of waiting for the 10 queued URLs,
+    # and gets two slots for every one of the weight-1 tenant
+    assert order[1:7].count("gold") == 4
+
+
+@pytest.mark.asyncio
+async def test_slot_uses_request_class_from_context():
+    scheduler = CrawlScheduler(capacity=2, reserved_interactive=1)
+
+    async def request():
+        set_request_class("someone", "background")
+        async with scheduler.slot():
+            return dict(scheduler.in_use)
+
+    assert (await asyncio.create_task(request()))["background"] == 1
+
+
+def test_cap_priority_only_lets_clients_demote_themselves():
+    assert cap_priority(None, "batch") == "batch"
+    assert cap_priority("interactive", "batch") == "batch"
+    assert cap_priority("background", "batch") == "background"
+    assert cap_priority("batch", "interactive") == "batch"
+
+
+@pytest.mark.asyncio
+async def test_idle_tenant_finish_tags_are_pruned(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(scheduler_module.time, "monotonic", lambda: clock[0])
+    scheduler = CrawlScheduler(capacity=4)
+    holder = asyncio.create_task(_run(scheduler, [], "busy", "batch", "hold", hold=0.05))
+    await asyncio.sleep(0)
+    for i in range(50):
+        async with scheduler.slot(f"tenant-{i}", "batch"):
+            pass
+    # A long-running crawl keeps the scheduler busy, so the idle reset never fires
+    assert len(scheduler._last_finish) == 51
+
+    clock[0] += scheduler_module.FINISH_TAG_TTL + 1
+    async with scheduler.slot("fresh", "batch"):
+        pass
+    assert set(scheduler._last_finish) == {("fresh", "batch")}
+    await holder
@@ -0,0 +1,79 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy, ResponseTooLargeError
+
+
+@pytest.fixture
+def strategy():
+    return AsyncHTTPCrawlerStrategy()
+
+
+def test_decode_prefers_header_then_meta_then_utf8(strategy):
+    latin = "<html><head><meta charset='iso-8859-1'></head><body>café</body></html>".encode("latin-1")
+    assert "café" in strategy._decode_body(latin)
+    assert "café" in strategy._decode_body(latin, "latin-1")
+    assert strategy._decode_body("naïve ✓".encode("utf-8")) == "naïve ✓"
+    assert strategy._decode_body(b"\xef\xbb\xbfhello") == "hello"
+
+
+def test_decode_bom_wins_over_header_charset(strategy):
+    assert strategy._decode_body(b"\xef\xbb\xbfcaf\xc3\xa9", "iso-8859-1") == "café"
+    assert strategy._decode_body("café".encode("utf-16"), "utf-8") == "café"
+
+
+def test_detector_only_sees_a_bounded_prefix(strategy, monkeypatch):
+    import crawl4ai.async_crawler_strategy as module
+
+    seen = []
+
+    def detect(sample):
+        seen.append(len(sample))
+        return {"encoding": "cp1252"}
+
+    monkeypatch.setattr(module.chardet, "detect", detect)
+    body = ("<p>" + "é" * 200_000 + "</p>").encode("cp1252")
+    assert strategy._decode_body(body).startswith("<p>éé")
+    assert seen == [strategy.CHARSET_SNIFF_BYTES]
+
+
+def test_charset_normalizer_option():
+    pytest.importorskip("charset_normalizer")
+    strategy = AsyncHTTPCrawlerStrategy(HTTPCrawlerConfig(charset_detector="charset_normalizer"))
+    text = "Привет, как дела? Это длинный русский текст для определения кодировки. " * 20
+    assert strategy._decode_body(text.encode("cp1251")) == text
+
+
+@pytest_asyncio.fixture
+async def server():
+    async def big(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(64):
+            await response.write(b"x" * 16384)
+        return response
+
+    async def small(request):
+        return web.Response(body="<html><body>ok</body></html>".encode(), content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/big", big)
+    app.router.add_get("/small", small)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_streaming_read_stops_at_max_body_size(server):
+    async with AsyncHTTPCrawlerStrategy(HTTPCrawlerConfig(max_body_size=100_000)) as strategy:
+        with pytest.raises(ResponseTooLargeError):
+            await strategy.crawl(f"{server}/big", config=CrawlerRunConfig())
+        response = await strategy.crawl(f"{server}/small", config=CrawlerRunConfig())
+        assert response.html == "<html><body>ok</body></html>"
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy, HTTPStatusError
+
+PAGE = "<html><body>ok</body></html>"
+
+
+@pytest_asyncio.fixture
+async def server():
+    state = {"active": 0, "peak": 0}
+
+    async def slow(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def gone(request):
+        return web.Response(status=410)
+
+    async def cookie(request):
+        return web.Response(text=request.headers.get("Cookie", ""), content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/slow", slow)
+    app.router.add_get("/gone", gone)
+    app.router.add_get("/cookie", cookie)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", state
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_per_host_limit(server, http2):
+    base, state = server
+    strategy = AsyncHTTPCrawlerStrategy(max_connections=16, max_connections_per_host=2, http2=http2)
+    async with strategy:
+        responses = await asyncio.gather(
+            *(strategy.crawl(f"{base}/slow", config=CrawlerRunConfig()) for _ in range(8))
+        )
+    assert all(r.html == PAGE for r in responses)
+    assert state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_http2_status_errors(server):
+    base, _ = server
+    async with AsyncHTTPCrawlerStrategy(http2=True) as strategy:
+        with pytest.raises(HTTPStatusError) as error:
+            await strategy.crawl(f"{base}/gone", config=CrawlerRunConfig())
+    assert error.value.status_code == 410
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_queueing_is_not_timed(server, http2):
+    base, state = server
+    strategy = AsyncHTTPCrawlerStrategy(
+        browser_config=HTTPCrawlerConfig(max_retries=0), max_connections_per_host=1, http2=http2
+    )
+    async with strategy:
+        # Eight 50ms requests in a row take longer than any single request may
+        responses = await asyncio.gather(
+            *(strategy.crawl(f"{base}/slow", config=CrawlerRunConfig(page_timeout=0.2)) for _ in range(8))
+        )
+        assert all(r.html == PAGE for r in responses)
+        assert strategy._host_slots == {}
+    assert state["peak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_the_default_host_limit_wait_untimed(server):
+    base, state = server
+    strategy = AsyncHTTPCrawlerStrategy(browser_config=HTTPCrawlerConfig(max_retries=0), max_connections=32)
+    async with strategy:
+        # 40 requests run in five 50ms waves; each may take 0.2s, the whole batch cannot
+        responses = await asyncio.gather(
+            *(strategy.crawl(f"{base}/slow", config=CrawlerRunConfig(page_timeout=0.2)) for _ in range(40))
+        )
+    assert all(r.html == PAGE for r in responses)
+    assert state["peak"] == strategy.DEFAULT_MAX_CONNECTIONS_PER_HOST
+
+
+@pytest.mark.asyncio
+async def test_http2_request_kwargs_from_hooks(server):
+    base, _ = server
+    async with AsyncHTTPCrawlerStrategy(http2=True) as strategy:
+        strategy.set_hook("before_request", lambda url, kwargs: kwargs.update(cookies={"a": "1"}))
+        response = await strategy.crawl(f"{base}/cookie", config=CrawlerRunConfig())
+        assert response.html == "a=1"
+
+        strategy.set_hook("before_request", lambda url, kwargs: kwargs.update(proxy="http://proxy:8080"))
+        with pytest.raises(ValueError, match="proxy"):
+            await strategy.crawl(f"{base}/slow", config=CrawlerRunConfig())
+
+
+@pytest.mark.asyncio
+async def test_overall_limit_queueing_is_not_timed(server):
+    base, state = server
+    strategy = AsyncHTTPCrawlerStrategy(browser_config=HTTPCrawlerConfig(max_retries=0), max_connections=1)
+    async with strategy:
+        responses = await asyncio.gather(
+            *(strategy.crawl(f"{base}/slow", config=CrawlerRunConfig(page_timeout=0.2)) for _ in range(8))
+        )
+    assert all(r.html == PAGE for r in responses)
+    assert state["peak"] == 1
@@ -0,0 +1,156 @@
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import (
+    AsyncHTTPCrawlerStrategy,
+    CircuitOpenError,
+    HTTPStatusError,
+)
+
+PAGE = "<html><body>ok</body></html>"
+
+
+@pytest_asyncio.fixture
+async def server():
+    hits = {}
+
+    def counted(handler):
+        async def wrapper(request):
+            hits[request.path] = hits.get(request.path, 0) + 1
+            return await handler(request, hits[request.path])
+        return wrapper
+
+    async def flaky(request, n):
+        if n < 3:
+            return web.Response(status=502)
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def throttled(request, n):
+        if n == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def down(request, n):
+        return web.Response(status=503)
+
+    async def missing(request, n):
+        return web.Response(status=404)
+
+    app = web.Application()
+    for path, handler in (("/flaky", flaky), ("/throttled", throttled), ("/down", down), ("/missing", missing)):
+        app.router.add_route("*", path, counted(handler))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await runner.cleanup()
+
+
+def _strategy(**kwargs):
+    kwargs.setdefault("retry_backoff", 0.01)
+    return AsyncHTTPCrawlerStrategy(HTTPCrawlerConfig(**kwargs))
+
+
+@pytest.mark.asyncio
+async def test_retries_5xx_until_success(server):
+    base, hits = server
+    async with _strategy(max_retries=2) as strategy:
+        response = await strategy.crawl(f"{base}/flaky", config=CrawlerRunConfig())
+    assert response.html == PAGE
+    assert hits["/flaky"] == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(server):
+    base, hits = server
+    async with _strategy() as strategy:
+        with pytest.raises(HTTPStatusError) as error:
+            await strategy.crawl(f"{base}/missing", config=CrawlerRunConfig())
+    assert error.value.status_code == 404
+    assert hits["/missing"] == 1
+
+
+@pytest.mark.asyncio
+async def test_post_only_retried_when_not_processed(server):
+    base, hits = server
+    async with _strategy(method="POST", max_retries=2) as strategy:
+        with pytest.raises(HTTPStatusError):
+            await strategy.crawl(f"{base}/flaky", config=CrawlerRunConfig())
+        assert hits["/flaky"] == 1  # 502 after POST may have had side effects
+
+        response = await strategy.crawl(f"{base}/throttled", config=CrawlerRunConfig())
+        assert response.html == PAGE  # 429 means the server refused it
+        assert hits["/throttled"] == 2
+
+
+def test_retry_after_parsing():
+    parse = AsyncHTTPCrawlerStrategy._parse_retry_after
+    assert parse("7") == 7.0
+    assert parse(time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))) == pytest.approx(60, abs=2)
+    assert parse("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_probes_after_cooldown(server):
+    base, hits = server
+    async with _strategy(max_retries=0, circuit_breaker_threshold=2, circuit_breaker_cooldown=0.2) as strategy:
+        for _ in range(2):
+            with pytest.raises(HTTPStatusError):
+                await strategy.crawl(f"{base}/down", config=CrawlerRunConfig())
+        with pytest.raises(CircuitOpenError):
+            await strategy.crawl(f"{base}/flaky", config=CrawlerRunConfig())  # Same host
+        assert hits["/down"] == 2 and "/flaky" not in hits
+
+        time.sleep(0.25)
+        with pytest.raises(HTTPStatusError):
+            await strategy.crawl(f"{base}/down", config=CrawlerRunConfig())  # Probe fails, reopens
+        with pytest.raises(CircuitOpenError):
+            await strategy.crawl(f"{base}/down", config=CrawlerRunConfig())
+        assert hits["/down"] == 3
+
+
+@pytest.mark.asyncio
+async def test_probe_answered_with_4xx_closes_circuit(server):
+    base, hits = server
+    async with _strategy(max_retries=0, circuit_breaker_threshold=1, circuit_breaker_cooldown=0.1) as strategy:
+        with pytest.raises(HTTPStatusError):
+            await strategy.crawl(f"{base}/down", config=CrawlerRunConfig())
+        time.sleep(0.15)
+        with pytest.raises(HTTPStatusError):
+            await strategy.crawl(f"{base}/missing", config=CrawlerRunConfig())  # Host is up
+        assert not strategy._circuits
+        with pytest.raises(HTTPStatusError):
+            await strategy.crawl(f"{base}/missing", config=CrawlerRunConfig())
+        assert hits["/missing"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_wedge_circuit(server, monkeypatch):
+    import asyncio
+
+    base, hits = server
+    async with _strategy(max_retries=0, circuit_breaker_threshold=1, circuit_breaker_cooldown=0.1) as strategy:
+        with pytest.raises(HTTPStatusError):
+            await strategy.crawl(f"{base}/down", config=CrawlerRunConfig())
+        time.sleep(0.15)
+
+        async def hang(url, config):
+            await asyncio.sleep(10)
+
+        original = strategy._request_once
+        monkeypatch.setattr(strategy, "_request_once", hang)
+        probe = asyncio.create_task(strategy.crawl(f"{base}/flaky", config=CrawlerRunConfig()))
+        await asyncio.sleep(0.05)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        monkeypatch.setattr(strategy, "_request_once", original)
+        with pytest.raises(HTTPStatusError):
+            await strategy.crawl(f"{base}/missing", config=CrawlerRunConfig())  # Next probe goes through
@@ -0,0 +1,85 @@
+import pytest
+
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHybridCrawlerStrategy, HTTPStatusError
+from crawl4ai.models import AsyncCrawlResponse
+
+ARTICLE = "<html><body><main><article><h1>News</h1><p>" + "Server rendered text. " * 20 + "</p></article></main></body></html>"
+
+
+def _strategy(html=ARTICLE, error=None):
+    strategy = AsyncHybridCrawlerStrategy()
+    strategy.browser_starts = 0
+
+    async def http_crawl(url, config=None):
+        if error:
+            raise error
+        return AsyncCrawlResponse(html=html, response_headers={}, status_code=200)
+
+    async def browser_crawl(url, config=None):
+        return AsyncCrawlResponse(html="<html>rendered</html>", response_headers={}, status_code=200)
+
+    async def browser_start():
+        strategy.browser_starts += 1
+
+    strategy.http_strategy.crawl = http_crawl
+    strategy.browser_strategy.crawl = browser_crawl
+    strategy.browser_strategy.start = browser_start
+    return strategy
+
+
+@pytest.mark.asyncio
+async def test_server_rendered_page_stays_on_http():
+    strategy = _strategy()
+    response = await strategy.crawl("https://example.com", config=CrawlerRunConfig(css_selector="article p"))
+
+    assert response.fetch_strategy == "http"
+    assert strategy.browser_starts == 0
+    assert strategy.stats == {"http": 1, "browser": 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<html><body><div id='root'></div><script>" + "x" * 1000 + "</script></body></html>",
+        ARTICLE.replace("<main>", '<main><div id="app">  </div>'),
+        ARTICLE.replace("<main>", "<noscript><p>Please enable JavaScript to continue.</p></noscript><main>"),
+    ],
+)
+async def test_client_rendered_pages_escalate(html):
+    strategy = _strategy(html)
+    response = await strategy.crawl("https://example.com", config=CrawlerRunConfig())
+    assert response.fetch_strategy == "browser"
+    assert strategy.browser_starts == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_selector_escalates():
+    strategy = _strategy()
+    assert strategy.escalation_reason(ARTICLE, CrawlerRunConfig(wait_for="css:.comments")) == "selector not found: .comments"
+
+    response = await strategy.crawl("https://example.com", config=CrawlerRunConfig(wait_for="css:.comments"))
+    assert response.fetch_strategy == "browser"
+
+
+@pytest.mark.asyncio
+async def test_browser_only_options_and_http_errors_escalate():
+    strategy = _strategy()
+    await strategy.crawl("https://example.com", config=CrawlerRunConfig(screenshot=True))
+    assert strategy.stats["browser"] == 1
+
+    strategy = _strategy(error=HTTPStatusError(403, "Forbidden"))
+    response = await strategy.crawl("https://example.com", config=CrawlerRunConfig())
+    assert response.fetch_strategy == "browser"
+
+    # Browser is only launched once
+    await strategy.crawl("https://example.com", config=CrawlerRunConfig())
+    assert strategy.browser_starts == 1
+
+
+def test_exported_and_exposes_browser_manager():
+    import crawl4ai
+
+    strategy = crawl4ai.AsyncHybridCrawlerStrategy()
+    assert strategy.browser_manager is strategy.browser_strategy.browser_manager
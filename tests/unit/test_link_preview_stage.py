@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig, LinkPreviewConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.link_preview import LinkPreview
+from crawl4ai.models import Link, Links
+
+
+class FakeSeeder:
+    """Stands in for AsyncUrlSeeder and records which URLs were fetched."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.fetched = []
+
+    async def extract_head_for_urls(self, urls, config=None, concurrency=10, timeout=5):
+        self.fetched.extend(urls)
+        await asyncio.sleep(self.delay)
+        return [
+            {"url": url, "status": "valid", "head_data": {"title": url.rsplit("/", 1)[-1]}}
+            for url in urls
+        ]
+
+
+def _links(*paths):
+    return Links(internal=[
+        Link(href=f"https://example.com/{p}", text=p, base_domain="example.com") for p in paths
+    ])
+
+
+def _config():
+    return CrawlerRunConfig(link_preview_config=LinkPreviewConfig(include_internal=True))
+
+
+@pytest.mark.asyncio
+async def test_urls_are_fetched_once_across_pages():
+    seeder = FakeSeeder()
+    preview = LinkPreview(seeder=seeder)
+    config = _config()
+
+    first, second = await asyncio.gather(
+        preview.extract_link_heads(_links("a", "b"), config),
+        preview.extract_link_heads(_links("b", "c"), config),
+    )
+    third = await preview.extract_link_heads(_links("a", "c"), config)
+
+    assert sorted(seeder.fetched) == [f"https://example.com/{p}" for p in "abc"]
+    for links in (first, second, third):
+        assert all(link.head_extraction_status == "valid" for link in links.internal)
+    assert [l.head_data["title"] for l in second.internal] == ["b", "c"]
+    assert preview.cache_hits == 3
+
+    await preview.close()
+    assert preview.seeder is seeder  # Shared seeders are left to their owner
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_scoped_by_query():
+    seeder = FakeSeeder(delay=0)
+    preview = LinkPreview(seeder=seeder, cache_size=2)
+    config = _config()
+
+    await preview.extract_link_heads(_links("a", "b", "c"), config)
+    await preview.extract_link_heads(_links("a"), config)
+    assert seeder.fetched.count("https://example.com/a") == 2
+
+    queried = CrawlerRunConfig(link_preview_config=LinkPreviewConfig(query="docs"))
+    await preview.extract_link_heads(_links("c"), queried)
+    assert seeder.fetched.count("https://example.com/c") == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached_and_timeout_is_part_of_the_key():
+    seeder = FakeSeeder(delay=0)
+    statuses = iter(["failed", "valid"])
+    original = seeder.extract_head_for_urls
+
+    async def flaky(urls, **kwargs):
+        return [dict(result, status=next(statuses)) for result in await original(urls, **kwargs)]
+
+    seeder.extract_head_for_urls = flaky
+    preview = LinkPreview(seeder=seeder)
+    config = _config()
+
+    await preview.extract_link_heads(_links("a"), config)
+    await preview.extract_link_heads(_links("a"), config)  # Failure was not cached
+    await preview.extract_link_heads(_links("a"), config)  # Success was
+    assert seeder.fetched.count("https://example.com/a") == 2
+
+    seeder.extract_head_for_urls = original
+    slower = CrawlerRunConfig(link_preview_config=LinkPreviewConfig(include_internal=True, timeout=30))
+    await preview.extract_link_heads(_links("a"), slower)
+    assert seeder.fetched.count("https://example.com/a") == 3
+
+
+@pytest.mark.asyncio
+async def test_crawler_runs_preview_on_its_own_loop_with_one_seeder():
+    html = '<html><body><p>Some page text</p><a href="https://example.com/x">x</a><a href="/y">y</a></body></html>'
+    seeder = FakeSeeder(delay=0)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        crawler.url_seeder = seeder
+        config = _config().clone(cache_mode=CacheMode.BYPASS)
+        for _ in range(2):
+            result = await crawler.arun(f"raw:{html}", config=config)
+            assert result.success
+            assert {l["head_extraction_status"] for l in result.links["internal"]} == {"valid"}
+        preview = crawler.link_preview
+        assert preview.seeder is seeder
+        crawler.url_seeder = None  # Fake has nothing to close
+    assert len(seeder.fetched) == len(set(seeder.fetched))
+    assert crawler.link_preview is None
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, MultiProcessDispatcher
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+
+def _raw_urls(count):
+    return [f"raw:<html><body><h1>Page {i}</h1><p>Body {i}</p></body></html>" for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_multiprocess_dispatcher_runs_urls_in_workers():
+    dispatcher = MultiProcessDispatcher(
+        num_workers=2,
+        max_session_permit=2,
+        crawler_strategy_factory=AsyncHTTPCrawlerStrategy,
+    )
+    urls = _raw_urls(6)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        results = await crawler.arun_many(
+            urls,
+            config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS),
+            dispatcher=dispatcher,
+        )
+
+    assert len(results) == len(urls)
+    assert all(r.success for r in results)
+    assert [r.url for r in results] == urls  # Input order, not completion order
+    for r in results:
+        page = r.url.split("<h1>")[1].split("</h1>")[0]
+        assert page in r.markdown
+        assert r.dispatch_result is not None
+
+
+@pytest.mark.asyncio
+async def test_multiprocess_dispatcher_streams_and_reports_unmatched_urls():
+    dispatcher = MultiProcessDispatcher(
+        num_workers=1,
+        crawler_strategy_factory=AsyncHTTPCrawlerStrategy,
+    )
+    configs = [CrawlerRunConfig(url_matcher="*Page 1*", cache_mode=CacheMode.BYPASS, stream=True)]
+    urls = _raw_urls(2)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        results = [r async for r in await crawler.arun_many(urls, config=configs, dispatcher=dispatcher)]
+
+    by_url = {r.url: r for r in results}
+    assert by_url[urls[1]].success
+    assert not by_url[urls[0]].success
+    assert by_url[urls[0]].metadata == {"status": "no_config_match"}
+
+
+class _FakeProcess:
+    def __init__(self, alive=True, exitcode=None):
+        self.alive, self.exitcode = alive, exitcode
+
+    def is_alive(self):
+        return self.alive
+
+
+class _FakeQueue(list):
+    put = list.append
+
+    def cancel_join_thread(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_dead_worker_requeues_unstarted_and_fails_started_tasks(monkeypatch):
+    dispatcher = MultiProcessDispatcher(num_workers=1)
+
+    def spawn():
+        worker_id = dispatcher._next_worker_id
+        dispatcher._next_worker_id += 1
+        dispatcher._workers[worker_id] = _FakeProcess()
+        dispatcher._task_queues[worker_id] = _FakeQueue()
+        dispatcher._outstanding[worker_id] = {}
+
+    monkeypatch.setattr(dispatcher, "_spawn_worker", spawn)
+    spawn()
+    loop = asyncio.get_running_loop()
+    futures = {}
+    for task_id in ("queued", "running"):
+        futures[task_id] = dispatcher._pending[task_id] = loop.create_future()
+        dispatcher._submit(task_id, (task_id, "raw:x", 0, {}))
+    dispatcher._started.add("running")
+
+    # The worker dies having taken both tasks off its queue
+    dispatcher._workers[0].alive = False
+    dispatcher._workers[0].exitcode = -9
+    dispatcher._handle_dead_workers()
+
+    assert list(dispatcher._workers) == [1]
+    assert dispatcher._task_queues[1] == [("queued", "raw:x", 0, {})]
+    assert not futures["queued"].done()
+    with pytest.raises(RuntimeError, match="exit code -9"):
+        await futures["running"]
@@ -0,0 +1,112 @@
+import pytest
+
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.network_capture import NetworkCapture
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="fetch", timing=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = "GET"
+        self.headers = {"accept": "*/*"}
+        self.post_data_buffer = None
+        self.failure = "net::ERR_ABORTED"
+        self.timing = timing or {}
+
+    def is_navigation_request(self):
+        return self.resource_type == "document"
+
+
+class FakeResponse:
+    def __init__(self, url, status=200, body=b"", resource_type="fetch", headers=None):
+        self.url = url
+        self.status = status
+        self.status_text = "OK"
+        self.headers = headers or {"content-length": str(len(body))}
+        self.from_service_worker = False
+        self.request = FakeRequest(url, resource_type)
+        self._body = body
+        self.body_reads = 0
+
+    async def body(self):
+        self.body_reads += 1
+        return self._body
+
+
+def test_filters_and_ring_buffer():
+    capture = NetworkCapture(resource_types=["fetch"], url_patterns=["*api.example.com/*"], max_entries=2)
+
+    capture.on_request(FakeRequest("https://ads.example.net/px.gif", "image"))
+    capture.on_request(FakeRequest("https://cdn.example.com/app.js", "fetch"))
+    for i in range(3):
+        capture.on_request(FakeRequest(f"https://api.example.com/items/{i}"))
+
+    urls = [event["url"] for event in capture.results()]
+    assert urls == ["https://api.example.com/items/1", "https://api.example.com/items/2"]
+    assert capture.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_status_ranges_and_body_cap():
+    capture = NetworkCapture(status_ranges=[(400, 599)], body_max_bytes=4)
+
+    await capture.on_response(FakeResponse("https://x.com/ok", 200, b"fine"))
+    await capture.on_response(FakeResponse("https://x.com/missing", 404, b"not found"))
+
+    (event,) = capture.results()
+    assert event["status"] == 404
+    assert event["body"] == {"text": "not ", "truncated": True, "size": 9}
+
+
+@pytest.mark.asyncio
+async def test_bodies_can_be_skipped_or_not_downloaded():
+    skipped = FakeResponse("https://x.com/a", body=b"data")
+    await NetworkCapture(body_max_bytes=0).on_response(skipped)
+    assert skipped.body_reads == 0
+
+    huge = FakeResponse("https://x.com/video", body=b"", headers={"content-length": "10000000"})
+    capture = NetworkCapture(body_max_bytes=1024)
+    await capture.on_response(huge)
+    assert huge.body_reads == 0
+    assert capture.results()[0]["body"]["truncated"]
+
+
+@pytest.mark.asyncio
+async def test_summary_mode_aggregates_per_domain():
+    capture = NetworkCapture(mode="summary")
+
+    for path in ("a", "b"):
+        capture.on_request(FakeRequest(f"https://cdn.example.com/{path}"))
+        await capture.on_response(FakeResponse(f"https://cdn.example.com/{path}", body=b"12345"))
+    capture.on_request_finished(FakeRequest("https://cdn.example.com/a", timing={"responseEnd": 120.0}))
+    capture.on_request_failed(FakeRequest("https://other.org/x"))
+
+    summary = {entry["domain"]: entry for entry in capture.results()}
+    cdn = summary["cdn.example.com"]
+    assert cdn["requests"] == 2 and cdn["responses"] == 2 and cdn["bytes"] == 10
+    assert cdn["status_counts"] == {"200": 2}
+    assert cdn["max_time_ms"] == 120.0
+    assert summary["other.org"]["failed"] == 1
+    assert not capture.events
+
+
+def test_from_config_and_unknown_mode():
+    config = CrawlerRunConfig(capture_network_requests=True, network_capture_max_entries=5)
+    assert NetworkCapture.from_config(config).events.maxlen == 5
+    with pytest.raises(ValueError):
+        NetworkCapture(mode="verbose")
+
+
+@pytest.mark.asyncio
+async def test_defaults_keep_every_event_and_the_plain_body_shape():
+    capture = NetworkCapture.from_config(CrawlerRunConfig(capture_network_requests=True))
+    assert capture.events.maxlen is None
+
+    body = b"x" * 200_000
+    await capture.on_response(FakeResponse("https://x.com/big", body=body))
+    assert capture.results()[0]["body"] == {"text": body.decode()}
+
+    capped = NetworkCapture(body_max_bytes=10)
+    await capped.on_response(FakeResponse("https://x.com/small", body=b"short"))
+    assert capped.results()[0]["body"] == {"text": "short"}
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import pytest
+
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy, NetworkActivity
+
+
+class FakeRequest:
+    def __init__(self, resource_type):
+        self.resource_type = resource_type
+
+
+class FakePage:
+    """Reports time since the last simulated DOM mutation and emits request events."""
+
+    def __init__(self):
+        self.last_mutation = time.monotonic()
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def emit(self, event, request):
+        for handler in list(self.listeners.get(event, [])):
+            handler(request)
+
+    async def evaluate(self, expression, *args):
+        return (time.monotonic() - self.last_mutation) * 1000
+
+
+@pytest.fixture
+def strategy():
+    return AsyncPlaywrightCrawlerStrategy()
+
+
+@pytest.mark.asyncio
+async def test_returns_once_dom_and_network_are_idle(strategy):
+    page = FakePage()
+    request = FakeRequest("xhr")
+
+    async def activity():
+        page.emit("request", request)
+        await asyncio.sleep(0.1)
+        page.last_mutation = time.monotonic()
+        page.emit("requestfinished", request)
+
+    start = time.monotonic()
+    task = asyncio.create_task(activity())
+    assert await strategy.smart_wait(page, "quiescent:100", timeout=5000)
+    elapsed = time.monotonic() - start
+    await task
+
+    assert 0.2 <= elapsed < 1.0
+    assert all(not handlers for handlers in page.listeners.values())
+
+
+@pytest.mark.asyncio
+async def test_hard_cap_is_not_an_error(strategy):
+    page = FakePage()
+    page.evaluate = lambda *a: asyncio.sleep(0, result=0)  # DOM keeps changing
+
+    start = time.monotonic()
+    assert not await strategy.smart_wait(page, "quiescent", timeout=300)
+    assert time.monotonic() - start < 1.0
+
+
+@pytest.mark.asyncio
+async def test_stale_and_streaming_requests_do_not_block(strategy, monkeypatch):
+    import crawl4ai.async_crawler_strategy as module
+
+    monkeypatch.setattr(module, "QUIESCENT_STALE_REQUEST_MS", 100)
+    page = FakePage()
+
+    async def open_forever():
+        await asyncio.sleep(0.01)
+        page.emit("request", FakeRequest("fetch"))  # Beacon that never finishes
+        page.emit("request", FakeRequest("websocket"))
+
+    task = asyncio.create_task(open_forever())
+    assert await strategy.wait_for_quiescence(page, idle_ms=50, timeout=2000)
+    await task
+
+
+@pytest.mark.asyncio
+async def test_waits_for_requests_started_before_the_wait(strategy):
+    page = FakePage()
+    network = NetworkActivity()
+    network.attach(page)  # As _crawl_web does before page.goto
+    request = FakeRequest("xhr")
+    page.emit("request", request)
+    page.last_mutation -= 10  # DOM long settled by the time the wait starts
+
+    async def finish_later():
+        await asyncio.sleep(0.3)
+        page.emit("requestfinished", request)
+
+    start = time.monotonic()
+    task = asyncio.create_task(finish_later())
+    assert await strategy.smart_wait(page, "quiescent:50", timeout=5000, network=network)
+    await task
+    assert time.monotonic() - start >= 0.3
+
+    network.detach(page)
+    assert all(not handlers for handlers in page.listeners.values())
@@ -0,0 +1,124 @@
+import pytest
+
+from crawl4ai import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+class FakeRobots:
+    def __init__(self, crawl_delay=None, request_rate=None):
+        self._crawl_delay = crawl_delay
+        self._request_rate = request_rate
+
+    def crawl_delay(self, url, user_agent="*"):
+        return self._crawl_delay
+
+    def request_rate(self, url, user_agent="*"):
+        return self._request_rate
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("crawl4ai.async_dispatcher.time.time", clock.time)
+    monkeypatch.setattr("crawl4ai.async_dispatcher.asyncio.sleep", clock.sleep)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces(clock):
+    limiter = RateLimiter(requests_per_second=4, burst=3)
+    for _ in range(5):
+        await limiter.wait_if_needed("https://a.com/x")
+    assert clock.sleeps == [0.25, 0.25]
+
+    # Other domains have their own bucket
+    await limiter.wait_if_needed("https://b.com/x")
+    assert len(clock.sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_robots_directives_slow_the_bucket_down(clock):
+    limiter = RateLimiter(requests_per_second=10, burst=5, robots_parser=FakeRobots(request_rate=0.5))
+    for _ in range(3):
+        await limiter.wait_if_needed("https://a.com/x")
+    assert clock.sleeps == [2.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_crawl_delay_is_capped(clock):
+    limiter = RateLimiter(
+        base_delay=(0.0, 0.0), robots_parser=FakeRobots(crawl_delay=3600), max_crawl_delay=5
+    )
+    await limiter.wait_if_needed("https://a.com/x")
+    await limiter.wait_if_needed("https://a.com/y")
+    assert clock.sleeps == [5.0]
+
+    limiter.respect_robots = False
+    clock.now += 10
+    await limiter.wait_if_needed("https://a.com/z")
+    assert clock.sleeps == [5.0]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_response_backs_off_on_top_of_bucket(clock):
+    limiter = RateLimiter(requests_per_second=10, burst=10)
+    await limiter.wait_if_needed("https://a.com/x")
+    assert limiter.update_delay("https://a.com/x", 429)
+    backoff = limiter.domains["a.com"].current_delay
+    assert 0.15 <= backoff <= 0.25
+
+    await limiter.wait_if_needed("https://a.com/x")
+    assert clock.sleeps == [pytest.approx(backoff, abs=0.001)]
+
+    limiter.update_delay("https://a.com/x", 200)
+    assert limiter.domains["a.com"].current_delay < backoff
+
+
+@pytest.mark.asyncio
+async def test_robots_parser_can_be_passed_per_call(clock):
+    limiter = RateLimiter(base_delay=(0.0, 0.0))
+    robots = {"robots_parser": FakeRobots(crawl_delay=2), "robots_user_agent": "bot"}
+    await limiter.wait_if_needed("https://a.com/x", **robots)
+    await limiter.wait_if_needed("https://a.com/y", **robots)
+    assert clock.sleeps == [2]
+    assert limiter.robots_parser is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("check_robots_txt", [False, True])
+async def test_arun_many_uses_robots_only_when_checking(check_robots_txt):
+    from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, SemaphoreDispatcher
+    from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+    limiter = RateLimiter(base_delay=(0.0, 0.0))
+    calls = []
+    wait_if_needed = limiter.wait_if_needed
+
+    async def spy(url, **robots):
+        calls.append(robots)
+        await wait_if_needed(url, **robots)
+
+    limiter.wait_if_needed = spy
+    dispatcher = SemaphoreDispatcher(rate_limiter=limiter)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        await crawler.arun_many(
+            ["raw:<html><body>x</body></html>"],
+            config=CrawlerRunConfig(check_robots_txt=check_robots_txt),
+            dispatcher=dispatcher,
+        )
+    used = [c.get("robots_parser") is crawler.robots_parser for c in calls]
+    assert used == [check_robots_txt]
+    # The caller's limiter is left as it was
+    assert limiter.robots_parser is None
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, RedisQueueDispatcher
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+
+def _raw_urls(count):
+    return [f"raw:<html><body><h1>Page {i}</h1></body></html>" for i in range(count)]
+
+
+def _dispatcher(server, **kwargs):
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    kwargs.setdefault("poll_interval", 0.1)
+    return RedisQueueDispatcher(redis_client=client, job_id="test-job", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_workers_cooperate_on_one_job():
+    server = fakeredis.FakeServer()
+    urls = _raw_urls(8)
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    submitter = _dispatcher(server, max_session_permit=2, consumer_name="a")
+    helper = _dispatcher(server, max_session_permit=2, consumer_name="b")
+
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as c1, \
+            AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as c2:
+        own, other = await asyncio.gather(
+            c1.arun_many(urls, config=config, dispatcher=submitter),
+            c2.arun_many([], config=config, dispatcher=helper),
+        )
+
+    crawled = [r.url for r in own] + [r.url for r in other]
+    assert sorted(crawled) == sorted(urls)
+    assert all(r.success for r in own + other)
+    assert await submitter.is_complete()
+
+    results = [r async for r in submitter.read_results()]
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert all("Page" in r.markdown for r in results)
+
+
+@pytest.mark.asyncio
+async def test_unacknowledged_entries_are_redelivered_then_given_up():
+    server = fakeredis.FakeServer()
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    dispatcher = _dispatcher(server, visibility_timeout=0.2, max_deliveries=1)
+    urls = _raw_urls(2)
+    await dispatcher.enqueue(urls, config)
+
+    # A worker that claims an entry and dies without acknowledging it
+    ghost = _dispatcher(server, consumer_name="ghost")
+    claimed = await ghost._read_new(1)
+    assert len(claimed) == 1
+    await asyncio.sleep(0.3)
+
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        results = await crawler.arun_many([], config=config, dispatcher=dispatcher)
+
+    # The abandoned entry is reclaimed once, exceeds max_deliveries and fails
+    assert [r.url for r in results] == [urls[1]]
+    stored = {r.url: r async for r in dispatcher.read_results()}
+    assert stored[urls[1]].success
+    assert not stored[urls[0]].success
+    assert "deliveries" in stored[urls[0]].error_message
+
+
+@pytest.mark.asyncio
+async def test_deadline_is_rejected():
+    dispatcher = _dispatcher(fakeredis.FakeServer())
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        with pytest.raises(ValueError):
+            await crawler.arun_many(_raw_urls(1), config=CrawlerRunConfig(), dispatcher=dispatcher, deadline=5)
+
+
+def test_binary_fields_round_trip():
+    from crawl4ai.models import CrawlResult
+
+    raw = CrawlResult(url="a", html="", success=True, pdf=b"%PDF\x00", screenshot=b"\x89PNG\x00")
+    decoded = RedisQueueDispatcher._decode_result(RedisQueueDispatcher._encode_result(raw))
+    assert decoded.pdf == raw.pdf and decoded.screenshot == raw.screenshot
+
+    encoded = CrawlResult(url="a", html="", success=True, screenshot="aGVsbG8=")
+    assert RedisQueueDispatcher._decode_result(RedisQueueDispatcher._encode_result(encoded)).screenshot == "aGVsbG8="
+
+
+@pytest.mark.asyncio
+async def test_entry_finished_twice_counts_once():
+    from crawl4ai.models import CrawlResult
+
+    server = fakeredis.FakeServer()
+    dispatcher = _dispatcher(server)
+    await dispatcher.enqueue(_raw_urls(1), CrawlerRunConfig())
+    [(entry_id, fields)] = await dispatcher._read_new(1)
+    result = CrawlResult(url=fields["url"], html="", success=True)
+
+    await dispatcher._publish(entry_id, fields["task_id"], fields["url"], result)
+    await dispatcher._publish(entry_id, fields["task_id"], fields["url"], result)
+
+    assert int(await dispatcher.redis.get(dispatcher._key("done"))) == 1
+    assert len([r async for r in dispatcher.read_results()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_reclaim_scans_are_spaced_and_batched():
+    server = fakeredis.FakeServer()
+    dispatcher = _dispatcher(server, visibility_timeout=0.2, consumer_name="a")
+    await dispatcher.enqueue(_raw_urls(3), CrawlerRunConfig())
+    ghost = _dispatcher(server, consumer_name="ghost")
+    assert len(await ghost._read_new(3)) == 3
+    await asyncio.sleep(0.25)
+
+    calls = {"xautoclaim": 0, "xpending_range": 0}
+    redis = dispatcher.redis
+    for name in calls:
+        original = getattr(redis, name)
+
+        async def counted(*args, _name=name, _original=original, **kwargs):
+            calls[_name] += 1
+            return await _original(*args, **kwargs)
+
+        setattr(redis, name, counted)
+
+    assert len(await dispatcher._reclaim(10)) == 3
+    assert calls == {"xautoclaim": 1, "xpending_range": 1}
+
+    # The pending list was scanned completely; the next scan waits
+    assert await dispatcher._reclaim(10) == []
+    assert calls["xautoclaim"] == 1
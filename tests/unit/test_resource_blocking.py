@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai import BrowserConfig
+from crawl4ai.browser_manager import BrowserManager, ResourceBlocker
+
+
+def test_profiles_classify_by_type_extension_and_domain():
+    blocker = ResourceBlocker(["images", "documents", "trackers"], blocked_domains=["ads.example.org"])
+
+    assert blocker.should_block("https://site.com/a", "image")
+    assert blocker.should_block("https://site.com/report.PDF?x=1", "document")
+    assert blocker.should_block("https://www.google-analytics.com/collect", "xhr")
+    assert blocker.should_block("https://cdn.ads.example.org/x.js", "script")
+    assert not blocker.should_block("https://site.com/app.js", "script")
+    assert not blocker.should_block("https://example.org/", "document")
+
+
+def test_third_party_scripts_profile():
+    blocker = ResourceBlocker(["third_party_scripts"])
+    page = "https://www.shop.example.com/item"
+
+    assert blocker.should_block("https://cdn.other.net/lib.js", "script", page)
+    assert not blocker.should_block("https://static.example.com/app.js", "script", page)
+    assert not blocker.should_block("https://cdn.other.net/data.json", "fetch", page)
+
+
+def test_third_party_uses_registrable_domain():
+    blocker = ResourceBlocker(["third_party_scripts"])
+
+    assert not blocker.should_block("https://static.shop.co.uk/a.js", "script", "https://www.shop.co.uk/")
+    assert blocker.should_block("https://evil.co.uk/a.js", "script", "https://www.shop.co.uk/")
+    assert blocker.should_block("https://someone.github.io/a.js", "script", "https://me.github.io/")
+    assert not blocker.should_block("http://127.0.0.1:8000/a.js", "script", "http://127.0.0.1:9000/")
+
+
+def test_text_mode_blocks_by_extension_only():
+    text_mode = BrowserManager(BrowserConfig(text_mode=True)).resource_blocker
+    assert text_mode.should_block("https://site.com/logo.png", "image")
+    assert not text_mode.should_block("https://site.com/img?id=1", "image")
+
+    images = BrowserManager(BrowserConfig(block_resources=["images"])).resource_blocker
+    assert images.should_block("https://site.com/img?id=1", "image")
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        BrowserManager(BrowserConfig(block_resources=["images", "gifs"]))
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+@pytest.mark.asyncio
+async def test_text_mode_registers_a_single_route_handler():
+    manager = BrowserManager(BrowserConfig(text_mode=True, block_resources=["trackers"]))
+    context = FakeContext()
+
+    async def new_context(**kwargs):
+        return context
+
+    manager.browser = SimpleNamespace(new_context=new_context)
+    await manager.create_browser_context()
+
+    assert len(context.routes) == 1
+    pattern, handler = context.routes[0]
+    assert pattern == "**/*"
+
+    font, page = FakeRoute("https://site.com/f.woff2", "font"), FakeRoute("https://site.com/", "document")
+    await handler(font)
+    await handler(page)
+    assert font.outcome == "abort"
+    assert page.outcome == "fallback"
+
+
+@pytest.mark.asyncio
+async def test_no_route_without_blocking():
+    manager = BrowserManager(BrowserConfig())
+    context = FakeContext()
+
+    async def new_context(**kwargs):
+        return context
+
+    manager.browser = SimpleNamespace(new_context=new_context)
+    await manager.create_browser_context()
+    assert context.routes == []
@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import RateLimiter
+from crawl4ai.utils import RobotsParser
+
+ROBOTS = """User-agent: *
+Crawl-delay: 2
+Disallow: /private/
+"""
+
+
+@pytest_asyncio.fixture
+async def server():
+    hits = {"robots": 0}
+
+    async def robots(request):
+        hits["robots"] += 1
+        await asyncio.sleep(0.05)
+        return web.Response(text=ROBOTS)
+
+    app = web.Application()
+    app.router.add_get("/robots.txt", robots)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_and_parsed_rules_are_reused(server, tmp_path, monkeypatch):
+    base, hits = server
+    parser = RobotsParser(cache_dir=str(tmp_path))
+    parses = []
+    original = RobotsParser._parse
+    monkeypatch.setattr(RobotsParser, "_parse", staticmethod(lambda rules: parses.append(1) or original(rules)))
+
+    results = await asyncio.gather(
+        *(parser.can_fetch(f"{base}/page/{i}", "bot") for i in range(10)),
+        parser.can_fetch(f"{base}/private/x", "bot"),
+    )
+    assert results == [True] * 10 + [False]
+    assert hits["robots"] == 1
+    assert len(parses) == 1
+
+    # Another instance on the same cache shares the parsed rules
+    other = RobotsParser(cache_dir=str(tmp_path))
+    assert not await other.can_fetch(f"{base}/private/y", "bot")
+    assert hits["robots"] == 1 and len(parses) == 1
+    await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_rules_survive_in_sqlite(server, tmp_path):
+    base, hits = server
+    parser = RobotsParser(cache_dir=str(tmp_path))
+    await parser.can_fetch(f"{base}/a", "bot")
+    parser._rules.clear()  # Drop the in-memory copy
+
+    assert not await parser.can_fetch(f"{base}/private/a", "bot")
+    assert hits["robots"] == 1
+    await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_missing_robots_is_cached(tmp_path):
+    hits = []
+
+    async def not_found(request):
+        hits.append(1)
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_get("/robots.txt", not_found)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        parser = RobotsParser(cache_dir=str(tmp_path))
+        for _ in range(3):
+            assert await parser.can_fetch(f"http://127.0.0.1:{port}/x")
+        assert len(hits) == 1
+        await parser.close()
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_crawl_delay_feeds_rate_limiter(server, tmp_path, monkeypatch):
+    base, _ = server
+    parser = RobotsParser(cache_dir=str(tmp_path))
+    assert parser.crawl_delay(f"{base}/a") is None  # Not read yet
+    await parser.can_fetch(f"{base}/a", "bot")
+    assert parser.crawl_delay(f"{base}/a", "bot") == 2.0
+
+    limiter = RateLimiter(base_delay=(0.0, 0.0), robots_parser=parser, robots_user_agent="bot")
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("crawl4ai.async_dispatcher.asyncio.sleep", fake_sleep)
+    await limiter.wait_if_needed(f"{base}/a")
+    await limiter.wait_if_needed(f"{base}/b")
+    assert sleeps and sleeps[0] == pytest.approx(2.0, abs=0.1)
+    await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried(tmp_path, monkeypatch):
+    statuses = [503, 429, 200]
+
+    async def flaky(request):
+        status = statuses.pop(0)
+        return web.Response(status=status, text=ROBOTS if status == 200 else "")
+
+    app = web.Application()
+    app.router.add_get("/robots.txt", flaky)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(RobotsParser, "ERROR_TTL", 0)
+    try:
+        parser = RobotsParser(cache_dir=str(tmp_path))
+        # Temporary failures allow the URL but are neither stored nor trusted for long
+        assert await parser.can_fetch(f"http://127.0.0.1:{port}/private/x")
+        assert parser._get_cached_rules(f"127.0.0.1:{port}")[0] is None
+        assert await parser.can_fetch(f"http://127.0.0.1:{port}/private/x")
+        assert not await parser.can_fetch(f"http://127.0.0.1:{port}/private/x")
+        assert statuses == []
+        await parser.close()
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_session_for_other_users(server, tmp_path):
+    base, _ = server
+    first = RobotsParser(cache_dir=str(tmp_path / "a"))
+    second = RobotsParser(cache_dir=str(tmp_path / "b"))
+    await first.can_fetch(f"{base}/a", "bot")
+    await second.can_fetch(f"{base}/a", "bot")
+    session = RobotsParser._sessions[asyncio.get_running_loop()]
+
+    await first.close()
+    assert not session.closed
+    assert not await second.can_fetch(f"{base}/private/b", "bot")
+    await second.close()
+    assert session.closed
+
+
+def test_instances_share_one_connection_per_database(tmp_path):
+    parsers = [RobotsParser(cache_dir=str(tmp_path)) for _ in range(3)]
+    assert len({id(p._conn) for p in parsers}) == 1
+    assert RobotsParser(cache_dir=str(tmp_path / "other"))._conn is not parsers[0]._conn
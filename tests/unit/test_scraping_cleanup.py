@@ -0,0 +1,61 @@
+from lxml import html as lhtml
+
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+
+PAGE = """
+<html><head><title>Cleanup</title><meta name="description" content="A page"></head>
+<body>
+  <!-- a comment -->
+  <script>var x = 1;</script><style>p {}</style><noscript>enable js</noscript>
+  <nav><a href="/nav">Navigation</a></nav>
+  <div id="drop-me"><p>Dropped by XPath entry</p></div>
+  <form><input name="q"></form>
+  <div class="card" onclick="go()" data-id="7">
+    <p style="color:red">Main content paragraph with words</p>
+    <img src="data:image/png;base64,AAAA" alt="inline">
+    <a href="https://other.example/x"><img src="https://other.example/in-link.png" width="300" height="300" alt="big"></a>
+    <span></span>
+  </div>
+</body></html>
+"""
+
+
+def _scrap(**kwargs):
+    return LXMLWebScrapingStrategy()._scrap("https://example.com/page", PAGE, **kwargs)
+
+
+def test_single_pass_cleanup_matches_options():
+    result = _scrap(
+        excluded_tags=["nav", "div[@id='drop-me']"],
+        remove_forms=True,
+        remove_comments=True,
+    )
+    html = result["cleaned_html"]
+
+    for gone in ("var x", "p {}", "enable js", "Navigation", "Dropped by XPath", "<form", "a comment", "<span>"):
+        assert gone not in html
+    assert "Main content paragraph" in html
+    assert 'onclick' not in html and 'style=' not in html and 'data-id' not in html
+    assert "base64" not in html
+    assert result["metadata"]["description"] == "A page"
+
+
+def test_keep_data_attributes_and_only_text():
+    html = _scrap(keep_data_attributes=True, only_text=True)["cleaned_html"]
+    assert 'data-id="7"' in html
+    assert "onclick" not in html
+
+
+def test_media_inside_dropped_links_is_not_collected():
+    kept = _scrap()
+    assert [img["src"] for img in kept["media"]["images"]] == ["https://other.example/in-link.png"]
+
+    dropped = _scrap(exclude_external_links=True)
+    assert dropped["media"]["images"] == []
+    assert dropped["links"]["external"] == []
+
+
+def test_prune_tree_skips_removed_subtrees():
+    root = lhtml.fromstring("<div><section><p>a</p><!-- c --></section><p>b<!-- d --></p></div>")
+    LXMLWebScrapingStrategy().prune_tree(root, {"section"}, drop_comments=True)
+    assert lhtml.tostring(root) == b"<div><p>b</p></div>"
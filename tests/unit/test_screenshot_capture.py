@@ -0,0 +1,150 @@
+import asyncio
+import base64
+import time
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+
+
+class FakePage:
+    """Renders a solid viewport-sized image for every screenshot."""
+
+    def __init__(self, width=200, height=100):
+        self.viewport_size = {"width": width, "height": height}
+        self.shots = []
+
+    async def set_viewport_size(self, size):
+        self.viewport_size = dict(size)
+
+    async def evaluate(self, expression, *args):
+        return None
+
+    async def screenshot(self, **options):
+        self.shots.append(options)
+        size = self.viewport_size
+        if "clip" in options:
+            size = options["clip"]
+        buffered = BytesIO()
+        image_type = "JPEG" if options.get("type") == "jpeg" else "PNG"
+        Image.new("RGB", (size["width"], size["height"]), "red").save(buffered, format=image_type)
+        return buffered.getvalue()
+
+
+@pytest.fixture
+def strategy():
+    return AsyncPlaywrightCrawlerStrategy()
+
+
+def _decode(data):
+    return Image.open(BytesIO(base64.b64decode(data)))
+
+
+@pytest.mark.asyncio
+async def test_mhtml_overlaps_screenshot_then_pdf(strategy, monkeypatch):
+    calls = []
+
+    async def slow(name, result):
+        calls.append(("start", name))
+        await asyncio.sleep(0.2)
+        calls.append(("end", name))
+        return result
+
+    monkeypatch.setattr(strategy, "export_pdf", lambda page: slow("pdf", b"%PDF"))
+    monkeypatch.setattr(strategy, "capture_mhtml", lambda page: slow("mhtml", "mhtml"))
+    monkeypatch.setattr(strategy, "take_screenshot", lambda page, **kw: slow("shot", "shot"))
+
+    config = CrawlerRunConfig(pdf=True, capture_mhtml=True, screenshot=True, screenshot_full_page=False)
+    start = time.monotonic()
+    result = await strategy._capture_artifacts(FakePage(), config)
+
+    assert result == (b"%PDF", "mhtml", "shot")
+    # The PDF's print emulation must not overlap the screenshot
+    assert calls.index(("end", "shot")) < calls.index(("start", "pdf"))
+    assert time.monotonic() - start < 0.55  # Fully sequential would be 0.6s
+
+
+@pytest.mark.asyncio
+async def test_scroller_stitches_in_requested_format_and_height(strategy, monkeypatch):
+    page = FakePage(width=200, height=100)
+
+    async def dimensions(page):
+        return {"width": 200, "height": 1000}
+
+    monkeypatch.setattr(strategy, "get_page_dimensions", dimensions)
+    data = await strategy.take_screenshot(
+        page,
+        need_scroll=True,
+        screenshot_height_threshold=100,
+        screenshot_format="webp",
+        screenshot_quality=50,
+        screenshot_max_height=350,
+    )
+
+    image = _decode(data)
+    assert image.format == "WEBP"
+    assert image.size == (200, 350)
+    assert all(shot.get("type") == "jpeg" for shot in page.shots)
+
+
+@pytest.mark.asyncio
+async def test_naive_screenshot_format_and_clip(strategy):
+    page = FakePage(width=200, height=100)
+
+    jpeg = _decode(await strategy.take_screenshot_naive(page, screenshot_format="jpeg", screenshot_max_height=40))
+    assert jpeg.format == "JPEG" and jpeg.size == (200, 40)
+
+    png = _decode(await strategy.take_screenshot_naive(page))
+    assert png.format == "PNG" and png.size == (200, 100)
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncPlaywrightCrawlerStrategy._normalize_image_format("gif")
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_and_viewport_only(strategy, monkeypatch):
+    async def fail_if_checked(page):
+        raise AssertionError("viewport-only screenshots never need scrolling")
+
+    monkeypatch.setattr(strategy, "page_need_scroll", fail_if_checked)
+    page = FakePage(width=400, height=300)
+    config = CrawlerRunConfig(
+        screenshot=True, screenshot_full_page=False, screenshot_max_width=100, screenshot_format="jpeg"
+    )
+
+    _, _, data = await strategy._capture_artifacts(page, config)
+
+    image = _decode(data)
+    assert image.format == "JPEG"
+    assert image.size == (100, 75)
+
+
+@pytest.mark.asyncio
+async def test_screenshot_output_modes(tmp_path):
+    from crawl4ai import AsyncWebCrawler
+    from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+    buffered = BytesIO()
+    Image.new("RGB", (4, 4), "blue").save(buffered, format="PNG")
+    png = buffered.getvalue()
+    encoded = base64.b64encode(png).decode()
+    crawler = AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy())
+
+    assert await crawler._deliver_screenshot(encoded, CrawlerRunConfig(), "https://a.com") == encoded
+    assert await crawler._deliver_screenshot(
+        encoded, CrawlerRunConfig(screenshot_output="bytes"), "https://a.com"
+    ) == png
+
+    path = await crawler._deliver_screenshot(
+        encoded,
+        CrawlerRunConfig(screenshot_output="file", screenshot_path=str(tmp_path)),
+        "https://a.com",
+    )
+    assert path.endswith(".png") and path.startswith(str(tmp_path))
+    with open(path, "rb") as f:
+        assert f.read() == png
@@ -0,0 +1,69 @@
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+
+PAGE = """
+<html><head><title>Product</title><meta name="description" content="A product page">
+<base href="https://shop.example/catalog/"></head>
+<body>
+  <header><a href="/home">Home</a><img src="/hero.jpg" width="400" height="200" alt="banner"></header>
+  <main id="product" class="layout">
+    <h1 data-sku="1">Widget</h1>
+    <section><p>The widget is a very useful item for everyday tasks.</p><script>track()</script></section>
+    <a href="reviews">Reviews</a>
+  </main>
+  <aside><a href="/related">Related</a></aside>
+</body></html>
+"""
+
+
+def _scrap(**kwargs):
+    return LXMLWebScrapingStrategy()._scrap("https://shop.example/p/1", PAGE, **kwargs)
+
+
+def test_crop_keeps_head_metadata_and_cleans_only_the_target():
+    result = _scrap(target_elements=["main", "main h1"], crop_to_target=True)
+    html = result["cleaned_html"]
+
+    assert result["metadata"]["title"] == "Product"
+    assert result["metadata"]["description"] == "A product page"
+    assert html.count("Widget") == 1  # Nested match kept once, inside <main>
+    assert "useful item" in html
+    assert "track()" not in html and "data-sku" not in html and 'class="layout"' not in html
+    assert "Home" not in html and "Related" not in html
+
+    # Links and media still come from the whole page by default
+    hrefs = {link["href"] for link in result["links"]["internal"]}
+    assert {"https://shop.example/home", "https://shop.example/related"} <= hrefs
+    assert result["media"]["images"]
+
+
+def test_scoped_crop_collects_links_only_inside_the_target():
+    result = _scrap(css_selector="#product", crop_to_target=True, scope_links_to_target=True)
+
+    hrefs = [link["href"] for link in result["links"]["internal"]]
+    assert hrefs == ["https://shop.example/catalog/reviews"]  # <base> from the head still applies
+    assert result["media"]["images"] == []
+    assert "useful item" in result["cleaned_html"]
+
+
+def test_crop_is_opt_in_and_round_trips_through_config():
+    default = _scrap(target_elements=["main"])
+    assert "Home" not in default["cleaned_html"]
+    assert "https://shop.example/home" in {l["href"] for l in default["links"]["internal"]}
+
+    config = CrawlerRunConfig.from_kwargs(
+        CrawlerRunConfig(crop_to_target=True, scope_links_to_target=True).to_dict()
+    )
+    assert config.crop_to_target and config.scope_links_to_target
+    assert not CrawlerRunConfig().crop_to_target
+
+
+def test_css_selector_already_applied_by_browser_is_not_reapplied():
+    # What AsyncPlaywrightCrawlerStrategy returns for css_selector="body > main"
+    selected = "<div class='crawl4ai-result'>\n<main><p>The widget is a very useful item.</p></main>\n</div>"
+    scraper = LXMLWebScrapingStrategy()
+
+    cropped = scraper.scrap("https://shop.example/p/1", selected, css_selector="body > main", crop_to_target=True)
+    plain = scraper.scrap("https://shop.example/p/1", selected, css_selector="body > main")
+    assert "useful item" in cropped.cleaned_html
+    assert cropped.cleaned_html == plain.cleaned_html